@@ -1 +1,4 @@
-from .main import *
\ No newline at end of file
+from .cache import DirectoryCache, SQLiteCache
+from .main import NoDataWarning, Statbotics
+
+__all__ = ["DirectoryCache", "NoDataWarning", "SQLiteCache", "Statbotics"]
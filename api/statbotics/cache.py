@@ -0,0 +1,279 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+from cachecontrol.cache import BaseCache  # type: ignore
+from cachecontrol.heuristics import BaseHeuristic  # type: ignore
+
+# Event and match keys start with the year, e.g. 2019ncwak or 2019ncwak_qm1
+key_re = re.compile(r"^(\d{4})[a-z]")
+
+
+def get_expires(expires: Optional[Union[int, datetime]]) -> Optional[float]:
+    # CacheControl passes seconds from now or a UTC datetime
+    if expires is None:
+        return None
+    if isinstance(expires, datetime):
+        return expires.timestamp()
+    return time.time() + expires
+
+
+def get_url_year(url: str) -> Optional[int]:
+    """
+    Year a query is limited to, or None if it spans years (ex: /team/254)\n
+    """
+
+    parts = urlsplit(url)
+    query = parse_qs(parts.query)
+    if "year" in query and query["year"][0].isdigit():
+        return int(query["year"][0])
+    for name in ["event", "match"]:
+        match = key_re.match(query.get(name, [""])[0])
+        if match is not None:
+            return int(match.group(1))
+
+    segments = [x for x in parts.path.split("/") if x != ""]
+    for i, segment in enumerate(segments):
+        match = key_re.match(segment)
+        if match is not None:
+            return int(match.group(1))
+        rest = segments[i + 1 :]
+        if segment == "year" and len(rest) > 0 and rest[0].isdigit():
+            return int(rest[0])  # /year/2019 and /team_years/year/2019/...
+        if segment == "team_year" and len(rest) == 2 and rest[1].isdigit():
+            return int(rest[1])  # /team_year/254/2019
+    return None
+
+
+class ClosedSeasonHeuristic(BaseHeuristic):
+    """
+    Caches responses about a closed season (year < current year) for a long TTL,
+    unless the server sets its own caching headers. Other responses are only
+    reused after revalidating their ETag or Last-Modified with the server.\n
+    """
+
+    def __init__(self, ttl: timedelta, current_year: Optional[int] = None):
+        self.ttl = ttl
+        self.current_year = current_year
+
+    def update_headers(self, response: Any) -> Dict[str, str]:
+        if "cache-control" in response.headers or "expires" in response.headers:
+            return {}
+
+        year = get_url_year(response.geturl() or "")
+        current_year = self.current_year or date.today().year
+        if year is None or year >= current_year:
+            return {}
+        return {"cache-control": "max-age=" + str(int(self.ttl.total_seconds()))}
+
+    def warning(self, response: Any) -> Optional[str]:
+        return None
+
+
+class SQLiteCache(BaseCache):
+    """
+    Persistent response cache in a single SQLite file\n
+    :param path: File path, created if missing\n
+    :param max_bytes: Evicts expired, then least recently used responses above this size. Default is 256 MB\n
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 2**20):
+        self.path = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+
+        # Shared by the threads of bulk queries
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, "
+                "value BLOB, size INTEGER, expires REAL, accessed REAL)"
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+            )
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self.lock, self.conn:
+            row = self.conn.execute(
+                "SELECT value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+        return bytes(row[0])
+
+    def set(
+        self, key: str, value: bytes, expires: Optional[Union[int, datetime]] = None
+    ) -> None:
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value), get_expires(expires), time.time()),
+            )
+            self._evict(self.max_bytes)
+
+    def delete(self, key: str) -> None:
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def size(self) -> int:
+        """
+        Total size of the cached responses in bytes\n
+        """
+
+        with self.lock:
+            row = self.conn.execute("SELECT SUM(size) FROM responses").fetchone()
+        return row[0] or 0
+
+    def evict(self, max_bytes: Optional[int] = None) -> None:
+        """
+        Evicts expired, then least recently used responses down to max_bytes\n
+        :param max_bytes: Target size. Default is the cache's max_bytes\n
+        """
+
+        with self.lock, self.conn:
+            self._evict(self.max_bytes if max_bytes is None else max_bytes)
+
+    def clear(self) -> None:
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+    def _evict(self, max_bytes: int) -> None:
+        self.conn.execute(
+            "DELETE FROM responses WHERE expires IS NOT NULL AND expires < ?",
+            (time.time(),),
+        )
+        total = self.conn.execute("SELECT SUM(size) FROM responses").fetchone()[0]
+        if total is None or total <= max_bytes:
+            return
+
+        rows = self.conn.execute("SELECT key, size FROM responses ORDER BY accessed")
+        keys: List[Tuple[str]] = []
+        for key, size in rows:
+            if total <= max_bytes:
+                break
+            keys.append((key,))
+            total -= size
+        self.conn.executemany("DELETE FROM responses WHERE key = ?", keys)
+
+
+class DirectoryCache(BaseCache):
+    """
+    Persistent response cache with one file per response in a directory\n
+    :param path: Directory path, created if missing\n
+    :param max_bytes: Evicts expired, then least recently used responses above this size. Default is 256 MB\n
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 2**20):
+        self.path = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.total: Optional[int] = None  # running size, recounted on eviction
+        os.makedirs(self.path, exist_ok=True)
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.path, hashlib.sha256(key.encode()).hexdigest())
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as f:
+                value = f.read()
+            os.utime(path)  # modified time orders least recently used
+        except OSError:
+            return None
+        return value
+
+    def set(
+        self, key: str, value: bytes, expires: Optional[Union[int, datetime]] = None
+    ) -> None:
+        # Written aside and renamed so readers never see a partial response
+        path = self._get_path(key)
+        temp_path = path + "." + str(threading.get_ident()) + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(value)
+        os.replace(temp_path, path)
+
+        timestamp = get_expires(expires)
+        if timestamp is not None:
+            with open(path + ".expires", "w") as f:
+                f.write(str(timestamp))
+        elif os.path.exists(path + ".expires"):
+            os.remove(path + ".expires")
+
+        with self.lock:
+            if self.total is not None:
+                self.total += len(value)
+        if self.total is None or self.total > self.max_bytes:
+            self.evict()
+
+    def delete(self, key: str) -> None:
+        self._remove(self._get_path(key))
+
+    def _get_entries(self) -> List[Tuple[float, str, int]]:
+        # (accessed, path, size) of each response, oldest first
+        entries: List[Tuple[float, str, int]] = []
+        for entry in os.scandir(self.path):
+            if entry.is_file() and "." not in entry.name:
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.path, stat.st_size))
+        return sorted(entries)
+
+    def size(self) -> int:
+        """
+        Total size of the cached responses in bytes\n
+        """
+
+        return sum(size for _, _, size in self._get_entries())
+
+    def evict(self, max_bytes: Optional[int] = None) -> None:
+        """
+        Evicts expired, then least recently used responses down to max_bytes\n
+        :param max_bytes: Target size. Default is the cache's max_bytes\n
+        """
+
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        with self.lock:
+            entries = self._get_entries()
+            total = sum(size for _, _, size in entries)
+            now = time.time()
+            for _, path, size in entries:
+                try:
+                    with open(path + ".expires") as f:
+                        expired = float(f.read()) < now
+                except (OSError, ValueError):
+                    expired = False
+                if expired:
+                    self._remove(path)
+                    total -= size
+
+            for _, path, size in entries:
+                if total <= max_bytes:
+                    break
+                if os.path.exists(path):
+                    self._remove(path)
+                    total -= size
+            self.total = total
+
+    def clear(self) -> None:
+        self.evict(0)
+
+    def _remove(self, path: str) -> None:
+        for name in [path, path + ".expires"]:
+            try:
+                os.remove(name)
+            except OSError:
+                pass
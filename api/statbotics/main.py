@@ -1,8 +1,14 @@
-from typing import Any, Dict, List, Optional, Union
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, Union
 
 import requests
-from cachecontrol import CacheControl  # type: ignore
+from cachecontrol.adapter import CacheControlAdapter  # type: ignore
+from cachecontrol.cache import BaseCache  # type: ignore
 
+from .cache import ClosedSeasonHeuristic
 from .validate import check_type, get_locations, get_type
 from .constants import (
     event_metrics,
@@ -14,16 +20,52 @@ from .constants import (
     year_metrics,
 )
 
+T = TypeVar("T")
+
+
+class NoDataWarning(UserWarning):
+    """
+    Raised when a valid query returns no data
+    """
+
 
 class Statbotics:
     """
     Main Object for interfacing with the Statbotics API
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: int = 8,
+        retries: int = 2,
+        backoff: float = 0.5,
+        cache: Optional[BaseCache] = None,
+        closed_ttl: timedelta = timedelta(days=30),
+    ):
+        """
+        :param max_workers: Maximum concurrent requests for bulk queries. Default is 8\n
+        :param retries: Retries for failed requests. Default is 2\n
+        :param backoff: Seconds before the first retry, doubling after each. Default is 0.5\n
+        :param cache: Persistent response cache, ex: SQLiteCache("statbotics.db") or DirectoryCache("statbotics_cache"). Default is in memory\n
+        :param closed_ttl: How long responses about past seasons are reused without asking the server. Default is 30 days\n
+        """
+
         self.BASE_URL = "https://api.statbotics.io/v2"
         # self.BASE_URL = "http://localhost:8000/v2"
-        self.session = CacheControl(requests.Session())
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.cache = cache
+
+        # One cached connection pool, shared by the threads of bulk queries
+        self.session = requests.Session()
+        adapter = CacheControlAdapter(
+            cache,
+            heuristic=ClosedSeasonHeuristic(closed_ttl),
+            pool_maxsize=max_workers,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def _filter_singular(
         self, data: Dict[str, Any], fields: List[str]
@@ -49,38 +91,112 @@ class Statbotics:
 
         return [{field: entry[field] for field in fields} for entry in data]
 
-    def _get_singular(
-        self, url: str, fields: List[str], retry: int = 0
-    ) -> Dict[str, Any]:
-        resp = self.session.get(self.BASE_URL + url)
-        if resp.status_code != 200:
-            if retry < 2:
-                return self._get_singular(url, fields, retry=retry + 1)
-            raise UserWarning("Invalid query: " + url)
-
-        data: Dict[str, Any] = resp.json()
+    def _add_fields(self, url: str, fields: List[str]) -> str:
+        # The server only serializes these, filtered again here for older servers
+        if fields == ["all"]:
+            return url
+        return url + ("&" if "?" in url else "?") + "fields=" + ",".join(fields)
+
+    def _get_delay(self, resp: Optional[requests.Response], retry: int) -> float:
+        # Exponential backoff with jitter, or as long as the server asks
+        if resp is not None and resp.headers.get("Retry-After", "").isdigit():
+            return float(resp.headers["Retry-After"])
+        return self.backoff * (2**retry) * (0.5 + random.random())
+
+    def _get(self, url: str) -> Any:
+        resp: Optional[requests.Response] = None
+        for retry in range(self.retries + 1):
+            if retry > 0:
+                time.sleep(self._get_delay(resp, retry - 1))
+
+            try:
+                resp = self.session.get(self.BASE_URL + url)
+            except (requests.ConnectionError, requests.Timeout):
+                if retry == self.retries:
+                    raise
+                resp = None
+                continue
+
+            if resp.status_code == 200:
+                return resp.json()
+            # Other client errors will not succeed on retry
+            if 400 <= resp.status_code < 500 and resp.status_code != 429:
+                break
+
+        raise UserWarning("Invalid query: " + url)
+
+    def _get_singular(self, url: str, fields: List[str]) -> Dict[str, Any]:
+        data: Dict[str, Any] = self._get(self._add_fields(url, fields))
+        if data == {} and fields != ["all"]:
+            # Only unknown fields also project a row to {}, asks for the full
+            # row so they raise ValueError rather than NoDataWarning
+            data = self._get(url)
 
         if data == {}:
-            raise UserWarning("Invalid inputs, no data recieved for " + url)
+            raise NoDataWarning("Invalid inputs, no data recieved for " + url)
 
         return self._filter_singular(data, fields)
 
-    def _get_plural(
-        self, url: str, fields: List[str], retry: int = 0
-    ) -> List[Dict[str, Any]]:
-        resp = self.session.get(self.BASE_URL + url)
-        if resp.status_code != 200:
-            if retry < 2:
-                return self._get_plural(url, fields, retry=retry + 1)
-            raise UserWarning("Invalid query: " + url)
-
-        data: List[Dict[str, Any]] = resp.json()
+    def _get_plural(self, url: str, fields: List[str]) -> List[Dict[str, Any]]:
+        data: List[Dict[str, Any]] = self._get(self._add_fields(url, fields))
 
         if data == []:
-            raise UserWarning("Invalid inputs, no data recieved for " + url)
+            raise NoDataWarning("Invalid inputs, no data recieved for " + url)
 
         return self._filter_plural(data, fields)
 
+    def paginate(
+        self,
+        func: Callable[..., List[Dict[str, Any]]],
+        page_size: int = 1000,
+        **kwargs: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Function to iterate over every result of a query, one page at a time\n
+        :param func: Query for multiple objects, ex: sb.get_team_years\n
+        :param page_size: Results per request. Max 1,000\n
+        :param kwargs: Arguments to func, ex: year=2023. Offset sets the first result\n
+        :return: An iterator of dictionaries, as returned by func\n
+        """
+
+        check_type(page_size, "int", "page_size")
+        if page_size > 1000:
+            raise ValueError("Please reduce 'page_size', max is 1,000.")
+
+        start = kwargs.pop("offset", 0)
+        offset = start
+        while True:
+            try:
+                page = func(limit=page_size, offset=offset, **kwargs)
+            except NoDataWarning:
+                # The last page was full and the results ran out
+                if offset == start:
+                    raise
+                return
+
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    def get_bulk(
+        self,
+        func: Callable[..., T],
+        calls: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+    ) -> List[T]:
+        """
+        Function to run many queries concurrently\n
+        :param func: Any query, ex: sb.get_team_year\n
+        :param calls: List of arguments to func, one dictionary per query\n
+        :param max_workers: Maximum concurrent requests. Default is set on Statbotics()\n
+        :return: A list of results, in the same order as calls\n
+        """
+
+        check_type(calls, "list", "calls")
+        with ThreadPoolExecutor(max_workers or self.max_workers) as executor:
+            return list(executor.map(lambda kwargs: func(**kwargs), calls))
+
     def get_team(self, team: int, fields: List[str] = ["all"]) -> Dict[str, Any]:
         """
         Function to retrieve information on an individual team\n
@@ -263,6 +379,60 @@ class Statbotics:
 
         return self._get_plural(url, fields)
 
+    def get_team_years_bulk(
+        self,
+        teams: List[int],
+        year: int,
+        fields: List[str] = ["all"],
+        max_workers: Optional[int] = None,
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Function to retrieve information for many teams' performance in a specific year\n
+        :param teams: List of team numbers\n
+        :param year: Year, integer\n
+        :param fields: List of fields to return. The default is ["all"]\n
+        :param max_workers: Maximum concurrent requests. Default is set on Statbotics()\n
+        :return: a dictionary from team number to a dictionary with the team, year, and EPA statistics. Teams without data for the year are left out.\n
+        """
+
+        check_type(teams, "list", "teams")
+        check_type(year, "int", "year")
+        check_type(fields, "list", "fields")
+
+        out: Dict[int, Dict[str, Any]] = {}
+        workers = max_workers or self.max_workers
+        if len(teams) <= workers:
+            # One concurrent round of single team requests
+            def get_team_year(team: int) -> Optional[Dict[str, Any]]:
+                try:
+                    return self.get_team_year(team, year, fields)
+                except UserWarning:
+                    return None
+
+            with ThreadPoolExecutor(workers) as executor:
+                for team, data in zip(teams, executor.map(get_team_year, teams)):
+                    if data is not None:
+                        out[team] = data
+            return out
+
+        # Otherwise a few pages of the whole season beat a request per team
+        query_fields = fields
+        if fields != ["all"] and "team" not in fields:
+            query_fields = fields + ["team"]
+
+        wanted = set(teams)
+        found: Dict[int, Dict[str, Any]] = {}
+        for team_year in self.paginate(
+            self.get_team_years, year=year, fields=query_fields
+        ):
+            if team_year["team"] in wanted:
+                found[team_year["team"]] = team_year
+
+        for team in teams:
+            if team in found:
+                out[team] = self._filter_singular(found[team], fields)
+        return out
+
     def get_event(self, event: str, fields: List[str] = ["all"]) -> Dict[str, Any]:
         """
         Function to retrieve information for a specific event\n
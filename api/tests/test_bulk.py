@@ -0,0 +1,38 @@
+import unittest
+import warnings
+
+from statbotics import main
+
+
+class TestBulk(unittest.TestCase):
+    sb = main.Statbotics()
+
+    def setUp(self):
+        warnings.simplefilter("ignore", ResourceWarning)
+
+    def tearDown(self):
+        warnings.simplefilter("default", ResourceWarning)
+
+    def test_paginate(self):
+        years = list(self.sb.paginate(self.sb.get_years, page_size=5))
+        self.assertEqual(len(years), len(set(x["year"] for x in years)))
+        self.assertGreater(len(years), 20)
+
+    def test_paginate_invalid(self):
+        with self.assertRaises(ValueError):
+            list(self.sb.paginate(self.sb.get_years, page_size=5000))
+
+    def test_get_bulk(self):
+        teams = self.sb.get_bulk(self.sb.get_team, [{"team": 254}, {"team": 5511}])
+        self.assertEqual([x["team"] for x in teams], [254, 5511])
+
+    def test_get_team_years_bulk(self):
+        a = self.sb.get_team_years_bulk([254, 5511, 2], 2023, fields=["epa_end"])
+        self.assertEqual(list(a.keys()), [254, 5511])
+        self.assertEqual(len(a[254].values()), 1)
+
+        teams = list(range(1, 1000))
+        b = self.sb.get_team_years_bulk(teams, 2023, fields=["team", "epa_end"])
+        self.assertIn(254, b)
+        self.assertEqual(b[254]["team"], 254)
+        self.assertEqual(b[254]["epa_end"], a[254]["epa_end"])
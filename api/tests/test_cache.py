@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+
+from statbotics.cache import DirectoryCache, SQLiteCache, get_url_year
+
+
+class TestCache(unittest.TestCase):
+    def test_get_url_year(self):
+        self.assertEqual(get_url_year("/v2/team_year/254/2019"), 2019)
+        self.assertEqual(get_url_year("/v2/team_years?limit=10&year=2018"), 2018)
+        self.assertEqual(get_url_year("/v2/match/2019cur_qm1"), 2019)
+        self.assertEqual(get_url_year("/v2/team_years/year/2017/state/nc"), 2017)
+        self.assertIsNone(get_url_year("/v2/team/2019"))
+        self.assertIsNone(get_url_year("/v2/team_years/team/254"))
+
+    def check_cache(self, cache):
+        cache.set("a", b"x" * 40)
+        cache.set("b", b"y" * 40)
+        self.assertEqual(cache.get("a"), b"x" * 40)
+
+        # b is least recently used
+        cache.set("c", b"z" * 40)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), b"x" * 40)
+        self.assertLessEqual(cache.size(), 100)
+
+        cache.set("d", b"w", expires=-1)
+        cache.evict()
+        self.assertIsNone(cache.get("d"))
+
+        cache.delete("a")
+        self.assertIsNone(cache.get("a"))
+        cache.clear()
+        self.assertEqual(cache.size(), 0)
+
+    def test_sqlite_cache(self):
+        path = os.path.join(tempfile.mkdtemp(), "cache.db")
+        self.check_cache(SQLiteCache(path, max_bytes=100))
+
+    def test_directory_cache(self):
+        path = os.path.join(tempfile.mkdtemp(), "cache")
+        self.check_cache(DirectoryCache(path, max_bytes=100))
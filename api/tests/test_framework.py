@@ -14,3 +14,22 @@ class TestFramework(unittest.TestCase):
     def test_create_statbotics(self):
         sb = main.Statbotics()
         return sb
+
+    def test_get_singular_fields_invalid(self):
+        # Server side projection, unknown fields are left out
+        rows = {"/team/254": {"team": 254, "wins": 10}}
+
+        def get(url):
+            path, _, fields = url.partition("?fields=")
+            row = rows.get(path, {})
+            if fields == "":
+                return row
+            return {k: row[k] for k in fields.split(",") if k in row}
+
+        sb = main.Statbotics()
+        sb._get = get  # type: ignore
+        self.assertEqual(sb.get_team(254, fields=["wins"]), {"wins": 10})
+        with self.assertRaises(ValueError):
+            sb.get_team(254, fields=["win"])
+        with self.assertRaises(main.NoDataWarning):
+            sb.get_team(2, fields=["win"])
@@ -25,6 +25,7 @@ from src.data.router import (
 )
 from src.site.router import router as site_router
 from src.site.v2.router import router as site_v2_router
+from src.utils.etag import etag_middleware
 
 # from src.utils.utils import is_uuid
 
@@ -59,7 +60,7 @@ async def get_api_key(request: Request, api_key_header: str = Depends(api_key_he
 
 app = FastAPI(
     title="Statbotics REST API",
-    description="The REST API for Statbotics. Please be nice to our servers! If you are looking to do large-scale data science projects, use the CSV exports on the GitHub repo.",
+    description="The REST API for Statbotics. Please be nice to our servers! If you are looking to do large-scale data science projects, download the per-year Arrow exports from /v3/exports.",
     version="3.0.0",
     # dependencies=[Security(get_api_key)],
     swagger_ui_parameters={"persistAuthorization": True},
@@ -72,6 +73,9 @@ origins = [
     "https://www.statbotics.io",
 ]
 
+# Inside CORS, so 304 responses still get CORS headers
+app.middleware("http")(etag_middleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
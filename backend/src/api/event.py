@@ -6,8 +6,11 @@ from fastapi import APIRouter, Response
 from src.api.query import (
     ascending_query,
     country_query,
+    cursor_query,
     district_query,
     event_type_query,
+    fields_query,
+    get_fields,
     limit_query,
     metric_query,
     offseason_query,
@@ -16,8 +19,10 @@ from src.api.query import (
     week_query,
     year_query,
 )
+from src.db.cursor import get_next_cursor
 from src.db.models import Event
-from src.db.read import get_event, get_events
+from src.db.models.event import EventORM
+from src.db.read.aio import get_event, get_events
 from src.utils.alru_cache import alru_cache
 from src.utils.decorators import (
     async_fail_gracefully_plural,
@@ -37,7 +42,7 @@ async def get_event_cached(
     event: str,
     no_cache: bool = False,
 ) -> Tuple[bool, Optional[Event]]:
-    return (True, get_event(event_id=event))
+    return (True, await get_event(event_id=event))
 
 
 @alru_cache(ttl=timedelta(minutes=1))
@@ -53,6 +58,8 @@ async def get_events_cached(
     ascending: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[Tuple[str, ...]] = None,
     site: bool = False,
     no_cache: bool = False,
 ) -> Tuple[bool, List[Event]]:
@@ -61,7 +68,7 @@ async def get_events_cached(
 
     return (
         True,
-        get_events(
+        await get_events(
             year=year,
             country=country,
             state=state,
@@ -73,6 +80,8 @@ async def get_events_cached(
             ascending=ascending,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            fields=fields,
         ),
     )
 
@@ -83,18 +92,23 @@ async def get_events_cached(
     description="Returns a single Event object. Requires an event key, e.g. `2019ncwak`.",
 )
 @async_fail_gracefully_singular
-async def read_event(response: Response, event: str) -> Dict[str, Any]:
+async def read_event(
+    response: Response, event: str, fields: Optional[str] = fields_query
+) -> Dict[str, Any]:
     event_obj: Optional[Event] = await get_event_cached(event=event)
     if event_obj is None:
         raise Exception("Event not found")
 
+    field_list = get_fields(fields)
+    if field_list is not None:
+        return event_obj.to_fields_dict(field_list)
     return event_obj.to_dict()
 
 
 @router.get(
     "/events",
     summary="Query multiple events",
-    description="Returns up to 1000 events at a time. Specify limit and offset to page through results.",
+    description="Returns up to 1000 events at a time. Specify limit and offset to page through results. Pass the X-Next-Cursor response header back as cursor to page through large results.",
 )
 @async_fail_gracefully_plural
 async def read_events(
@@ -110,7 +124,10 @@ async def read_events(
     ascending: Optional[bool] = ascending_query,
     limit: Optional[int] = limit_query,
     offset: Optional[int] = offset_query,
+    cursor: Optional[str] = cursor_query,
+    fields: Optional[str] = fields_query,
 ) -> List[Dict[str, Any]]:
+    field_list = get_fields(fields)
     events = await get_events_cached(
         year=year,
         country=country,
@@ -123,5 +140,14 @@ async def read_events(
         ascending=ascending,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        fields=field_list,
     )
+    next_cursor = get_next_cursor(
+        EventORM, events, metric, ascending, min(limit or 1000, 1000), offset, cursor
+    )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if field_list is not None:
+        return [event.to_fields_dict(field_list) for event in events]
     return [event.to_dict() for event in events]
@@ -0,0 +1,125 @@
+import os
+import re
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from fastapi import APIRouter, Request, Response, status
+from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
+
+from src.data.export import MEDIA_TYPE
+from src.db.archive import TABLES, get_export_name, get_exports
+from src.utils.storage import get_local_path, get_url, get_version
+
+router = APIRouter()
+
+CHUNK_SIZE = 1 << 20
+
+range_re = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+@router.get("/")
+async def read_root_export():
+    return {"name": "Export V3 Router"}
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    # Single "bytes=start-end", "bytes=start-" or "bytes=-suffix" range,
+    # inclusive end. Raises ValueError if unsatisfiable, None for a full body.
+    match = range_re.match(header.strip())
+    if match is None:
+        return None
+
+    start, end = match.groups()
+    if start == "" and end == "":
+        return None
+    if start == "":
+        length = min(int(end), size)
+        if length == 0:
+            raise ValueError("Empty suffix range")
+        return size - length, size - 1
+
+    end_num = size - 1 if end == "" else min(int(end), size - 1)
+    if int(start) >= size or int(start) > end_num:
+        raise ValueError("Range outside file")
+    return int(start), end_num
+
+
+def iter_file(path: str, start: int, end: int) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+@router.get(
+    "/exports",
+    summary="List bulk exports",
+    description="Returns the years and tables available as bulk Arrow IPC files.",
+)
+async def read_exports() -> Dict[str, Any]:
+    return {
+        str(year): {table: f"/v3/export/{year}/{table}" for table in tables}
+        for year, tables in get_exports().items()
+    }
+
+
+@router.get(
+    "/export/{year}/{table}",
+    summary="Download a bulk export",
+    description="Returns every row of a table for a year as an Arrow IPC file, readable with pyarrow or pandas.read_feather. Supports HTTP Range requests to resume downloads.",
+)
+async def read_export(request: Request, year: int, table: str) -> Response:
+    if table not in TABLES:
+        return Response(status_code=status.HTTP_404_NOT_FOUND)
+
+    # Bucket files are public, GCS serves ranges and ETags itself
+    name = get_export_name(year, table)
+    url = get_url(name)
+    if url is not None:
+        if get_version(name) is None:
+            return Response(status_code=status.HTTP_404_NOT_FOUND)
+        return RedirectResponse(url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+
+    path = get_local_path(name)
+    if not os.path.exists(path):
+        return Response(status_code=status.HTTP_404_NOT_FOUND)
+
+    stat = os.stat(path)
+    size = stat.st_size
+    etag = f'"{int(stat.st_mtime)}-{size}"'
+    headers = {"Accept-Ranges": "bytes", "ETag": etag}
+    filename = f"{year}_{table}.arrow"
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header is None or (if_range is not None and if_range != etag):
+        return FileResponse(
+            path, media_type=MEDIA_TYPE, filename=filename, headers=headers
+        )
+
+    try:
+        byte_range = parse_range(range_header, size)
+    except ValueError:
+        return Response(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={**headers, "Content-Range": f"bytes */{size}"},
+        )
+
+    if byte_range is None:
+        return FileResponse(
+            path, media_type=MEDIA_TYPE, filename=filename, headers=headers
+        )
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        iter_file(path, start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=MEDIA_TYPE,
+        headers=headers,
+    )
@@ -5,8 +5,11 @@ from fastapi import APIRouter, Response
 
 from src.api.query import (
     ascending_query,
+    cursor_query,
     elim_query,
     event_query,
+    fields_query,
+    get_fields,
     limit_query,
     metric_query,
     offseason_query,
@@ -15,8 +18,10 @@ from src.api.query import (
     week_query,
     year_query,
 )
+from src.db.cursor import get_next_cursor
 from src.db.models import Match
-from src.db.read import get_match, get_matches
+from src.db.models.match import MatchORM
+from src.db.read.aio import get_match, get_matches
 from src.utils.alru_cache import alru_cache
 from src.utils.decorators import (
     async_fail_gracefully_plural,
@@ -35,7 +40,7 @@ async def read_root_match():
 async def get_match_cached(
     match: str, no_cache: bool = False
 ) -> Tuple[bool, Optional[Match]]:
-    return (True, get_match(match=match))
+    return (True, await get_match(match=match))
 
 
 @alru_cache(ttl=timedelta(minutes=1))
@@ -50,6 +55,8 @@ async def get_matches_cached(
     ascending: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[Tuple[str, ...]] = None,
     site: bool = False,
     no_cache: bool = False,
 ) -> Tuple[bool, List[Match]]:
@@ -58,7 +65,7 @@ async def get_matches_cached(
 
     return (
         True,
-        get_matches(
+        await get_matches(
             team=team,
             year=year,
             event=event,
@@ -69,6 +76,8 @@ async def get_matches_cached(
             ascending=ascending,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            fields=fields,
         ),
     )
 
@@ -79,18 +88,23 @@ async def get_matches_cached(
     description="Returns a single Match object. Requires a match key, e.g. `2019ncwak_f1m1`.",
 )
 @async_fail_gracefully_singular
-async def read_match(response: Response, match: str) -> Dict[str, Any]:
+async def read_match(
+    response: Response, match: str, fields: Optional[str] = fields_query
+) -> Dict[str, Any]:
     match_obj: Optional[Match] = await get_match_cached(match=match)
     if match_obj is None:
         raise Exception("Match not found")
 
+    field_list = get_fields(fields)
+    if field_list is not None:
+        return match_obj.to_fields_dict(field_list)
     return match_obj.to_dict()
 
 
 @router.get(
     "/matches",
     summary="Query multiple matches",
-    description="Returns up to 1000 matches at a time. Specify limit and offset to page through results.",
+    description="Returns up to 1000 matches at a time. Specify limit and offset to page through results. Pass the X-Next-Cursor response header back as cursor to page through large results.",
 )
 @async_fail_gracefully_plural
 async def read_matches(
@@ -105,7 +119,10 @@ async def read_matches(
     ascending: Optional[bool] = ascending_query,
     limit: Optional[int] = limit_query,
     offset: Optional[int] = offset_query,
+    cursor: Optional[str] = cursor_query,
+    fields: Optional[str] = fields_query,
 ) -> List[Dict[str, Any]]:
+    field_list = get_fields(fields)
     matches: List[Match] = await get_matches_cached(
         team=team,
         year=year,
@@ -117,5 +134,14 @@ async def read_matches(
         ascending=ascending,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        fields=field_list,
     )
+    next_cursor = get_next_cursor(
+        MatchORM, matches, metric, ascending, min(limit or 1000, 1000), offset, cursor
+    )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if field_list is not None:
+        return [match.to_fields_dict(field_list) for match in matches]
     return [match.to_dict() for match in matches]
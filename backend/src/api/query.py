@@ -1,3 +1,5 @@
+from typing import Optional, Tuple
+
 from fastapi import Query
 
 from src.constants import CURR_YEAR
@@ -13,6 +15,11 @@ country_query = Query(
     None, description="Capitalized country name, e.g. `USA` or `Canada`."
 )
 
+cursor_query = Query(
+    None,
+    description="Cursor from the X-Next-Cursor header of the previous page. Faster than offset for deep pages, use the same metric and ascending.",
+)
+
 district_query = Query(
     None,
     description="One of [`fma`, `fnc`, `fit`, `fin`, `fim`, `ne`, `chs`, `ont`, `pnw`, `pch`, `isr`]",
@@ -27,6 +34,11 @@ event_type_query = Query(
     description="One of [`regional`, `district`, `district_cmp`, `cmp_division`, `cmp_finals`, `offseason`, or `preseason`].",
 )
 
+fields_query = Query(
+    None,
+    description="Comma separated columns to return, e.g. `team,epa`. Returns flat objects with only these columns, and list queries read only these columns from the database.",
+)
+
 limit_query = Query(
     None,
     ge=1,
@@ -58,3 +70,10 @@ week_query = Query(
 )
 
 year_query = Query(None, ge=2002, le=CURR_YEAR, description="Four-digit year")
+
+
+def get_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    # Tuple to key the response caches
+    if fields is None:
+        return None
+    return tuple(x.strip() for x in fields.split(",") if x.strip() != "")
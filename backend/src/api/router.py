@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from src.api.event import router as event_router
+from src.api.export import router as export_router
 from src.api.match import router as match_router
 from src.api.team import router as team_router
 from src.api.team_event import router as team_event_router
@@ -16,6 +17,7 @@ router.include_router(event_router, tags=["Event"])
 router.include_router(team_event_router, tags=["TeamEvent"])
 router.include_router(match_router, tags=["Match"])
 router.include_router(team_match_router, tags=["TeamMatch"])
+router.include_router(export_router, tags=["Export"])
 
 
 @router.get("/")
@@ -7,15 +7,20 @@ from src.api.query import (
     active_query,
     ascending_query,
     country_query,
+    cursor_query,
     district_query,
+    fields_query,
+    get_fields,
     limit_query,
     metric_query,
     offseason_query,
     offset_query,
     state_query,
 )
+from src.db.cursor import get_next_cursor
 from src.db.models import Team
-from src.db.read import get_team, get_teams
+from src.db.models.team import TeamORM
+from src.db.read.aio import get_team, get_teams
 from src.utils.alru_cache import alru_cache
 from src.utils.decorators import (
     async_fail_gracefully_plural,
@@ -34,7 +39,7 @@ async def read_root_team():
 async def get_team_cached(
     team: str, no_cache: bool = False
 ) -> Tuple[bool, Optional[Team]]:
-    return (True, get_team(team=team))
+    return (True, await get_team(team=team))
 
 
 @alru_cache(ttl=timedelta(minutes=1))
@@ -48,6 +53,8 @@ async def get_teams_cached(
     ascending: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[Tuple[str, ...]] = None,
     site: bool = False,
     no_cache: bool = False,
 ) -> Tuple[bool, List[Team]]:
@@ -56,7 +63,7 @@ async def get_teams_cached(
 
     return (
         True,
-        get_teams(
+        await get_teams(
             country=country,
             state=state,
             district=district,
@@ -66,6 +73,8 @@ async def get_teams_cached(
             ascending=ascending,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            fields=fields,
         ),
     )
 
@@ -79,18 +88,22 @@ async def get_teams_cached(
 async def read_team(
     response: Response,
     team: str,
+    fields: Optional[str] = fields_query,
 ) -> Dict[str, Any]:
     team_obj: Optional[Team] = await get_team_cached(team=team)
     if team_obj is None:
         raise Exception("Team not found")
 
+    field_list = get_fields(fields)
+    if field_list is not None:
+        return team_obj.to_fields_dict(field_list)
     return team_obj.to_dict()
 
 
 @router.get(
     "/teams",
     summary="Query multiple teams",
-    description="Returns up to 1000 teams at a time. Specify limit and offset to page through results.",
+    description="Returns up to 1000 teams at a time. Specify limit and offset to page through results. Pass the X-Next-Cursor response header back as cursor to page through large results.",
 )
 @async_fail_gracefully_plural
 async def read_teams(
@@ -104,7 +117,10 @@ async def read_teams(
     ascending: bool = ascending_query,
     limit: int = limit_query,
     offset: int = offset_query,
+    cursor: Optional[str] = cursor_query,
+    fields: Optional[str] = fields_query,
 ) -> List[Dict[str, Any]]:
+    field_list = get_fields(fields)
     teams: List[Team] = await get_teams_cached(
         country=country,
         state=state,
@@ -115,5 +131,14 @@ async def read_teams(
         ascending=ascending,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        fields=field_list,
     )
+    next_cursor = get_next_cursor(
+        TeamORM, teams, metric, ascending, min(limit or 1000, 1000), offset, cursor
+    )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if field_list is not None:
+        return [team.to_fields_dict(field_list) for team in teams]
     return [team.to_dict() for team in teams]
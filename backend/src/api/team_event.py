@@ -6,9 +6,12 @@ from fastapi import APIRouter, Response
 from src.api.query import (
     ascending_query,
     country_query,
+    cursor_query,
     district_query,
     event_query,
     event_type_query,
+    fields_query,
+    get_fields,
     limit_query,
     metric_query,
     offseason_query,
@@ -18,8 +21,10 @@ from src.api.query import (
     week_query,
     year_query,
 )
+from src.db.cursor import get_next_cursor
 from src.db.models import TeamEvent
-from src.db.read import get_team_event, get_team_events
+from src.db.models.team_event import TeamEventORM
+from src.db.read.aio import get_team_event, get_team_events
 from src.utils.alru_cache import alru_cache
 from src.utils.decorators import (
     async_fail_gracefully_plural,
@@ -38,7 +43,7 @@ async def read_root_team_event():
 async def get_team_event_cached(
     team: str, event: str, no_cache: bool = False
 ) -> Tuple[bool, Optional[TeamEvent]]:
-    return (True, get_team_event(team=team, event=event))
+    return (True, await get_team_event(team=team, event=event))
 
 
 @alru_cache(ttl=timedelta(minutes=1))
@@ -56,6 +61,8 @@ async def get_team_events_cached(
     ascending: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[Tuple[str, ...]] = None,
     site: bool = False,
     no_cache: bool = False,
 ) -> Tuple[bool, List[TeamEvent]]:
@@ -64,7 +71,7 @@ async def get_team_events_cached(
 
     return (
         True,
-        get_team_events(
+        await get_team_events(
             team=team,
             year=year,
             event=event,
@@ -78,6 +85,8 @@ async def get_team_events_cached(
             ascending=ascending,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            fields=fields,
         ),
     )
 
@@ -88,20 +97,25 @@ async def get_team_events_cached(
     description="Returns a single Team Event object. Requires a team number and event key, e.g. `5511` and `2019ncwak`.",
 )
 @async_fail_gracefully_singular
-async def read_team_event(response: Response, team: str, event: str) -> Dict[str, Any]:
+async def read_team_event(
+    response: Response, team: str, event: str, fields: Optional[str] = fields_query
+) -> Dict[str, Any]:
     team_event_obj: Optional[TeamEvent] = await get_team_event_cached(
         team=team, event=event
     )
     if team_event_obj is None:
         raise Exception("Team Event not found")
 
+    field_list = get_fields(fields)
+    if field_list is not None:
+        return team_event_obj.to_fields_dict(field_list)
     return team_event_obj.to_dict()
 
 
 @router.get(
     "/team_events",
     summary="Query multiple team events",
-    description="Returns up to 1000 team events at a time. Specify limit and offset to page through results.",
+    description="Returns up to 1000 team events at a time. Specify limit and offset to page through results. Pass the X-Next-Cursor response header back as cursor to page through large results.",
 )
 @async_fail_gracefully_plural
 async def read_team_events(
@@ -119,7 +133,10 @@ async def read_team_events(
     ascending: Optional[bool] = ascending_query,
     limit: Optional[int] = limit_query,
     offset: Optional[int] = offset_query,
+    cursor: Optional[str] = cursor_query,
+    fields: Optional[str] = fields_query,
 ) -> List[Dict[str, Any]]:
+    field_list = get_fields(fields)
     team_events: List[TeamEvent] = await get_team_events_cached(
         team=team,
         year=year,
@@ -134,5 +151,20 @@ async def read_team_events(
         ascending=ascending,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        fields=field_list,
     )
+    next_cursor = get_next_cursor(
+        TeamEventORM,
+        team_events,
+        metric,
+        ascending,
+        min(limit or 1000, 1000),
+        offset,
+        cursor,
+    )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if field_list is not None:
+        return [team_event.to_fields_dict(field_list) for team_event in team_events]
     return [team_event.to_dict() for team_event in team_events]
@@ -5,8 +5,11 @@ from fastapi import APIRouter, Response
 
 from src.api.query import (
     ascending_query,
+    cursor_query,
     elim_query,
     event_query,
+    fields_query,
+    get_fields,
     limit_query,
     match_query,
     metric_query,
@@ -16,8 +19,10 @@ from src.api.query import (
     week_query,
     year_query,
 )
+from src.db.cursor import get_next_cursor
 from src.db.models import TeamMatch
-from src.db.read import get_team_match, get_team_matches
+from src.db.models.team_match import TeamMatchORM
+from src.db.read.aio import get_team_match, get_team_matches
 from src.utils.alru_cache import alru_cache
 from src.utils.decorators import (
     async_fail_gracefully_plural,
@@ -36,7 +41,7 @@ async def read_root_team_match():
 async def get_team_match_cached(
     team: str, match: str, no_cache: bool = False
 ) -> Tuple[bool, Optional[TeamMatch]]:
-    return (True, get_team_match(team=team, match=match))
+    return (True, await get_team_match(team=team, match=match))
 
 
 @alru_cache(ttl=timedelta(minutes=1))
@@ -52,6 +57,8 @@ async def get_team_matches_cached(
     ascending: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[Tuple[str, ...]] = None,
     site: bool = False,
     no_cache: bool = False,
 ) -> Tuple[bool, List[TeamMatch]]:
@@ -60,7 +67,7 @@ async def get_team_matches_cached(
 
     return (
         True,
-        get_team_matches(
+        await get_team_matches(
             team=team,
             year=year,
             event=event,
@@ -72,6 +79,8 @@ async def get_team_matches_cached(
             ascending=ascending,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            fields=fields,
         ),
     )
 
@@ -82,20 +91,25 @@ async def get_team_matches_cached(
     description="Returns a single Team Match object. Requires a team number and match key, e.g. `5511` and `2019ncwak_f1m1`.",
 )
 @async_fail_gracefully_singular
-async def read_team_match(response: Response, team: str, match: str) -> Dict[str, Any]:
+async def read_team_match(
+    response: Response, team: str, match: str, fields: Optional[str] = fields_query
+) -> Dict[str, Any]:
     team_match_obj: Optional[TeamMatch] = await get_team_match_cached(
         team=team, match=match
     )
     if team_match_obj is None:
         raise Exception("Team Match not found")
 
+    field_list = get_fields(fields)
+    if field_list is not None:
+        return team_match_obj.to_fields_dict(field_list)
     return team_match_obj.to_dict()
 
 
 @router.get(
     "/team_matches",
     summary="Query multiple team matches",
-    description="Returns up to 1000 team matches at a time. Specify limit and offset to page through results.",
+    description="Returns up to 1000 team matches at a time. Specify limit and offset to page through results. Pass the X-Next-Cursor response header back as cursor to page through large results.",
 )
 @async_fail_gracefully_plural
 async def read_team_matches(
@@ -111,7 +125,10 @@ async def read_team_matches(
     ascending: Optional[bool] = ascending_query,
     limit: Optional[int] = limit_query,
     offset: Optional[int] = offset_query,
+    cursor: Optional[str] = cursor_query,
+    fields: Optional[str] = fields_query,
 ) -> List[Dict[str, Any]]:
+    field_list = get_fields(fields)
     team_matches: List[TeamMatch] = await get_team_matches_cached(
         team=team,
         year=year,
@@ -124,5 +141,20 @@ async def read_team_matches(
         ascending=ascending,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        fields=field_list,
     )
+    next_cursor = get_next_cursor(
+        TeamMatchORM,
+        team_matches,
+        metric,
+        ascending,
+        min(limit or 1000, 1000),
+        offset,
+        cursor,
+    )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if field_list is not None:
+        return [team_match.to_fields_dict(field_list) for team_match in team_matches]
     return [team_match.to_dict() for team_match in team_matches]
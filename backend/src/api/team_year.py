@@ -6,7 +6,10 @@ from fastapi import APIRouter, Response
 from src.api.query import (
     ascending_query,
     country_query,
+    cursor_query,
     district_query,
+    fields_query,
+    get_fields,
     limit_query,
     metric_query,
     offseason_query,
@@ -15,8 +18,10 @@ from src.api.query import (
     team_query,
     year_query,
 )
+from src.db.cursor import get_next_cursor
 from src.db.models import TeamYear
-from src.db.read import get_team_year, get_team_years
+from src.db.models.team_year import TeamYearORM
+from src.db.read.aio import get_team_year, get_team_years
 from src.utils.alru_cache import alru_cache
 from src.utils.decorators import (
     async_fail_gracefully_plural,
@@ -35,7 +40,7 @@ async def read_root_team_year():
 async def get_team_year_cached(
     team: str, year: int, no_cache: bool = False
 ) -> Tuple[bool, Optional[TeamYear]]:
-    return (True, get_team_year(team=team, year=year))
+    return (True, await get_team_year(team=team, year=year))
 
 
 @alru_cache(ttl=timedelta(minutes=1))
@@ -50,6 +55,8 @@ async def get_team_years_cached(
     ascending: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[Tuple[str, ...]] = None,
     site: bool = False,
     no_cache: bool = False,
 ) -> Tuple[bool, List[TeamYear]]:
@@ -58,7 +65,7 @@ async def get_team_years_cached(
 
     return (
         True,
-        get_team_years(
+        await get_team_years(
             team=team,
             year=year,
             country=country,
@@ -69,6 +76,8 @@ async def get_team_years_cached(
             ascending=ascending,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            fields=fields,
         ),
     )
 
@@ -83,18 +92,22 @@ async def read_team_year(
     response: Response,
     team: str,
     year: int,
+    fields: Optional[str] = fields_query,
 ) -> Dict[str, Any]:
     team_year_obj: Optional[TeamYear] = await get_team_year_cached(team=team, year=year)
     if team_year_obj is None:
         raise Exception("TeamYear not found")
 
+    field_list = get_fields(fields)
+    if field_list is not None:
+        return team_year_obj.to_fields_dict(field_list)
     return team_year_obj.to_dict()
 
 
 @router.get(
     "/team_years",
     summary="Query multiple team years",
-    description="Returns up to 1000 team years at a time. Specify limit and offset to page through results.",
+    description="Returns up to 1000 team years at a time. Specify limit and offset to page through results. Pass the X-Next-Cursor response header back as cursor to page through large results.",
 )
 @async_fail_gracefully_plural
 async def read_team_years(
@@ -109,7 +122,10 @@ async def read_team_years(
     ascending: Optional[bool] = ascending_query,
     limit: Optional[int] = limit_query,
     offset: Optional[int] = offset_query,
+    cursor: Optional[str] = cursor_query,
+    fields: Optional[str] = fields_query,
 ) -> List[Dict[str, Any]]:
+    field_list = get_fields(fields)
     team_years: List[TeamYear] = await get_team_years_cached(
         team=team,
         year=year,
@@ -121,5 +137,20 @@ async def read_team_years(
         ascending=ascending,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        fields=field_list,
     )
+    next_cursor = get_next_cursor(
+        TeamYearORM,
+        team_years,
+        metric,
+        ascending,
+        min(limit or 1000, 1000),
+        offset,
+        cursor,
+    )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if field_list is not None:
+        return [team_year.to_fields_dict(field_list) for team_year in team_years]
     return [team_year.to_dict() for team_year in team_years]
@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Response
 
 from src.api.event import get_event_cached, get_events_cached
-from src.api.v2.utils import format_type
+from src.api.v2.utils import filter_fields, format_type
 from src.db.models import Event
 from src.utils.decorators import (
     async_fail_gracefully_plural,
@@ -55,12 +55,14 @@ async def read_root_event():
     response_description="An Event object.",
 )
 @async_fail_gracefully_singular
-async def read_event(response: Response, event: str) -> Dict[str, Any]:
+async def read_event(
+    response: Response, event: str, fields: Optional[str] = None
+) -> Dict[str, Any]:
     event_obj: Optional[Event] = await get_event_cached(event=event)
     if event_obj is None:
         raise Exception("Event not found")
 
-    return get_v2_event(event_obj)
+    return filter_fields(get_v2_event(event_obj), fields)
 
 
 @router.get(
@@ -143,6 +145,7 @@ async def read_events(
     ascending: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    fields: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     if type is not None:
         raise Exception("Event type filter not supported")
@@ -158,4 +161,4 @@ async def read_events(
         limit=limit,
         offset=offset,
     )
-    return [get_v2_event(event) for event in events]
+    return [filter_fields(get_v2_event(event), fields) for event in events]
@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Response
 
 from src.api.match import get_match_cached, get_matches_cached
-from src.api.v2.utils import format_team
+from src.api.v2.utils import filter_fields, format_team
 from src.db.models import Match
 from src.models.epa.math import inv_unit_sigmoid
 from src.utils.decorators import (
@@ -99,11 +99,13 @@ async def read_v2_match_root():
     response_description="A Match object.",
 )
 @async_fail_gracefully_singular
-async def read_match(response: Response, match: str) -> Dict[str, Any]:
+async def read_match(
+    response: Response, match: str, fields: Optional[str] = None
+) -> Dict[str, Any]:
     match_obj: Optional[Match] = await get_match_cached(match=match)
     if match_obj is None:
         raise Exception("Match not found")
-    return get_v2_match(match_obj)
+    return filter_fields(get_v2_match(match_obj), fields)
 
 
 @router.get(
@@ -161,6 +163,7 @@ async def read_matches(
     ascending: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    fields: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     matches = await get_matches_cached(
         team=None if team is None else str(team),
@@ -175,4 +178,4 @@ async def read_matches(
         offset=offset,
     )
 
-    return [get_v2_match(match) for match in matches]
+    return [filter_fields(get_v2_match(match), fields) for match in matches]
@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Response
 
 from src.api.team import get_team_cached, get_teams_cached
-from src.api.v2.utils import format_team, inv_format_team
+from src.api.v2.utils import filter_fields, format_team, inv_format_team
 from src.db.models import Team
 from src.utils.decorators import (
     async_fail_gracefully_plural,
@@ -54,12 +54,13 @@ async def read_root_team():
 async def read_team(
     response: Response,
     team: int,
+    fields: Optional[str] = None,
 ) -> Dict[str, Any]:
     team_obj: Optional[Team] = await get_team_cached(team=inv_format_team(team))
     if team_obj is None:
         raise Exception("Team not found")
 
-    return get_v2_team(team_obj)
+    return filter_fields(get_v2_team(team_obj), fields)
 
 
 @router.get(
@@ -107,6 +108,7 @@ async def read_teams(
     ascending: bool = True,
     limit: int = 100,
     offset: int = 0,
+    fields: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     teams: List[Team] = await get_teams_cached(
         country=country,
@@ -119,4 +121,4 @@ async def read_teams(
         limit=limit,
         offset=offset,
     )
-    return [get_v2_team(team) for team in teams]
+    return [filter_fields(get_v2_team(team), fields) for team in teams]
@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Response
 
 from src.api.team_event import get_team_event_cached, get_team_events_cached
-from src.api.v2.utils import format_team, format_type, inv_format_team
+from src.api.v2.utils import filter_fields, format_team, format_type, inv_format_team
 from src.db.models import TeamEvent
 from src.utils.decorators import (
     async_fail_gracefully_plural,
@@ -85,14 +85,16 @@ async def read_root_team_event():
     response_description="A Team Event object.",
 )
 @async_fail_gracefully_singular
-async def read_team_event(response: Response, team: int, event: str) -> Dict[str, Any]:
+async def read_team_event(
+    response: Response, team: int, event: str, fields: Optional[str] = None
+) -> Dict[str, Any]:
     team_event_obj: Optional[TeamEvent] = await get_team_event_cached(
         team=inv_format_team(team), event=event
     )
     if team_event_obj is None:
         raise Exception("Team Event not found")
 
-    return get_v2_team_event(team_event_obj)
+    return filter_fields(get_v2_team_event(team_event_obj), fields)
 
 
 @router.get(
@@ -185,6 +187,7 @@ async def read_team_events(
     ascending: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    fields: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     if type is not None:
         raise Exception("Event type filter not supported")
@@ -202,4 +205,7 @@ async def read_team_events(
         limit=limit,
         offset=offset,
     )
-    return [get_v2_team_event(team_event) for team_event in team_events]
+    return [
+        filter_fields(get_v2_team_event(team_event), fields)
+        for team_event in team_events
+    ]
@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Response
 
 from src.api.team_match import get_team_match_cached, get_team_matches_cached
-from src.api.v2.utils import format_team, inv_format_team
+from src.api.v2.utils import filter_fields, format_team, inv_format_team
 from src.db.models import TeamMatch
 from src.utils.decorators import (
     async_fail_gracefully_plural,
@@ -47,14 +47,16 @@ async def read_root_team_match():
     response_description="A Team Match object.",
 )
 @async_fail_gracefully_singular
-async def read_team_match(response: Response, team: int, match: str) -> Dict[str, Any]:
+async def read_team_match(
+    response: Response, team: int, match: str, fields: Optional[str] = None
+) -> Dict[str, Any]:
     team_match_obj: Optional[TeamMatch] = await get_team_match_cached(
         team=inv_format_team(team), match=match
     )
     if team_match_obj is None:
         raise Exception("Team Match not found")
 
-    return get_v2_team_match(team_match_obj)
+    return filter_fields(get_v2_team_match(team_match_obj), fields)
 
 
 @router.get(
@@ -119,6 +121,7 @@ async def read_team_matches(
     ascending: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    fields: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     team_matches: List[TeamMatch] = await get_team_matches_cached(
         team=None if team is None else inv_format_team(team),
@@ -133,4 +136,7 @@ async def read_team_matches(
         limit=limit,
         offset=offset,
     )
-    return [get_v2_team_match(team_match) for team_match in team_matches]
+    return [
+        filter_fields(get_v2_team_match(team_match), fields)
+        for team_match in team_matches
+    ]
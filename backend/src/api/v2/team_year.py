@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Response
 
 from src.api.team_year import get_team_year_cached, get_team_years_cached
-from src.api.v2.utils import format_team, inv_format_team
+from src.api.v2.utils import filter_fields, format_team, inv_format_team
 from src.constants import CURR_WEEK
 from src.db.models import TeamYear
 from src.utils.decorators import (
@@ -97,6 +97,7 @@ async def read_team_year(
     response: Response,
     team: int,
     year: int,
+    fields: Optional[str] = None,
 ) -> Dict[str, Any]:
     team_year_obj: Optional[TeamYear] = await get_team_year_cached(
         team=inv_format_team(team), year=year
@@ -104,7 +105,7 @@ async def read_team_year(
     if team_year_obj is None:
         raise Exception("TeamYear not found")
 
-    return get_v2_team_year(team_year_obj)
+    return filter_fields(get_v2_team_year(team_year_obj), fields)
 
 
 @router.get(
@@ -171,6 +172,7 @@ async def read_team_years(
     ascending: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    fields: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     team_years: List[TeamYear] = await get_team_years_cached(
         team=None if team is None else inv_format_team(team),
@@ -184,4 +186,6 @@ async def read_team_years(
         limit=limit,
         offset=offset,
     )
-    return [get_v2_team_year(team_year) for team_year in team_years]
+    return [
+        filter_fields(get_v2_team_year(team_year), fields) for team_year in team_years
+    ]
@@ -1,3 +1,6 @@
+from typing import Any, Dict, Optional
+
+
 def format_team(team: str) -> int:
     if not team[-1].isdigit():
         team = team[:-1] + "000" + str(ord(team[-1]) - ord("A")).rjust(2, "0")
@@ -29,3 +32,10 @@ def format_type(type: str) -> int:
         return 100
 
     return 0
+
+
+def filter_fields(data: Dict[str, Any], fields: Optional[str]) -> Dict[str, Any]:
+    # Comma separated keys, unknown keys are left out for the client to report
+    if fields is None:
+        return data
+    return {k: data[k] for k in fields.split(",") if k in data}
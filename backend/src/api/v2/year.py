@@ -2,6 +2,7 @@ from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Response
 
+from src.api.v2.utils import filter_fields
 from src.api.year import get_year_cached, get_years_cached
 from src.db.models import Year
 from src.utils.decorators import (
@@ -117,12 +118,13 @@ async def read_root_year():
 async def read_year(
     response: Response,
     year: int,
+    fields: Optional[str] = None,
 ) -> Dict[str, Any]:
     year_obj: Optional[Year] = await get_year_cached(year=year)
     if year_obj is None:
         raise Exception("Year not found")
 
-    return get_v2_year(year_obj)
+    return filter_fields(get_v2_year(year_obj), fields)
 
 
 @router.get(
@@ -137,8 +139,9 @@ async def read_years(
     ascending: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    fields: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     years: List[Year] = await get_years_cached(
         metric=metric, ascending=ascending, limit=limit, offset=offset
     )
-    return [get_v2_year(year) for year in years]
+    return [filter_fields(get_v2_year(year), fields) for year in years]
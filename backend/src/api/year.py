@@ -3,9 +3,19 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Response
 
-from src.api.query import ascending_query, limit_query, metric_query, offset_query
+from src.api.query import (
+    ascending_query,
+    cursor_query,
+    fields_query,
+    get_fields,
+    limit_query,
+    metric_query,
+    offset_query,
+)
+from src.db.cursor import get_next_cursor
 from src.db.models import Year
-from src.db.read import get_year, get_years
+from src.db.models.year import YearORM
+from src.db.read.aio import get_year, get_years
 from src.utils.alru_cache import alru_cache
 from src.utils.decorators import (
     async_fail_gracefully_plural,
@@ -24,7 +34,7 @@ async def read_root_year():
 async def get_year_cached(
     year: int, no_cache: bool = False
 ) -> Tuple[bool, Optional[Year]]:
-    return (True, get_year(year=year))
+    return (True, await get_year(year=year))
 
 
 @alru_cache(ttl=timedelta(minutes=1))
@@ -33,6 +43,8 @@ async def get_years_cached(
     ascending: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[Tuple[str, ...]] = None,
     site: bool = False,
     no_cache: bool = False,
 ) -> Tuple[bool, List[Year]]:
@@ -41,7 +53,14 @@ async def get_years_cached(
 
     return (
         True,
-        get_years(metric=metric, ascending=ascending, limit=limit, offset=offset),
+        await get_years(
+            metric=metric,
+            ascending=ascending,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            fields=fields,
+        ),
     )
 
 
@@ -54,11 +73,15 @@ async def get_years_cached(
 async def read_year(
     response: Response,
     year: int,
+    fields: Optional[str] = fields_query,
 ) -> Dict[str, Any]:
     year_obj: Optional[Year] = await get_year_cached(year=year)
     if year_obj is None:
         raise Exception("Year not found")
 
+    field_list = get_fields(fields)
+    if field_list is not None:
+        return year_obj.to_fields_dict(field_list)
     return year_obj.to_dict()
 
 
@@ -74,8 +97,23 @@ async def read_years(
     ascending: Optional[bool] = ascending_query,
     limit: Optional[int] = limit_query,
     offset: Optional[int] = offset_query,
+    cursor: Optional[str] = cursor_query,
+    fields: Optional[str] = fields_query,
 ) -> List[Dict[str, Any]]:
+    field_list = get_fields(fields)
     years: List[Year] = await get_years_cached(
-        metric=metric, ascending=ascending, limit=limit, offset=offset
+        metric=metric,
+        ascending=ascending,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        fields=field_list,
+    )
+    next_cursor = get_next_cursor(
+        YearORM, years, metric, ascending, min(limit or 1000, 1000), offset, cursor
     )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if field_list is not None:
+        return [year.to_fields_dict(field_list) for year in years]
     return [year.to_dict() for year in years]
@@ -30,10 +30,44 @@ CONN_STR = (
     else "cockroachdb://root@localhost:26257/statbotics3?sslmode=disable"
 )
 
+# Connections kept open, and extra connections opened under load. Async reads
+# run on DB_POOL_SIZE + DB_MAX_OVERFLOW threads, one per possible connection
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+# DATA
+
+# Processes for the TBA, averages and wins stages of a full rebuild
+REBUILD_WORKERS = int(os.getenv("REBUILD_WORKERS", str(os.cpu_count() or 1)))
+
+# Per-year Arrow snapshots, written by the data pipeline and served by the API
+EXPORT_PATH = os.getenv("EXPORT_PATH", "exports")
+
+# GCS bucket for the files the data service publishes to the API service
+# (exports, leaderboards, upcoming index). Required in production, where the
+# services run on separate instances with read-only filesystems, and readable
+# by all users so export downloads can redirect to it. Empty uses EXPORT_PATH.
+STORAGE_BUCKET = os.getenv("STORAGE_BUCKET", "")
+
+# Downloaded bucket files that are memory mapped (the archive)
+STORAGE_CACHE_PATH = os.getenv("STORAGE_CACHE_PATH", "/tmp/statbotics")
+
+# Serve reads for closed seasons from the exports instead of the DB
+USE_ARCHIVE = os.getenv("USE_ARCHIVE", "True") == "True"
+
 # API
 
 AUTH_KEY_BLACKLIST: List[str] = []
 
+# Whether /upcoming_matches/stream keeps streaming. App Engine standard buffers
+# responses until they end, so there each request ends after one snapshot and
+# the client reconnects, polling instead. Streaming needs a host that flushes
+# (ex: Cloud Run, App Engine flexible).
+STREAM_UPCOMING = (
+    os.getenv("STREAM_UPCOMING", str(os.getenv("GAE_ENV") != "standard")) == "True"
+)
+
 # CONFIG
 
 CURR_YEAR = 2024
@@ -0,0 +1,179 @@
+import argparse
+import json
+import statistics
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from itertools import product
+from multiprocessing import get_context
+from typing import Any, Callable, Dict, List, Optional
+
+import attr
+
+from src.constants import REBUILD_WORKERS
+from src.data.epa.main import process_year as process_year_epa
+from src.data.utils import objs_type
+from src.db.archive import TABLES, ArchiveTable, get_export_name
+from src.db.models import TeamYear, Year
+from src.models.epa.constants import (
+    ELIM_WEIGHT,
+    INIT_PENALTY,
+    MEAN_REVERSION,
+    YEAR_ONE_WEIGHT,
+)
+from src.models.epa.main import EPA
+from src.models.epa.vectorized import VectorizedEPA
+from src.utils.storage import get_path
+
+# Offline EPA backtests over the per-year Arrow exports (see data/export.py),
+# without the DB. Each configuration replays the seasons in order, so its end
+# of season EPAs seed the next season as in a full reset. Seasons before the
+# first one (or skipped) keep the EPAs in the exports.
+#
+#   python -m src.data.epa.backtest --years 2019 2022 2023 \
+#       --grid '{"elim_weight": [0.25, 0.33], "mean_reversion": [0.3, 0.4]}'
+
+# Year fields written by data/epa/metrics.py
+METRICS = ["count", "conf", "acc", "mse", "error", "mae", "rmse", "ll", "f1"]
+METRIC_FIELDS = [f for f in Year.field_names if f.split("_")[-1] in METRICS]
+
+
+@attr.s(auto_attribs=True, frozen=True, slots=True)
+class Params:
+    elim_weight: float = ELIM_WEIGHT
+    init_penalty: float = INIT_PENALTY
+    year_one_weight: float = YEAR_ONE_WEIGHT
+    mean_reversion: float = MEAN_REVERSION
+    percent_scale: float = 1  # multiplies percent_func, capped at 1
+    # (year, team match count) -> value, module level functions to pickle
+    percent_func: Callable[[int, int], float] = EPA.percent_func
+    margin_func: Callable[[int, int], float] = EPA.margin_func
+
+    def to_dict(self) -> Dict[str, Any]:
+        out = attr.asdict(self)
+        for name in ["percent_func", "margin_func"]:
+            out[name] = getattr(self, name).__qualname__
+        return out
+
+
+def get_grid(values: Dict[str, List[Any]]) -> List[Params]:
+    # Every combination of the given values, defaults for the rest
+    names = [f.name for f in attr.fields(Params)]
+    for name in values:
+        if name not in names:
+            raise Exception("Invalid parameter: " + name)
+    keys = list(values)
+    return [Params(**dict(zip(keys, x))) for x in product(*values.values())]
+
+
+def get_percent(
+    func: Callable[[int, int], float], scale: float, year: int, x: int
+) -> float:
+    return min(1, scale * func(year, x))
+
+
+def get_model(params: Params) -> VectorizedEPA:
+    model = VectorizedEPA()
+    model.elim_weight = params.elim_weight
+    model.init_penalty = params.init_penalty
+    model.year_one_weight = params.year_one_weight
+    model.mean_reversion = params.mean_reversion
+    model.percent_func = partial(  # type: ignore
+        get_percent, params.percent_func, params.percent_scale
+    )
+    model.margin_func = params.margin_func  # type: ignore
+    return model
+
+
+# Memory mapped exports of this process, shared with other workers by the OS
+tables: Dict[str, ArchiveTable] = {}
+
+
+def read_table(year: int, table: str) -> List[Any]:
+    # New models on every call, replays mutate them
+    name = get_export_name(year, table)
+    if name not in tables:
+        local = get_path(name)
+        if local is None:
+            raise OSError("No export: " + name)
+        tables[name] = ArchiveTable(local[1], table)
+    return tables[name].query([], None, None, None, None)
+
+
+def read_objs(year: int) -> objs_type:
+    items = {table: read_table(year, table) for table in TABLES}
+    years = items.pop("years")
+    if len(years) == 0:
+        raise Exception("Year not found")
+    return (years[0], *[{x.pk(): x for x in v} for v in items.values()], {})
+
+
+def run_params(params: Params, years: List[int]) -> Dict[str, Any]:
+    all_team_years: Dict[int, Dict[str, TeamYear]] = {}
+    out: Dict[int, Dict[str, Any]] = {}
+    for year in years:
+        # Up to two previous seasons initialize EPAs
+        for prev_year in [year - 2, year - 1]:
+            if prev_year not in all_team_years:
+                try:
+                    team_years = read_table(prev_year, "team_years")
+                except OSError:
+                    continue
+                all_team_years[prev_year] = {ty.team: ty for ty in team_years}
+
+        objs = process_year_epa(
+            read_objs(year), all_team_years, model=get_model(params)
+        )
+        all_team_years[year] = {ty.team: ty for ty in objs[1].values()}
+        out[year] = {name: getattr(objs[0], name) for name in METRIC_FIELDS}
+
+    return {"params": params.to_dict(), "years": out, "mean": get_means(out)}
+
+
+def get_means(results: Dict[int, Dict[str, Any]]) -> Dict[str, Optional[float]]:
+    # Unweighted across years, skips years without the metric
+    out: Dict[str, Optional[float]] = {}
+    for name in METRIC_FIELDS:
+        values = [x[name] for x in results.values() if x[name] is not None]
+        out[name] = round(statistics.mean(values), 4) if len(values) > 0 else None
+    return out
+
+
+def run(
+    grid: List[Params], years: List[int], workers: int, path: Optional[str]
+) -> List[Dict[str, Any]]:
+    # One configuration per task, lines are appended as they finish so an
+    # interrupted sweep keeps its results
+    out: List[Dict[str, Any]] = []
+    with ProcessPoolExecutor(workers, mp_context=get_context("spawn")) as pool:
+        futures = [pool.submit(run_params, params, years) for params in grid]
+        for future in as_completed(futures):
+            result = future.result()
+            out.append(result)
+            if path is not None:
+                with open(path, "a") as f:
+                    f.write(json.dumps(result) + "\n")
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backtest EPA parameters")
+    parser.add_argument("--years", type=int, nargs="+", required=True)
+    parser.add_argument("--grid", default="{}", help="JSON of parameter to values")
+    parser.add_argument("--workers", type=int, default=REBUILD_WORKERS)
+    parser.add_argument("--out", help="JSON lines file, appended to")
+    parser.add_argument("--sort", default="epa_mse", help="Mean metric to rank by")
+    parser.add_argument("--descending", action="store_true")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    grid = get_grid(json.loads(args.grid))
+    results = run(grid, sorted(args.years), args.workers, args.out)
+
+    ranked = [x for x in results if x["mean"].get(args.sort) is not None]
+    ranked.sort(key=lambda x: x["mean"][args.sort], reverse=args.descending)
+    for result in ranked[: args.top]:
+        print(json.dumps({"params": result["params"], "mean": result["mean"]}))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,51 +1,162 @@
-from collections import defaultdict
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
+import attr
+
+from src.data.index import SeasonIndex
 from src.data.utils import objs_type
-from src.db.models import TeamEvent, TeamMatch, TeamYear
+from src.db.models import Match, TeamYear, Year
 from src.models.epa.main import EPA
-from src.utils.utils import get_team_event_key, get_team_match_key, get_team_year_key
+from src.models.epa.vectorized import VectorizedEPA
+from src.utils.utils import get_team_match_key
 
+# Inputs to the EPA model, a change to any of these invalidates later matches
+MATCH_FIELDS = [f.name for f in attr.fields(Match) if not f.name.startswith("epa_")]
+YEAR_FIELDS = [f.name for f in attr.fields(Year) if f.name.endswith("_mean")] + [
+    "score_sd"
+]
 
-def process_year(
-    objs: objs_type, all_team_years: Dict[int, Dict[str, TeamYear]]
-) -> objs_type:
+# Model state after the last run of each season, with the Year signature and
+# one signature per processed match (in processing order)
+checkpoints: Dict[int, Tuple[VectorizedEPA, int, List[int]]] = {}
+
+
+def get_match_signature(match: Match) -> int:
+    return hash(tuple(getattr(match, field) for field in MATCH_FIELDS))
+
+
+def get_year_signature(year: Year) -> int:
+    return hash(tuple(getattr(year, field) for field in YEAR_FIELDS))
+
+
+def clear_checkpoint(year_num: int) -> None:
+    checkpoints.pop(year_num, None)
+
+
+def resume_season(
+    objs: objs_type,
+    prev_objs: objs_type,
+    all_team_years: Dict[int, Dict[str, TeamYear]],
+    index: SeasonIndex,
+) -> Optional[Tuple[VectorizedEPA, List[int]]]:
     year = objs[0]
     team_years = objs[1]
     team_events = objs[3]
     matches = objs[4]
     team_matches = objs[5]
 
-    match_team_matches: Dict[str, Dict[str, TeamMatch]] = defaultdict(dict)
-    match_team_events: Dict[str, Dict[str, TeamEvent]] = defaultdict(dict)
-    match_team_years: Dict[str, Dict[str, TeamYear]] = defaultdict(dict)
-    for match in matches.values():
-        red_teams, blue_teams = match.get_teams()
-        for team in red_teams + blue_teams:
-            team_match_key = get_team_match_key(team, match.key)
-            match_team_matches[match.key][team] = team_matches[team_match_key]
-            team_event_key = get_team_event_key(team, match.event)
-            match_team_events[match.key][team] = team_events[team_event_key]
-            team_year_key = get_team_year_key(team, match.year)
-            match_team_years[match.key][team] = team_years[team_year_key]
-
-    model = EPA()
-
-    model.start_season(year, all_team_years, team_years)
-    for curr_match in sorted(matches.values(), key=lambda m: m.time):
-        curr_team_matches = match_team_matches[curr_match.key]
-        curr_team_events = match_team_events[curr_match.key]
-        curr_team_years = match_team_years[curr_match.key]
-        model.process_match(
-            curr_match,
-            curr_team_matches,
-            curr_team_events,
-            curr_team_years,
+    if year.year not in checkpoints:
+        return None
+
+    model, year_signature, prev_signatures = checkpoints[year.year]
+    if get_year_signature(year) != year_signature:
+        return None  # Week 1 averages changed, all initial EPAs shift
+
+    if any(team not in index.team_ids for team in model.team_ids):
+        return None
+
+    # Keeps matches up to the first new or changed one, restoring their stored
+    # predictions (TBA replaces every match object at ongoing events)
+    prev_matches, prev_team_matches = prev_objs[4], prev_objs[5]
+    signatures: List[int] = []
+    for i, (match, prev_signature) in enumerate(zip(index.matches, prev_signatures)):
+        prev_match = prev_matches.get(match.key, None)
+        if prev_match is None or get_match_signature(match) != prev_signature:
+            break
+
+        teams = match.get_red() + match.get_blue()
+        keys = [get_team_match_key(t, match.key) for t in teams]
+        if any(key not in prev_team_matches for key in keys):
+            break
+
+        matches[match.key] = prev_match
+        for key in keys:
+            team_matches[key] = prev_team_matches[key]
+        index.replace_match(
+            i, prev_match, {t: prev_team_matches[k] for t, k in zip(teams, keys)}
         )
+        signatures.append(prev_signature)
+
+    model.rewind(len(signatures), team_events, team_years)
+    model.year_obj = year
+
+    new_team_years = [ty for ty in team_years.values() if ty.team not in model.team_ids]
+    model.add_teams(all_team_years, new_team_years)
+
+    return model, signatures
+
+
+def process_year(
+    objs: objs_type,
+    all_team_years: Dict[int, Dict[str, TeamYear]],
+    vectorized: bool = True,
+    incremental: bool = False,
+    prev_objs: Optional[objs_type] = None,
+    index: Optional[SeasonIndex] = None,
+    model: Optional[EPA] = None,
+) -> objs_type:
+    year = objs[0]
+    team_years = objs[1]
+    team_events = objs[3]
+
+    if index is None:
+        index = SeasonIndex(objs)
+
+    # VectorizedEPA matches EPA output, EPA kept as the reference implementation.
+    # A given model (ex: with tuned parameters) replaces both.
+    if model is None:
+        model = VectorizedEPA() if vectorized else EPA()
+    signatures: List[int] = []
+
+    resumed = None
+    if vectorized and incremental and prev_objs is not None:
+        resumed = resume_season(objs, prev_objs, all_team_years, index)
+
+    if resumed is not None:
+        model, signatures = resumed
+    else:
+        model.start_season(year, all_team_years, team_years)
+
+    # Index team ids to model team ids, resolved once per season
+    slot_ids = None
+    if isinstance(model, VectorizedEPA):
+        slot_ids = model.get_ids(index.team_names)[index.slot_team]
+
+    for i in range(len(signatures), len(index.matches)):
+        curr_match = index.matches[i]
+        start, end = index.get_slots(i)
+        curr_team_matches = index.slot_team_matches[start:end]
+        curr_team_events = index.slot_team_events[start:end]
+        curr_team_years = index.slot_team_years[start:end]
+
+        if isinstance(model, VectorizedEPA) and slot_ids is not None:
+            model.process_slots(
+                curr_match,
+                slot_ids[start:end],
+                index.num_red[i],
+                curr_team_matches,
+                curr_team_events,
+                curr_team_years,
+            )
+        else:
+            teams = [index.team_names[t] for t in index.slot_team[start:end]]
+            model.process_match(
+                curr_match,
+                dict(zip(teams, curr_team_matches)),
+                dict(zip(teams, curr_team_events)),
+                dict(zip(teams, curr_team_years)),
+            )
+
+        if incremental:
+            signatures.append(get_match_signature(curr_match))
+
+    model.end_season()
 
     # Records TeamEvent EPA stats if no matches played yet
     for team_event in team_events.values():
         if team_event.qual_count == 0:
             model.post_record_team(team_event.team, None, team_event, None)
 
+    if isinstance(model, VectorizedEPA) and incremental:
+        checkpoints[year.year] = (model, get_year_signature(year), signatures)
+
     return objs
@@ -1,20 +1,34 @@
 from collections import defaultdict
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from src.constants import CURR_YEAR
 from src.data.epa.agg import process_year as process_year_agg
 from src.data.epa.calc import process_year as process_year_calc
 from src.data.epa.metrics import process_year as process_year_metrics
+from src.data.index import SeasonIndex
 from src.data.utils import objs_type
 from src.db.models import Team, TeamYear
+from src.models.epa.main import EPA
 from src.utils.utils import r
 
 
 # MAIN FUNCTION
 def process_year(
-    objs: objs_type, all_team_years: Dict[int, Dict[str, TeamYear]]
+    objs: objs_type,
+    all_team_years: Dict[int, Dict[str, TeamYear]],
+    incremental: bool = False,
+    prev_objs: Optional[objs_type] = None,
+    index: Optional[SeasonIndex] = None,
+    model: Optional[EPA] = None,
 ) -> objs_type:
-    objs = process_year_calc(objs, all_team_years)
+    objs = process_year_calc(
+        objs,
+        all_team_years,
+        incremental=incremental,
+        prev_objs=prev_objs,
+        index=index,
+        model=model,
+    )
     objs = process_year_agg(objs)
     objs = process_year_metrics(objs)
 
@@ -1,6 +1,4 @@
-import math
-from collections import defaultdict
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, List, Tuple
 
 import numpy as np
 
@@ -10,194 +8,201 @@ from src.db.models import Match
 from src.types.enums import MatchStatus, MatchWinner
 from src.utils.utils import r
 
+# Count, then metrics rounded to 4 places (None if the count is 0), per group
+metrics_type = Tuple[Any, ...]
 
-def get_conf(pred: Any) -> float:
-    return np.maximum(pred, 1 - pred).mean()  # type: ignore
-
-
-def get_acc(pred: Any, actual: Any) -> float:
-    return np.mean((pred > 0.5) == (actual > 0.5))  # type: ignore
+outcome_dict = {
+    MatchWinner.RED: 1,
+    MatchWinner.BLUE: 0,
+    MatchWinner.TIE: 0.5,
+    None: None,
+}
 
 
-def get_mse(pred: Any, actual: Any) -> float:
-    return np.mean((pred - actual) ** 2)  # type: ignore
+def get_column(matches: List[Match], name: str) -> Any:
+    # Nulls as NaN, dropped by get_valid
+    values = [getattr(m, name) for m in matches]
+    return np.array([np.nan if x is None else x for x in values], dtype=float)
 
 
-def get_error(pred: Any, actual: Any) -> float:
-    return np.mean(pred - actual)  # type: ignore
+def get_alliance_column(matches: List[Match], name: str, ids: Any) -> Any:
+    # Red rows then blue rows, name has a {} for the alliance
+    return np.concatenate(
+        [
+            get_column(matches, name.format(alliance))[ids]
+            for alliance in ["red", "blue"]
+        ]
+    )
 
 
-def get_mae(pred: Any, actual: Any) -> float:
-    return np.mean(np.abs(pred - actual))  # type: ignore
+def get_valid(pred: Any, actual: Any, groups: Any) -> Tuple[Any, Any, Any]:
+    valid = ~np.isnan(pred) & ~np.isnan(actual)
+    return pred[valid], actual[valid], groups[valid]
 
 
-def get_rmse(pred: Any, actual: Any) -> float:
-    return math.sqrt(get_mse(pred, actual))
+def get_sums(values: Any, groups: Any, num_groups: int) -> Any:
+    return np.bincount(groups, weights=values.astype(float), minlength=num_groups)
 
 
-def get_ll(pred: Any, actual: Any) -> float:
-    return -np.mean(actual * np.log(pred) + (1 - actual) * np.log(1 - pred))  # type: ignore
+def get_means(values: Any, groups: Any, counts: Any) -> Any:
+    # 0 for empty groups, which to_metrics drops
+    return get_sums(values, groups, len(counts)) / np.maximum(counts, 1)
 
 
-def get_f1(pred: Any, actual: Any) -> float:
-    tp = np.sum(np.logical_and(pred >= 0.5, actual == 1))
-    fp = np.sum(np.logical_and(pred >= 0.5, actual == 0))
-    fn = np.sum(np.logical_and(pred < 0.5, actual == 1))
+def to_metrics(counts: Any, *values: Any) -> List[metrics_type]:
+    out: List[metrics_type] = []
+    for i, count in enumerate(counts.tolist()):
+        if count == 0:
+            out.append((0,) + (None,) * len(values))
+        else:
+            out.append((count,) + tuple(r(float(x[i]), 4) for x in values))
+    return out
 
-    prec = tp / max(1, (tp + fp))
-    rec = tp / max(1, (tp + fn))
-    return 2 * prec * rec / (prec + rec) if prec + rec > 0 else 0
 
+def get_f1(pred: Any, actual: Any, groups: Any, num_groups: int) -> Any:
+    tp = get_sums((pred >= 0.5) & (actual == 1), groups, num_groups)
+    fp = get_sums((pred >= 0.5) & (actual == 0), groups, num_groups)
+    fn = get_sums((pred < 0.5) & (actual == 1), groups, num_groups)
 
-outcome_dict = {
-    MatchWinner.RED: 1,
-    MatchWinner.BLUE: 0,
-    MatchWinner.TIE: 0.5,
-    None: None,
-}
+    prec = tp / np.maximum(1, tp + fp)
+    rec = tp / np.maximum(1, tp + fn)
+    total = np.where(prec + rec > 0, prec + rec, 1)
+    return np.where(prec + rec > 0, 2 * prec * rec / total, 0)
 
 
 def win_prob_metrics(
-    matches: List[Match],
-) -> Tuple[int, Optional[float], Optional[float], Optional[float]]:
-    preds: List[Any] = []
-    actuals: List[Any] = []
-    for match in matches:
-        pred = match.epa_win_prob
-        actual = outcome_dict[match.get_winner()]
-        if actual is None or pred is None:
-            continue
-
-        pred = min(max(pred, EPS), 1 - EPS)
-        preds.append(pred)
-        actuals.append(actual)
-
-    if len(preds) == 0:
-        return 0, None, None, None
-
-    preds = np.array(preds)  # type: ignore
-    actuals = np.array(actuals)  # type: ignore
+    pred: Any, actual: Any, groups: Any, num_groups: int
+) -> List[metrics_type]:
+    # (count, conf, acc, mse) per group
+    pred, actual, groups = get_valid(pred, actual, groups)
+    pred = np.clip(pred, EPS, 1 - EPS)
+    counts = np.bincount(groups, minlength=num_groups)
 
-    conf = get_conf(preds)
-    acc = get_acc(preds, actuals)
-    mse = get_mse(preds, actuals)
-    return len(preds), r(conf, 4), r(acc, 4), r(mse, 4)
+    conf = get_means(np.maximum(pred, 1 - pred), groups, counts)
+    acc = get_means((pred > 0.5) == (actual > 0.5), groups, counts)
+    mse = get_means((pred - actual) ** 2, groups, counts)
+    return to_metrics(counts, conf, acc, mse)
 
 
 def score_metrics(
-    matches: List[Match],
-) -> Tuple[int, Optional[float], Optional[float], Optional[float]]:
-    preds: List[Any] = []
-    actuals: List[Any] = []
-    for match in matches:
-        for pred, actual in [
-            (match.epa_red_score_pred, match.red_score),
-            (match.epa_blue_score_pred, match.blue_score),
-        ]:
-            if actual is None or pred is None:
-                continue
+    pred: Any, actual: Any, groups: Any, num_groups: int
+) -> List[metrics_type]:
+    # (count, error, mae, rmse) per group
+    pred, actual, groups = get_valid(pred, actual, groups)
+    counts = np.bincount(groups, minlength=num_groups)
 
-            preds.append(pred)
-            actuals.append(actual)
-
-    if len(preds) == 0:
-        return 0, None, None, None
-
-    preds = np.array(preds)  # type: ignore
-    actuals = np.array(actuals)  # type: ignore
-
-    error = get_error(preds, actuals)
-    mae = get_mae(preds, actuals)
-    rmse = get_rmse(preds, actuals)
-    return len(preds), r(error, 4), r(mae, 4), r(rmse, 4)
+    error = get_means(pred - actual, groups, counts)
+    mae = get_means(np.abs(pred - actual), groups, counts)
+    rmse = np.sqrt(get_means((pred - actual) ** 2, groups, counts))
+    return to_metrics(counts, error, mae, rmse)
 
 
 def rp_metrics(
-    matches: List[Match], rp: str
-) -> Tuple[int, Optional[float], Optional[float], Optional[float], Optional[float]]:
-    preds: List[Any] = []
-    actuals: List[Any] = []
-    for match in matches:
-        if match.elim:
-            continue
-        for alliance in ["red", "blue"]:
-            pred = getattr(match, f"epa_{alliance}_{rp}_pred")
-            actual = getattr(match, f"{alliance}_{rp}")
+    pred: Any, actual: Any, groups: Any, num_groups: int
+) -> List[metrics_type]:
+    # (count, error, acc, ll, f1) per group
+    pred, actual, groups = get_valid(pred, actual, groups)
+    pred = np.clip(pred, EPS, 1 - EPS)
+    counts = np.bincount(groups, minlength=num_groups)
+
+    error = get_means(pred - actual, groups, counts)
+    acc = get_means((pred > 0.5) == (actual > 0.5), groups, counts)
+    ll = -get_means(
+        actual * np.log(pred) + (1 - actual) * np.log(1 - pred), groups, counts
+    )
+    f1 = get_f1(pred, actual, groups, num_groups)
+    return to_metrics(counts, error, acc, ll, f1)
 
-            if actual is None or pred is None:
-                continue
 
-            pred = min(max(pred, EPS), 1 - EPS)
-            preds.append(pred)
-            actuals.append(actual)
+def process_year(objs: objs_type) -> objs_type:
+    matches = list(objs[4].values())
+    events = list(objs[2].values())
 
-    if len(preds) == 0:
-        return 0, None, None, None, None
+    # One row per (match, group) for the season (0), champs (1) and each event.
+    # Every metric is then one grouped reduction over all groups, so further
+    # breakdowns only add rows.
+    event_groups = {event.key: i + 2 for i, event in enumerate(events)}
+    num_groups = len(events) + 2
 
-    preds = np.array(preds)  # type: ignore
-    actuals = np.array(actuals)  # type: ignore
+    season = np.array(
+        [m.status == MatchStatus.COMPLETED and not m.offseason for m in matches],
+        dtype=bool,
+    )
+    champs = season & (get_column(matches, "week") == 8)
+    event_ids = np.array(
+        [i for i, m in enumerate(matches) if m.event in event_groups], dtype=int
+    )
 
-    error = get_error(preds, actuals)
-    acc = get_acc(preds, actuals)
-    ll = get_ll(preds, actuals)
-    f1 = get_f1(preds, actuals)
-    return len(preds), r(error, 4), r(acc, 4), r(ll, 4), r(f1, 4)
+    ids = np.concatenate([np.flatnonzero(season), np.flatnonzero(champs), event_ids])
+    groups = np.concatenate(
+        [
+            np.zeros(season.sum(), dtype=int),
+            np.ones(champs.sum(), dtype=int),
+            np.array([event_groups[matches[i].event] for i in event_ids], dtype=int),
+        ]
+    )
 
+    outcomes = [outcome_dict[m.get_winner()] for m in matches]
+    win = win_prob_metrics(
+        get_column(matches, "epa_win_prob")[ids],
+        np.array([np.nan if x is None else x for x in outcomes], dtype=float)[ids],
+        groups,
+        num_groups,
+    )
 
-def process_year(objs: objs_type) -> objs_type:
-    matches = list(objs[4].values())
+    score = score_metrics(
+        get_alliance_column(matches, "epa_{}_score_pred", ids),
+        get_alliance_column(matches, "{}_score", ids),
+        np.concatenate([groups, groups]),
+        num_groups,
+    )
 
-    event_matches_dict: Dict[str, List[Match]] = defaultdict(list)
-    for match in matches:
-        event_matches_dict[match.event].append(match)
+    # Qualification matches only
+    qual = ~np.array([bool(m.elim) for m in matches], dtype=bool)[ids]
+    qual_ids, qual_groups = ids[qual], groups[qual]
+    rp_1, rp_2 = [
+        rp_metrics(
+            get_alliance_column(matches, "epa_{}_" + rp + "_pred", qual_ids),
+            get_alliance_column(matches, "{}_" + rp, qual_ids),
+            np.concatenate([qual_groups, qual_groups]),
+            num_groups,
+        )
+        for rp in ["rp_1", "rp_2"]
+    ]
 
     # YEAR
     year = objs[0]
 
-    season_matches = [
-        m for m in matches if m.status == MatchStatus.COMPLETED and not m.offseason
-    ]
-    champs_matches = [m for m in season_matches if m.week == 8]
-    season_qual_matches = [m for m in season_matches if not m.elim]
-    champs_qual_matches = [m for m in champs_matches if not m.elim]
-
-    # win prob
-    year.count, year.epa_conf, year.epa_acc, year.epa_mse = win_prob_metrics(
-        season_matches
-    )
+    year.count, year.epa_conf, year.epa_acc, year.epa_mse = win[0]
     (
         year.champs_count,
         year.epa_champs_conf,
         year.epa_champs_acc,
         year.epa_champs_mse,
-    ) = win_prob_metrics(champs_matches)
+    ) = win[1]
 
-    # score
-    _, year.epa_score_error, year.epa_score_mae, year.epa_score_rmse = score_metrics(
-        season_matches
-    )
+    _, year.epa_score_error, year.epa_score_mae, year.epa_score_rmse = score[0]
     (
         _,
         year.epa_champs_score_error,
         year.epa_champs_score_mae,
         year.epa_champs_score_rmse,
-    ) = score_metrics(champs_matches)
+    ) = score[1]
 
-    # rp
     (
         year.rp_count,
         year.epa_rp_1_error,
         year.epa_rp_1_acc,
         year.epa_rp_1_ll,
         year.epa_rp_1_f1,
-    ) = rp_metrics(season_qual_matches, "rp_1")
+    ) = rp_1[0]
     (
         _,
         year.epa_rp_2_error,
         year.epa_rp_2_acc,
         year.epa_rp_2_ll,
         year.epa_rp_2_f1,
-    ) = rp_metrics(season_qual_matches, "rp_2")
+    ) = rp_2[0]
 
     (
         year.champs_rp_count,
@@ -205,40 +210,39 @@ def process_year(objs: objs_type) -> objs_type:
         year.epa_champs_rp_1_acc,
         year.epa_champs_rp_1_ll,
         year.epa_champs_rp_1_f1,
-    ) = rp_metrics(champs_qual_matches, "rp_1")
+    ) = rp_1[1]
     (
         _,
         year.epa_champs_rp_2_error,
         year.epa_champs_rp_2_acc,
         year.epa_champs_rp_2_ll,
         year.epa_champs_rp_2_f1,
-    ) = rp_metrics(champs_qual_matches, "rp_2")
+    ) = rp_2[1]
 
     # EVENTS
 
-    for event in objs[2].values():
-        ms = event_matches_dict[event.key]
-        qual_ms = [m for m in ms if not m.elim]
-        event.count, event.epa_conf, event.epa_acc, event.epa_mse = win_prob_metrics(ms)
+    for event in events:
+        i = event_groups[event.key]
+        event.count, event.epa_conf, event.epa_acc, event.epa_mse = win[i]
         (
             _,
             event.epa_score_error,
             event.epa_score_mae,
             event.epa_score_rmse,
-        ) = score_metrics(ms)
+        ) = score[i]
         (
             event.rp_count,
             event.epa_rp_1_error,
             event.epa_rp_1_acc,
             event.epa_rp_1_ll,
             event.epa_rp_1_f1,
-        ) = rp_metrics(qual_ms, "rp_1")
+        ) = rp_1[i]
         (
             _,
             event.epa_rp_2_error,
             event.epa_rp_2_acc,
             event.epa_rp_2_ll,
             event.epa_rp_2_f1,
-        ) = rp_metrics(qual_ms, "rp_2")
+        ) = rp_2[i]
 
     return objs
@@ -0,0 +1,78 @@
+from operator import attrgetter
+from typing import Any, List, Type
+
+import pyarrow as pa  # type: ignore
+from sqlalchemy import Boolean, Enum, Float, Integer, String
+
+from src.data.utils import objs_type
+from src.db.archive import TABLES, get_export_name
+from src.db.models.main import Model, ModelORM
+from src.utils.storage import write_bytes
+
+MEDIA_TYPE = "application/vnd.apache.arrow.file"
+
+# Table name to index into objs_type
+OBJS_INDEX = {
+    "years": 0,
+    "team_years": 1,
+    "events": 2,
+    "team_events": 3,
+    "matches": 4,
+    "team_matches": 5,
+}
+
+
+def get_arrow_type(column: Any) -> Any:
+    # Strings (team, event and match keys, names, enums) repeat heavily
+    if isinstance(column.type, (String, Enum)):
+        return pa.dictionary(pa.int32(), pa.string())
+    if isinstance(column.type, Boolean):
+        return pa.bool_()
+    if isinstance(column.type, Integer):
+        return pa.int64()
+    if isinstance(column.type, Float):
+        return pa.float64()
+    raise Exception("Unknown column type: " + str(column.type))
+
+
+def get_schema(orm_type: Type[ModelORM]) -> Any:
+    columns = orm_type.__table__.columns
+    return pa.schema(
+        [pa.field(c.name, get_arrow_type(c), nullable=c.nullable) for c in columns]
+    )
+
+
+def to_arrow(orm_type: Type[ModelORM], items: List[Model]) -> Any:
+    # Rows in primary key order, as the DB returns them without a sort
+    table = orm_type.__table__
+    primary_key = attrgetter(*[c.name for c in table.primary_key])
+    items = sorted(items, key=primary_key)
+
+    schema = get_schema(orm_type)
+    rows = [item.get_values() for item in items]
+    arrays: List[Any] = []
+    for i, (field, column) in enumerate(zip(schema, table.columns)):
+        values = [row[i] for row in rows]
+        if isinstance(column.type, Enum):
+            values = [getattr(x, "value", x) for x in values]
+        if pa.types.is_dictionary(field.type):
+            arrays.append(pa.array(values, pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(values, field.type))
+
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def write_arrow(name: str, table: Any) -> None:
+    # Uncompressed IPC file, readable with pyarrow.memory_map without copies
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    write_bytes(name, sink.getvalue().to_pybytes(), MEDIA_TYPE)
+
+
+def export_year(year_num: int, objs: objs_type) -> None:
+    for name, (orm_type, _) in TABLES.items():
+        i = OBJS_INDEX[name]
+        items = [objs[0]] if i == 0 else list(objs[i].values())  # type: ignore
+        write_arrow(get_export_name(year_num, name), to_arrow(orm_type, items))
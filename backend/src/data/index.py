@@ -0,0 +1,119 @@
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from src.data.utils import objs_type
+from src.db.models import Match, TeamEvent, TeamMatch, TeamYear
+from src.types.enums import MatchStatus, MatchWinner
+
+RED, BLUE, TIE, NO_WINNER = 0, 1, 2, -1
+WINNER_CODES = {MatchWinner.RED: RED, MatchWinner.BLUE: BLUE, MatchWinner.TIE: TIE}
+
+
+class SeasonIndex:
+    """
+    Integer ids for a season's teams, team events and matches, built in one
+    pass. Matches are sorted by time. Each match owns a contiguous range of
+    slots (red teams, then blue teams), and each slot maps to its team id,
+    TeamMatch, TeamEvent and TeamYear, so replays never format or hash keys.
+    """
+
+    def __init__(self, objs: objs_type):
+        self.team_years: List[TeamYear] = list(objs[1].values())
+        self.team_names: List[str] = [ty.team for ty in self.team_years]
+        self.team_ids: Dict[str, int] = {t: i for i, t in enumerate(self.team_names)}
+
+        self.team_events: List[TeamEvent] = list(objs[3].values())
+        team_event_ids: Dict[Tuple[str, str], int] = {
+            (te.team, te.event): i for i, te in enumerate(self.team_events)
+        }
+
+        match_team_matches: Dict[str, Dict[str, TeamMatch]] = defaultdict(dict)
+        for tm in objs[5].values():
+            match_team_matches[tm.match][tm.team] = tm
+
+        self.matches: List[Match] = sorted(objs[4].values(), key=lambda m: m.time)
+        self.match_ids: Dict[str, int] = {m.key: i for i, m in enumerate(self.matches)}
+
+        slot_start: List[int] = [0]
+        num_red: List[int] = []
+        slot_team: List[int] = []
+        slot_team_event: List[int] = []
+        slot_alliance: List[int] = []
+        slot_position: List[int] = []
+        slot_excluded: List[bool] = []
+        self.slot_team_matches: List[TeamMatch] = []
+        self.slot_team_events: List[TeamEvent] = []
+        self.slot_team_years: List[TeamYear] = []
+
+        for match in self.matches:
+            red, blue = match.get_red(), match.get_blue()
+            # DQ, surrogate teams are excluded from TeamEvent records
+            excluded = set(
+                match.get_red_dqs()
+                + match.get_blue_dqs()
+                + match.get_red_surrogates()
+                + match.get_blue_surrogates()
+            )
+            team_matches = match_team_matches[match.key]
+            for alliance, teams in [(RED, red), (BLUE, blue)]:
+                for position, team in enumerate(teams):
+                    team_id = self.team_ids[team]
+                    team_event_id = team_event_ids[(team, match.event)]
+                    slot_team.append(team_id)
+                    slot_team_event.append(team_event_id)
+                    slot_alliance.append(alliance)
+                    slot_position.append(position)
+                    slot_excluded.append(team in excluded)
+                    self.slot_team_matches.append(team_matches[team])
+                    self.slot_team_events.append(self.team_events[team_event_id])
+                    self.slot_team_years.append(self.team_years[team_id])
+            num_red.append(len(red))
+            slot_start.append(len(slot_team))
+
+        self.slot_start = np.array(slot_start, dtype=int)
+        self.num_red = np.array(num_red, dtype=int)
+        self.slot_team = np.array(slot_team, dtype=int)
+        self.slot_team_event = np.array(slot_team_event, dtype=int)
+        self.slot_alliance = np.array(slot_alliance, dtype=int)
+        self.slot_position = np.array(slot_position, dtype=int)
+        self.slot_excluded = np.array(slot_excluded, dtype=bool)
+        self.slot_match = np.repeat(np.arange(len(self.matches)), np.diff(slot_start))
+
+    def get_slots(self, match_id: int) -> Tuple[int, int]:
+        return self.slot_start[match_id], self.slot_start[match_id + 1]
+
+    def replace_match(
+        self, match_id: int, match: Match, team_matches: Dict[str, TeamMatch]
+    ) -> None:
+        # Swaps in equivalent objects (same teams), e.g. a previous run's outputs
+        self.matches[match_id] = match
+        start, end = self.get_slots(match_id)
+        for i in range(start, end):
+            team = self.team_names[self.slot_team[i]]
+            self.slot_team_matches[i] = team_matches[team]
+
+    def get_match_arrays(self) -> Dict[str, Any]:
+        # Per match columns used by aggregate passes (wins, metrics)
+        matches = self.matches
+        return {
+            "completed": np.array(
+                [
+                    m.status == MatchStatus.COMPLETED and m.winner is not None
+                    for m in matches
+                ],
+                dtype=bool,
+            ),
+            "winner": np.array(
+                [WINNER_CODES.get(m.winner, NO_WINNER) for m in matches], dtype=int
+            ),
+            "elim": np.array([m.elim for m in matches], dtype=bool),
+            "offseason": np.array([m.offseason for m in matches], dtype=bool),
+            "rp_1": np.array(
+                [[m.red_rp_1 or 0, m.blue_rp_1 or 0] for m in matches], dtype=int
+            ).reshape(-1, 2),
+            "rp_2": np.array(
+                [[m.red_rp_2 or 0, m.blue_rp_2 or 0] for m in matches], dtype=int
+            ).reshape(-1, 2),
+        }
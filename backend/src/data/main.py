@@ -1,24 +1,34 @@
 from collections import defaultdict
-from copy import deepcopy
-from typing import Dict, List, Optional
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from multiprocessing import get_context
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from src.constants import CURR_YEAR
+from src.constants import CURR_YEAR, REBUILD_WORKERS
 from src.data.avg import process_year as process_year_avg
 from src.data.colors import post_process as post_process_colors
+from src.data.epa.calc import clear_checkpoint as clear_checkpoint_epa
 from src.data.epa.main import (
     post_process as post_process_epa,
     process_year as process_year_epa,
 )
+from src.data.export import export_year
+from src.data.index import SeasonIndex
+from src.data.noteworthy import write_leaderboards
 from src.data.tba import (
     load_teams as load_teams_tba,
     post_process as post_process_tba,
     process_year as process_year_tba,
 )
+from src.data.upcoming import write_upcoming
 from src.data.utils import (
     Timer,
+    copy_objs,
     create_objs,
     objs_type,
     read_objs as read_objs_db,
+    snapshot_objs,
+    snapshot_type,
     write_objs as write_objs_db,
 )
 from src.data.wins import (
@@ -33,27 +43,27 @@ from src.db.read import (
     get_teams as get_teams_db,
 )
 from src.db.write.main import update_teams as update_teams_db
+from src.tba.cache import (
+    clear_preload as clear_preload_cache_tba,
+    preload as preload_cache_tba,
+)
 
 
-def process_year(
+def prepare_year(
     year_num: int,
     partial: bool,
     cache: bool,
     teams: List[Team],
     objs: objs_type,
-    all_team_years: Optional[Dict[int, Dict[str, TeamYear]]],
-) -> List[Team]:
+) -> Tuple[List[Team], objs_type, SeasonIndex]:
+    # TBA, averages and wins only read the year's own data
     timer = Timer()
-    orig_objs = deepcopy(objs)
-    if all_team_years is None:
-        all_team_years = defaultdict(dict)
-        for year in range(max(2002, year_num - 4), year_num):
-            team_years = get_team_years_db(year=year, offseason=None)
-            for ty in team_years:
-                all_team_years[ty.year][ty.team] = ty
+    if cache:
+        # One read for the year's cached responses instead of one per request
+        preload_cache_tba(year_num)
 
     new_teams, objs = process_year_tba(year_num, teams, objs, partial, cache)
-    teams += new_teams
+    clear_preload_cache_tba()
     timer.print(str(year_num) + " TBA")
 
     year_obj = process_year_avg(objs[0], list(objs[4].values()))
@@ -61,15 +71,90 @@ def process_year(
 
     objs = (year_obj, *objs[1:])
 
-    objs = process_year_wins(objs)
+    # Match to team slots, shared by the wins and EPA passes
+    index = SeasonIndex(objs)
+
+    objs = process_year_wins(objs, index)
     timer.print(str(year_num) + " Wins")
 
-    objs = process_year_epa(objs, all_team_years)
-    timer.print(str(year_num) + " EPA")
+    return new_teams, objs, index
 
-    write_objs_db(year_num, objs, orig_objs if partial else None, not partial)
+
+def prepare_year_worker(
+    year_num: int, teams: List[Team]
+) -> Tuple[List[Team], objs_type]:
+    # Runs in a spawned process, the index is rebuilt rather than pickled
+    new_teams, objs, _ = prepare_year(
+        year_num, False, True, teams, create_objs(year_num)
+    )
+    return new_teams, objs
+
+
+def publish(label: str, func: Callable[..., None], *args: Any) -> None:
+    # Files derived from the written DB rows (see utils/storage.py). A failure
+    # leaves the API on the previous copy or the DB path, so it is logged
+    # rather than failing the update, and the next update rewrites them.
+    try:
+        func(*args)
+    except Exception as e:
+        print(label, "failed:", repr(e))
+
+
+def write_year(
+    year_num: int,
+    objs: objs_type,
+    orig_objs: Optional[snapshot_type],
+    insert: bool,
+) -> None:
+    timer = Timer()
+    try:
+        write_objs_db(year_num, objs, orig_objs, insert)
+    except Exception:
+        # Checkpoint would be ahead of the DB, next update replays the season
+        clear_checkpoint_epa(year_num)
+        raise
     timer.print(str(year_num) + " Write")
 
+    publish(str(year_num) + " Export", export_year, year_num, objs)
+    timer.print(str(year_num) + " Export")
+
+    publish(str(year_num) + " Leaderboards", write_leaderboards, year_num, objs)
+    timer.print(str(year_num) + " Leaderboards")
+
+    if year_num == CURR_YEAR:
+        publish(str(year_num) + " Upcoming", write_upcoming, objs)
+        timer.print(str(year_num) + " Upcoming")
+
+
+def process_year(
+    year_num: int,
+    partial: bool,
+    cache: bool,
+    teams: List[Team],
+    objs: objs_type,
+    all_team_years: Optional[Dict[int, Dict[str, TeamYear]]],
+) -> List[Team]:
+    orig_objs = snapshot_objs(objs) if partial else None
+    prev_objs = copy_objs(objs) if partial else None
+    if all_team_years is None:
+        all_team_years = defaultdict(dict)
+        for year in range(max(2002, year_num - 4), year_num):
+            team_years = get_team_years_db(year=year, offseason=None)
+            for ty in team_years:
+                all_team_years[ty.year][ty.team] = ty
+
+    new_teams, objs, index = prepare_year(year_num, partial, cache, teams, objs)
+    teams += new_teams
+
+    timer = Timer()
+    # Live season keeps EPA state in memory, partial updates replay new matches
+    objs = process_year_epa(
+        objs, all_team_years, year_num == CURR_YEAR, prev_objs, index
+    )
+    timer.print(str(year_num) + " EPA")
+
+    write_year(year_num, objs, orig_objs, not partial)
+
     return teams
 
 
@@ -102,7 +187,7 @@ def post_process(
         update_colors()
 
 
-def reset_all_years():
+def reset_all_years(workers: int = REBUILD_WORKERS):
     timer = Timer()
 
     start_year = 2002
@@ -121,14 +206,52 @@ def reset_all_years():
     teams = load_teams_tba(cache=True)
     timer.print("Load Teams")
 
-    all_team_years: Dict[int, Dict[str, TeamYear]] = {}
-    for year_num in range(start_year, end_year + 1):
-        objs = create_objs(year_num)
-        if year_num == 2021:
-            continue
+    years = [year for year in range(start_year, end_year + 1) if year != 2021]
+    base_teams = list(teams)
+    team_keys = set(team.team for team in teams)
 
-        teams = process_year(year_num, False, True, teams, objs, all_team_years)
-        all_team_years[year_num] = {ty.team: ty for ty in objs[1].values()}
+    # TBA, averages and wins run ahead in spawned processes (no inherited DB or
+    # SQLite connections). Only EPA depends on prior years, so it runs here in
+    # order, and each year's write overlaps the next year's EPA
+    all_team_years: Dict[int, Dict[str, TeamYear]] = {}
+    with ProcessPoolExecutor(
+        workers, mp_context=get_context("spawn")
+    ) as pool, ThreadPoolExecutor(1) as writer:
+        # Bounded lookahead, finished years are held in memory until EPA
+        queued = iter(years)
+        futures: Dict[int, Future[Tuple[List[Team], objs_type]]] = {
+            year_num: pool.submit(prepare_year_worker, year_num, base_teams)
+            for year_num in islice(queued, workers + 1)
+        }
+        write: Optional[Future[None]] = None
+        for year_num in years:
+            new_teams, objs = futures.pop(year_num).result()
+            next_year = next(queued, None)
+            if next_year is not None:
+                futures[next_year] = pool.submit(
+                    prepare_year_worker, next_year, base_teams
+                )
+
+            # Years discover the same new teams, keeps the first
+            for team in new_teams:
+                if team.team not in team_keys:
+                    team_keys.add(team.team)
+                    teams.append(team)
+
+            year_timer = Timer()
+            objs = process_year_epa(objs, all_team_years, year_num == CURR_YEAR)
+            year_timer.print(str(year_num) + " EPA")
+            all_team_years[year_num] = {ty.team: ty for ty in objs[1].values()}
+
+            # One write in flight, years land in order
+            if write is not None:
+                write.result()
+            write = writer.submit(write_year, year_num, objs, None, True)
+
+        if write is not None:
+            write.result()
+
+    timer.print("Process Years")
 
     post_process(teams, all_team_years, colors=True)
 
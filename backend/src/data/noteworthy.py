@@ -0,0 +1,153 @@
+import gzip
+import json
+from itertools import product
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from src.data.utils import objs_type
+from src.db.functions.noteworthy_matches import (
+    LEADERBOARDS_VERSION,
+    bucket_type,
+    get_categories,
+    get_leaderboards_name,
+    leaderboards_type,
+)
+from src.db.models.match import Match
+from src.types.enums import MatchStatus
+from src.utils.storage import write_bytes
+
+# Matches kept per leaderboard, as the site shows
+NUM_MATCHES = 30
+
+
+def get_array(matches: List[Match], name: str) -> Any:
+    # Nulls as NaN, which fmax and fmin skip like SQL greatest and least
+    values = [getattr(m, name) for m in matches]
+    return np.array([np.nan if x is None else x for x in values], dtype=float)
+
+
+def get_metrics(year_num: int, matches: List[Match]) -> Dict[str, Any]:
+    score = "score" if year_num < 2016 else "no_foul"
+    red, blue = get_array(matches, "red_" + score), get_array(matches, "blue_" + score)
+    out = {
+        "high_score": np.fmax(red, blue),
+        "combined_score": red + blue,
+        "losing_score": np.fmin(
+            get_array(matches, "red_score"), get_array(matches, "blue_score")
+        ),
+    }
+    if year_num >= 2016:
+        for name in ["auto", "teleop", "endgame"]:
+            out["high_" + name + "_score"] = np.fmax(
+                get_array(matches, "red_" + name), get_array(matches, "blue_" + name)
+            )
+    return out
+
+
+def get_codes(values: List[Any]) -> Any:
+    # 0 is reserved for an unset filter
+    _, inverse = np.unique(
+        np.array(values, dtype=object).astype(str), return_inverse=True
+    )
+    return inverse + 1
+
+
+def build_leaderboards(year_num: int, objs: objs_type) -> leaderboards_type:
+    # Top matches of each category for every combination of the site's
+    # filters, from one sort per category over all combinations at once
+    events = objs[2]
+    matches = sorted(
+        [
+            m
+            for m in objs[4].values()
+            if m.status == MatchStatus.COMPLETED
+            and not m.offseason
+            and m.event in events
+        ],
+        key=lambda m: m.key,
+    )
+    if len(matches) == 0:
+        return {}
+
+    match_events = [events[m.event] for m in matches]
+    fields: List[List[Any]] = [
+        [e.country for e in match_events],
+        [e.state for e in match_events],
+        [e.district or "regionals" for e in match_events],
+        [m.elim for m in matches],
+        [e.week for e in match_events],
+    ]
+
+    # Every combination of set and unset filters, one bucket code per match each
+    codes = [get_codes(values) for values in fields]
+    sizes = [int(c.max()) + 1 for c in codes]
+    bucket_codes: List[Any] = []
+    for used in product([False, True], repeat=len(fields)):
+        code = np.zeros(len(matches), dtype=np.int64)
+        for is_used, field_codes, size in zip(used, codes, sizes):
+            code = code * size + (field_codes if is_used else 0)
+        bucket_codes.append(code)
+
+    all_codes = np.concatenate(bucket_codes)
+    ids = np.tile(np.arange(len(matches)), len(bucket_codes))
+    uniques, groups = np.unique(all_codes, return_inverse=True)
+
+    # Bucket filters from any match in the bucket, unset where the code is 0.
+    # A filter set to a missing value (ex: no state) is never queried.
+    members = np.zeros(len(uniques), dtype=np.int64)
+    members[groups] = ids
+    buckets: List[Optional[bucket_type]] = []
+    for unique, member in zip(uniques.tolist(), members.tolist()):
+        filters: List[Any] = []
+        for field, size in reversed(list(zip(fields, sizes))):
+            filters.append(field[member] if unique % size > 0 else None)
+            missing = unique % size > 0 and field[member] is None
+            unique //= size
+            if missing:
+                break
+        buckets.append(None if missing else tuple(filters[::-1]))  # type: ignore
+
+    # Ties by time, then key (the order matches were sorted in)
+    times = np.array([m.time for m in matches], dtype=float)[ids]
+    out: Dict[bucket_type, Dict[str, List[Match]]] = {
+        bucket: {} for bucket in buckets if bucket is not None
+    }
+    for category, metric in get_metrics(year_num, matches).items():
+        values = np.nan_to_num(metric, nan=-np.inf)[ids]
+        order = np.lexsort((ids, times, -values, groups))
+        sorted_groups = groups[order]
+        starts = np.searchsorted(sorted_groups, sorted_groups, "left")
+        keep = order[np.arange(len(order)) - starts < NUM_MATCHES]
+        for group, i in zip(groups[keep].tolist(), ids[keep].tolist()):
+            bucket = buckets[group]
+            if bucket is not None:
+                out[bucket].setdefault(category, []).append(matches[i])
+
+    return {
+        bucket: {k: v[k] for k in get_categories(year_num)} for bucket, v in out.items()
+    }
+
+
+def encode_leaderboards(leaderboards: leaderboards_type) -> bytes:
+    # Matches by column name, each once, buckets refer to them by position.
+    # Read by API instances that may run an older or newer Match model.
+    ids: Dict[str, int] = {}
+    matches: List[Dict[str, Any]] = []
+    buckets: List[Any] = []
+    for bucket, categories in leaderboards.items():
+        out: Dict[str, List[int]] = {}
+        for category, items in categories.items():
+            for match in items:
+                if match.key not in ids:
+                    ids[match.key] = len(matches)
+                    matches.append(match.to_json())
+            out[category] = [ids[match.key] for match in items]
+        buckets.append([list(bucket), out])
+    data = {"version": LEADERBOARDS_VERSION, "matches": matches, "buckets": buckets}
+    return gzip.compress(json.dumps(data).encode())
+
+
+def write_leaderboards(year_num: int, objs: objs_type) -> None:
+    data = encode_leaderboards(build_leaderboards(year_num, objs))
+    write_bytes(get_leaderboards_name(year_num), data, "application/gzip")
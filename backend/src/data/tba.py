@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
-from typing import Callable, Dict, List, Optional, Set, Tuple, TypeVar
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar
 
 from src.constants import CURR_WEEK, CURR_YEAR
 from src.data.utils import objs_type
@@ -10,6 +11,7 @@ from src.db.functions import (
 )
 from src.db.models import ETag, Event, Team, TeamEvent, TeamYear, match_dict_to_objs
 from src.tba.constants import DISTRICT_MAPPING, PLACEHOLDER_TEAMS
+from src.tba.main import any_tba, map_tba
 from src.tba.read_tba import (
     EventDict,
     MatchDict,
@@ -88,6 +90,11 @@ MAIN FUNCTIONS
 """
 
 
+def is_new_etag(prev_etag: str, func: Callable[[], Tuple[Any, OS]]) -> bool:
+    _, new_etag = func()
+    return new_etag != prev_etag and new_etag is not None
+
+
 def check_year_partial(
     year_num: int, event_objs: List[Event], etags: List[ETag]
 ) -> bool:
@@ -99,6 +106,8 @@ def check_year_partial(
     if new_etag != prev_etag:
         return True  # If any new events
 
+    # Conditional requests for every live event, issued concurrently
+    checks: List[Callable[[], bool]] = []
     for event_obj in event_objs:
         if event_obj.status == EventStatus.COMPLETED:
             continue
@@ -111,8 +120,10 @@ def check_year_partial(
         if end_date + timedelta(days=1) < datetime.now():
             continue
 
+        # If any event has new matches
         prev_etag = etags_dict.get(event_obj.key + "/matches", default_etag).etag
-        _, new_etag = get_event_matches_tba(
+        get_matches = partial(
+            get_event_matches_tba,
             year_num,
             event_obj.key,
             event_obj.offseason,
@@ -120,27 +131,30 @@ def check_year_partial(
             prev_etag,
             cache=False,
         )
-        if new_etag != prev_etag and new_etag is not None:
-            return True  # If any event has new matches, return True
+        checks.append(partial(is_new_etag, prev_etag, get_matches))
 
         if event_obj.status == EventStatus.UPCOMING:
             continue
 
+        # If any event has new rankings
         prev_etag = etags_dict.get(event_obj.key + "/rankings", default_etag).etag
-        _, new_etag = get_event_rankings_tba(event_obj.key, prev_etag, cache=False)
-        if new_etag != prev_etag and new_etag is not None:
-            return True  # If any event has new rankings, return True
+        get_rankings = partial(
+            get_event_rankings_tba, event_obj.key, prev_etag, cache=False
+        )
+        checks.append(partial(is_new_etag, prev_etag, get_rankings))
 
         qual_matches = event_obj.qual_matches or 0
         current_match = event_obj.current_match or 0
         if qual_matches == 0 or current_match < qual_matches:
             continue
 
-        _, new_etag = get_event_alliances_tba(event_obj.key, prev_etag, cache=False)
-        if new_etag != prev_etag and new_etag is not None:
-            return True  # If any event has new alliances, return True
+        # If any event has new alliances
+        get_alliances = partial(
+            get_event_alliances_tba, event_obj.key, prev_etag, cache=False
+        )
+        checks.append(partial(is_new_etag, prev_etag, get_alliances))
 
-    return False  # Otherwise return False
+    return any_tba(checks)
 
 
 def process_year(
@@ -199,17 +213,22 @@ def process_year(
 
         districts, _ = call_tba(get_districts_tba_year, str(year_num) + "/districts")
 
-        for district_key, district_abbrev in districts:
-            district_teams, _ = get_district_teams_tba(district_key, cache=cache)
+        district_data = map_tba(
+            lambda district: (
+                get_district_teams_tba(district[0], cache=cache)[0],
+                get_district_rankings_tba(district[0], cache=cache)[0],
+            ),
+            districts,
+        )
+
+        for (_, district_abbrev), (district_teams, district_rankings) in zip(
+            districts, district_data
+        ):
             for team in district_teams:
                 team_to_district[team] = DISTRICT_MAPPING.get(
                     district_abbrev, district_abbrev
                 )
-            (
-                team_to_points,
-                team_to_rank,
-                team_event_to_points,
-            ), _ = get_district_rankings_tba(district_key, cache=cache)
+            team_to_points, team_to_rank, team_event_to_points = district_rankings
             for team in team_to_points:
                 team_to_district_points[team] = team_to_points[team]
                 team_to_district_rank[team] = team_to_rank[team]
@@ -244,11 +263,15 @@ def process_year(
             status=curr_status,
         )
 
-    for event_obj in event_objs_dict.values():
-        if partial:
-            if event_obj.week != CURR_WEEK and event_obj.status != EventStatus.ONGOING:
-                continue
-
+    def fetch_event(
+        event_obj: Event,
+    ) -> Tuple[
+        List[MatchDict],
+        EventStatus,
+        List[str],
+        Dict[str, int],
+        Tuple[Dict[str, str], Dict[str, bool]],
+    ]:
         event_key, event_time = event_obj.key, event_obj.time
 
         def get_event_matches_tba_year(
@@ -261,12 +284,62 @@ def process_year(
 
         matches, _ = call_tba(get_event_matches_tba_year, event_key + "/matches")
         event_status = get_event_status(matches, year_num)
+
+        event_teams: List[str] = []
+        rankings: Dict[str, int] = {}
+        alliances: Tuple[Dict[str, str], Dict[str, bool]] = ({}, {})
+
+        if event_status == EventStatus.UPCOMING:
+
+            def get_event_teams_tba_year(etag: OS, cache: bool) -> Tuple[List[str], OS]:
+                return get_event_teams_tba(event_key, etag, cache)
+
+            event_teams, _ = call_tba(get_event_teams_tba_year, event_key + "/teams")
+
+        elif event_status in [EventStatus.ONGOING, EventStatus.COMPLETED]:
+
+            def get_event_rankings_tba_year(
+                etag: OS, cache: bool
+            ) -> Tuple[Dict[str, int], OS]:
+                # TODO: use etag to avoid querying every time (needed to get rankings)
+                return get_event_rankings_tba(event_key, None, cache)
+
+            rankings, _ = call_tba(get_event_rankings_tba_year, event_key + "/rankings")
+
+            def get_event_alliances_tba_year(
+                etag: OS, cache: bool
+            ) -> Tuple[Tuple[Dict[str, str], Dict[str, bool]], OS]:
+                # TODO: use etag to avoid querying every time (needed to get alliances)
+                return get_event_alliances_tba(event_key, None, cache)
+
+            alliances, _ = call_tba(
+                get_event_alliances_tba_year, event_key + "/alliances"
+            )
+
+        return matches, event_status, event_teams, rankings, alliances
+
+    fetch_event_objs = [
+        event_obj
+        for event_obj in event_objs_dict.values()
+        if not partial
+        or event_obj.week == CURR_WEEK
+        or event_obj.status == EventStatus.ONGOING
+    ]
+
+    # Fetches events concurrently, then processes them in order
+    event_data = map_tba(fetch_event, fetch_event_objs)
+
+    for event_obj, (
+        matches,
+        event_status,
+        tba_event_teams,
+        rankings,
+        (alliance_dict, captain_dict),
+    ) in zip(fetch_event_objs, event_data):
+        event_key, event_time = event_obj.key, event_obj.time
         event_obj.status = event_status
 
         event_teams: Set[str] = set()
-        rankings: Dict[str, int] = {}
-        alliance_dict: Dict[str, str] = {}
-        captain_dict: Dict[str, bool] = {}
 
         def add_team_event(team: str, offseason: bool):
             event_teams.add(team)
@@ -303,15 +376,7 @@ def process_year(
             continue
 
         elif event_status == EventStatus.UPCOMING:
-
-            def get_event_teams_tba_year(etag: OS, cache: bool) -> Tuple[List[str], OS]:
-                return get_event_teams_tba(event_key, etag, cache)
-
-            temp_event_teams, _ = call_tba(
-                get_event_teams_tba_year, event_key + "/teams"
-            )
-
-            for team in temp_event_teams:
+            for team in tba_event_teams:
                 add_team_event(team, event_obj.offseason)
 
         elif event_status in [EventStatus.ONGOING, EventStatus.COMPLETED]:
@@ -327,24 +392,6 @@ def process_year(
                     add_team_event(team_match_obj.team, event_obj.offseason)
                     team_match_objs_dict[team_match_obj.pk()] = team_match_obj
 
-            def get_event_rankings_tba_year(
-                etag: OS, cache: bool
-            ) -> Tuple[Dict[str, int], OS]:
-                # TODO: use etag to avoid querying every time (needed to get rankings)
-                return get_event_rankings_tba(event_key, None, cache)
-
-            rankings, _ = call_tba(get_event_rankings_tba_year, event_key + "/rankings")
-
-            def get_event_alliances_tba_year(
-                etag: OS, cache: bool
-            ) -> Tuple[Tuple[Dict[str, str], Dict[str, bool]], OS]:
-                # TODO: use etag to avoid querying every time (needed to get alliances)
-                return get_event_alliances_tba(event_key, None, cache)
-
-            (alliance_dict, captain_dict), _ = call_tba(
-                get_event_alliances_tba_year, event_key + "/alliances"
-            )
-
         # For Upcoming, Ongoing, and Completed events
         for team in event_teams:
             if team not in teams_dict:
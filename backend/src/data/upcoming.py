@@ -0,0 +1,42 @@
+import gzip
+import json
+from typing import List
+
+from src.data.utils import objs_type
+from src.db.functions.upcoming_matches import (
+    UPCOMING_VERSION,
+    entry_type,
+    get_upcoming_name,
+)
+from src.types.enums import MatchStatus
+from src.utils.storage import write_bytes
+
+
+def build_upcoming(objs: objs_type) -> List[entry_type]:
+    events = objs[2]
+    entries: List[entry_type] = []
+    for match in objs[4].values():
+        event = events.get(match.event)
+        if (
+            event is None
+            or match.status != MatchStatus.UPCOMING
+            or match.predicted_time is None
+        ):
+            continue
+        entries.append((match, event.name, event.country, event.state, event.district))
+    return sorted(entries, key=lambda x: (x[0].predicted_time, x[0].key))
+
+
+def encode_upcoming(entries: List[entry_type]) -> bytes:
+    # Matches by column name, read by API instances that may run an older or
+    # newer Match model
+    data = {
+        "version": UPCOMING_VERSION,
+        "entries": [[x[0].to_json(), *x[1:]] for x in entries],
+    }
+    return gzip.compress(json.dumps(data).encode())
+
+
+def write_upcoming(objs: objs_type) -> None:
+    data = encode_upcoming(build_upcoming(objs))
+    write_bytes(get_upcoming_name(), data, "application/gzip")
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.db.functions import clear_year
 from src.db.models import ETag, Event, Match, TeamEvent, TeamMatch, TeamYear, Year
@@ -40,6 +40,18 @@ objs_type = Tuple[
     Dict[str, ETag],
 ]
 
+# Column values per object (see Model.get_values), keyed by primary key
+values_type = Dict[str, Tuple[Any, ...]]
+snapshot_type = Tuple[
+    Tuple[Any, ...],
+    values_type,
+    values_type,
+    values_type,
+    values_type,
+    values_type,
+    values_type,
+]
+
 
 def create_objs(year: int) -> objs_type:
     return (Year(year=year), {}, {}, {}, {}, {}, {})
@@ -61,10 +73,23 @@ def read_objs(year: int) -> objs_type:
     )
 
 
+def copy_objs(objs: objs_type) -> objs_type:
+    # Shallow copy, keeps objects that are later replaced (not mutated)
+    return (objs[0], *[dict(x) for x in objs[1:]])  # type: ignore
+
+
+def snapshot_objs(objs: objs_type) -> snapshot_type:
+    # Replaces a deepcopy for diffing, shares the (immutable) column values
+    return (
+        objs[0].get_values(),
+        *[{k: v.get_values() for k, v in x.items()} for x in objs[1:]],
+    )  # type: ignore
+
+
 def write_objs(
     year_num: int,
     objs: objs_type,
-    orig_objs: Optional[objs_type] = None,
+    orig_objs: Optional[snapshot_type] = None,
     clean: bool = False,
 ) -> None:
     if clean:
@@ -72,7 +97,7 @@ def write_objs(
 
     if orig_objs is None:
         # Ensure that all objects are updated
-        orig_objs = create_objs(-1)
+        orig_objs = snapshot_objs(create_objs(-1))
 
     update_years_db([objs[0]], clean)
 
@@ -84,13 +109,22 @@ def write_objs(
         (orig_objs[5], objs[5], update_team_matches_db),
         (orig_objs[6], objs[6], update_etags_db),
     ]:
-        new_objs = [
-            obj
-            for obj in list(curr.values())
-            if str(obj) != str(prev.get(obj.pk(), ""))
-        ]
-
-        update_func(new_objs, clean)  # type: ignore
+        new_objs: List[Any] = []
+        columns: List[Optional[List[str]]] = []
+        for obj in curr.values():
+            prev_values = prev.get(obj.pk(), None)
+            if prev_values is None:
+                new_objs.append(obj)
+                columns.append(None)
+                continue
+
+            # Writes only the changed columns of existing rows
+            changed_fields = obj.get_changed_fields(prev_values)
+            if obj.needs_refresh(changed_fields):
+                new_objs.append(obj)
+                columns.append(changed_fields)
+
+        update_func(new_objs, clean, columns)  # type: ignore
 
 
 def print_table_stats() -> None:
@@ -1,10 +1,13 @@
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from src.constants import CURR_YEAR
+from src.data.index import TIE, SeasonIndex
 from src.data.utils import objs_type
 from src.db.models import Team, TeamYear, TeamEvent, Match
-from src.types.enums import MatchStatus, MatchWinner
+from src.types.enums import MatchStatus
 from src.utils.utils import r
 
 
@@ -16,88 +19,65 @@ TRecord = Tuple[int, int, int, int]
 TRP = Tuple[int, int]
 
 
-def process_year(objs: objs_type) -> objs_type:
+def get_records(ids: Any, mask: Any, columns: List[Any], size: int) -> List[Any]:
+    # Sums each slot column per id, one row per id
+    sums = [
+        np.bincount(ids[mask], weights=column[mask], minlength=size).astype(int)
+        for column in columns
+    ]
+    return np.stack(sums, axis=1).tolist()
+
+
+def process_year(objs: objs_type, index: Optional[SeasonIndex] = None) -> objs_type:
     year_num = objs[0].year
 
-    ty_record: Dict[str, TRecord] = defaultdict(lambda: (0, 0, 0, 0))
-    ty_full_record: Dict[str, TRecord] = defaultdict(lambda: (0, 0, 0, 0))
-    te_record: Dict[Tuple[str, str], TRecord] = defaultdict(lambda: (0, 0, 0, 0))
-    te_qual_record: Dict[Tuple[str, str], TRecord] = defaultdict(lambda: (0, 0, 0, 0))
-    te_rps: Dict[Tuple[str, str], TRP] = defaultdict(lambda: (0, 0))
-
-    for m_obj in objs[4].values():
-        elim = m_obj.elim
-        event = m_obj.event
-        status = m_obj.status
-        offseason = m_obj.offseason
-        winner = m_obj.winner
-
-        if status != MatchStatus.COMPLETED or winner is None:
-            continue
-
-        for alliance in ["red", "blue"]:
-            teams = m_obj.get_red() if alliance == "red" else m_obj.get_blue()
-            if year_num <= 2004:
-                teams = teams[:2]  # 2 team alliances
-
-            dqs = m_obj.get_red_dqs() if alliance == "red" else m_obj.get_blue_dqs()
-            surrogates = (
-                m_obj.get_red_surrogates()
-                if alliance == "red"
-                else m_obj.get_blue_surrogates()
-            )
-
-            win_update = 1 if alliance == winner else 0
-            tie_update = 1 if winner == MatchWinner.TIE else 0
-            loss_update = 1 - win_update - tie_update
-
-            rp_1 = (m_obj.red_rp_1 if alliance == "red" else m_obj.blue_rp_1) or 0
-            rp_2 = (m_obj.red_rp_2 if alliance == "red" else m_obj.blue_rp_2) or 0
-            total_rps = 2 * win_update + 1 * tie_update + rp_1 + rp_2
-
-            for t in teams:
-                ty_full_record[t] = (
-                    ty_full_record[t][0] + win_update,
-                    ty_full_record[t][1] + loss_update,
-                    ty_full_record[t][2] + tie_update,
-                    ty_full_record[t][3] + 1,
-                )
-
-                if not offseason:
-                    ty_record[t] = (
-                        ty_record[t][0] + win_update,
-                        ty_record[t][1] + loss_update,
-                        ty_record[t][2] + tie_update,
-                        ty_record[t][3] + 1,
-                    )
-
-                if t not in dqs and t not in surrogates:
-                    # DQ, surrogate only affect TeamEvent records
-                    te_record[(t, event)] = (
-                        te_record[(t, event)][0] + win_update,
-                        te_record[(t, event)][1] + loss_update,
-                        te_record[(t, event)][2] + tie_update,
-                        te_record[(t, event)][3] + 1,
-                    )
-                    if not elim:
-                        te_qual_record[(t, event)] = (
-                            te_qual_record[(t, event)][0] + win_update,
-                            te_qual_record[(t, event)][1] + loss_update,
-                            te_qual_record[(t, event)][2] + tie_update,
-                            te_qual_record[(t, event)][3] + 1,
-                        )
-                        te_rps[(t, event)] = (
-                            te_rps[(t, event)][0] + total_rps,
-                            te_rps[(t, event)][1] + 1,
-                        )
-
-    for team_year in objs[1].values():
+    if index is None:
+        index = SeasonIndex(objs)
+
+    match_arrays = index.get_match_arrays()
+    slot_match, slot_alliance = index.slot_match, index.slot_alliance
+    winner = match_arrays["winner"][slot_match]
+
+    valid = match_arrays["completed"][slot_match]
+    if year_num <= 2004:
+        valid &= index.slot_position < 2  # 2 team alliances
+
+    win_update = (winner == slot_alliance).astype(int)
+    tie_update = (winner == TIE).astype(int)
+    loss_update = 1 - win_update - tie_update
+    count_update = np.ones(len(slot_match), dtype=int)
+    rp_update = (
+        match_arrays["rp_1"][slot_match, slot_alliance]
+        + match_arrays["rp_2"][slot_match, slot_alliance]
+    )
+    rps_update = 2 * win_update + 1 * tie_update + rp_update
+    record_columns = [win_update, loss_update, tie_update, count_update]
+
+    num_teams, num_team_events = len(index.team_years), len(index.team_events)
+    slot_team, slot_team_event = index.slot_team, index.slot_team_event
+    ty_full_mask = valid
+    ty_mask = valid & ~match_arrays["offseason"][slot_match]
+    # DQ, surrogate only affect TeamEvent records
+    te_mask = valid & ~index.slot_excluded
+    te_qual_mask = te_mask & ~match_arrays["elim"][slot_match]
+
+    ty_full_record = get_records(slot_team, ty_full_mask, record_columns, num_teams)
+    ty_record = get_records(slot_team, ty_mask, record_columns, num_teams)
+    te_record = get_records(slot_team_event, te_mask, record_columns, num_team_events)
+    te_qual_record = get_records(
+        slot_team_event, te_qual_mask, record_columns, num_team_events
+    )
+    te_rps = get_records(
+        slot_team_event, te_qual_mask, [rps_update, count_update], num_team_events
+    )
+
+    for i, team_year in enumerate(index.team_years):
         (
             team_year.wins,
             team_year.losses,
             team_year.ties,
             team_year.count,
-        ) = ty_record[team_year.team]
+        ) = ty_record[i]
         team_year.winrate = winrate(team_year.wins, team_year.ties, team_year.count)
 
         (
@@ -105,18 +85,18 @@ def process_year(objs: objs_type) -> objs_type:
             team_year.full_losses,
             team_year.full_ties,
             team_year.full_count,
-        ) = ty_full_record[team_year.team]
+        ) = ty_full_record[i]
         team_year.full_winrate = winrate(
             team_year.full_wins, team_year.full_ties, team_year.full_count
         )
 
-    for team_event in objs[3].values():
+    for i, team_event in enumerate(index.team_events):
         (
             team_event.wins,
             team_event.losses,
             team_event.ties,
             team_event.count,
-        ) = te_record[(team_event.team, team_event.event)]
+        ) = te_record[i]
         team_event.winrate = winrate(team_event.wins, team_event.ties, team_event.count)
 
         (
@@ -124,12 +104,12 @@ def process_year(objs: objs_type) -> objs_type:
             team_event.qual_losses,
             team_event.qual_ties,
             team_event.qual_count,
-        ) = te_qual_record[(team_event.team, team_event.event)]
+        ) = te_qual_record[i]
         team_event.qual_winrate = winrate(
             team_event.qual_wins, team_event.qual_ties, team_event.qual_count
         )
 
-        total_rps, count = te_rps[(team_event.team, team_event.event)]
+        total_rps, count = te_rps[i]
         team_event.rps = total_rps
         team_event.rps_per_match = r(total_rps / max(1, count), 4)
 
@@ -0,0 +1,264 @@
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+import pyarrow as pa  # type: ignore
+from sqlalchemy import Enum
+
+from src.constants import CURR_YEAR, USE_ARCHIVE
+from src.db.cursor import decode_cursor, get_columns
+from src.db.models.event import Event, EventORM
+from src.db.models.main import Model, ModelORM
+from src.db.models.match import Match, MatchORM
+from src.db.models.team_event import TeamEvent, TeamEventORM
+from src.db.models.team_match import TeamMatch, TeamMatchORM
+from src.db.models.team_year import TeamYear, TeamYearORM
+from src.db.models.year import Year, YearORM
+from src.utils.storage import get_path, get_version, list_names
+
+# Per-year tables in the Arrow exports, by table name
+TABLES: Dict[str, Tuple[Type[ModelORM], Type[Model]]] = {
+    "years": (YearORM, Year),
+    "team_years": (TeamYearORM, TeamYear),
+    "events": (EventORM, Event),
+    "team_events": (TeamEventORM, TeamEvent),
+    "matches": (MatchORM, Match),
+    "team_matches": (TeamMatchORM, TeamMatch),
+}
+
+# Columns with a sorted index, when present in a table
+INDEX_COLUMNS = ["team", "event", "match"]
+
+# (column, value) equality filters, None values are skipped. A list value
+# matches any of its values, a tuple of columns matches if any column does.
+filters_type = List[Tuple[Any, Any]]
+
+
+def get_export_name(year: int, table: str) -> str:
+    # In shared storage, see utils/storage.py
+    return str(year) + "/" + table + ".arrow"
+
+
+def get_exports() -> Dict[int, List[str]]:
+    names = set(list_names())
+    out: Dict[int, List[str]] = {}
+    years = sorted(set(int(x.split("/")[0]) for x in names if x[:4].isdigit()))
+    for year in years:
+        tables = [t for t in TABLES if get_export_name(year, t) in names]
+        if len(tables) > 0:
+            out[year] = tables
+    return out
+
+
+class ArchiveTable:
+    """
+    Read-only season table over a memory mapped Arrow IPC export.
+
+    Rows are in primary key order, as the DB returns them without a sort.
+    Columns are decoded to numpy lazily (zero copy where possible), dictionary
+    encoded strings are compared by code, and team, event and match keys have
+    sorted indexes. Only the rows in the final page are turned into models.
+    """
+
+    def __init__(self, path: str, table: str):
+        self.path = path
+        self.orm_type, self.model = TABLES[table]
+        self.table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+        self.num_rows = self.table.num_rows
+        # Model fields the export predates, filled with None
+        names = set(self.table.schema.names)
+        self.missing = [x for x in self.model.field_names if x not in names]
+
+        self.enums = {
+            c.name: c.type.enum_class
+            for c in self.orm_type.__table__.columns
+            if isinstance(c.type, Enum)
+        }
+
+        self.lock = threading.Lock()
+        self.columns: Dict[str, Any] = {}
+        self.codes: Dict[str, Dict[Any, int]] = {}
+        self.decoders: Dict[str, Any] = {}  # code to value, last is None
+        self.nulls: Dict[str, Any] = {}  # null masks of numeric columns
+        self.indexes: Dict[str, Tuple[Any, Any]] = {}
+        for column in INDEX_COLUMNS:
+            if column in self.table.schema.names:
+                codes = self.get_column(column)
+                order = np.argsort(codes, kind="stable")
+                self.indexes[column] = (order, codes[order])
+
+    def get_column(self, name: str) -> Any:
+        # Codes for dictionary columns (-1 for null), values otherwise
+        out = self.columns.get(name)
+        if out is not None:
+            return out
+
+        with self.lock:
+            column = self.table.column(name).combine_chunks()
+            if pa.types.is_dictionary(column.type):
+                values = column.dictionary.to_pylist()
+                self.codes[name] = {x: i for i, x in enumerate(values)}
+                if name in self.enums:
+                    values = [self.enums[name](x) for x in values]
+                self.decoders[name] = np.array(values + [None], dtype=object)
+                out = column.indices.fill_null(-1).to_numpy()
+            else:
+                # Copies only booleans and columns with nulls (as NaN)
+                if column.null_count > 0:
+                    self.nulls[name] = column.is_null().to_numpy(zero_copy_only=False)
+                out = column.to_numpy(zero_copy_only=False)
+            self.columns[name] = out
+        return out
+
+    def get_values(self, name: str, ids: Any) -> List[Any]:
+        values = self.get_column(name)[ids]
+        decoder = self.decoders.get(name)
+        if decoder is not None:
+            return decoder[values].tolist()
+
+        nulls = self.nulls.get(name)
+        if nulls is None:
+            return values.tolist()
+
+        # Integers and booleans with nulls were widened to floats
+        arrow_type = self.table.schema.field(name).type
+        cast: Any = float
+        if pa.types.is_integer(arrow_type):
+            cast = int
+        elif pa.types.is_boolean(arrow_type):
+            cast = bool
+        return [
+            None if null else cast(x)
+            for x, null in zip(values.tolist(), nulls[ids].tolist())
+        ]
+
+    def get_code(self, name: str, value: Any) -> Any:
+        if name not in self.codes:
+            return value
+        return self.codes[name].get(getattr(value, "value", value), -2)
+
+    def lookup(self, name: str, value: Any) -> Any:
+        order, sorted_codes = self.indexes[name]
+        code = self.get_code(name, value)
+        start = np.searchsorted(sorted_codes, code, "left")
+        end = np.searchsorted(sorted_codes, code, "right")
+        return order[start:end]
+
+    def get_mask(self, name: str, value: Any, ids: Any) -> Any:
+        column = self.get_column(name)[ids]
+        if isinstance(value, list):
+            return np.isin(column, [self.get_code(name, x) for x in value])
+        return column == self.get_code(name, value)
+
+    def filter(self, filters: filters_type) -> Any:
+        filters = [(k, v) for k, v in filters if v is not None]
+
+        # Narrows with the first indexed filter, then masks the remainder
+        ids = None
+        for i, (name, value) in enumerate(filters):
+            if name in self.indexes:
+                values = value if isinstance(value, list) else [value]
+                ids = np.sort(
+                    np.concatenate(
+                        [np.zeros(0, int)] + [self.lookup(name, x) for x in values]
+                    )
+                )
+                del filters[i]
+                break
+
+        if ids is None:
+            ids = np.arange(self.num_rows)
+
+        for key, value in filters:
+            if len(ids) == 0:
+                break
+            names = key if isinstance(key, tuple) else (key,)
+            mask = np.zeros(len(ids), dtype=bool)
+            for name in names:
+                mask |= self.get_mask(name, value, ids)
+            ids = ids[mask]
+
+        return ids
+
+    def sort(self, ids: Any, metric: str, ascending: Optional[bool]) -> Any:
+        # Nulls dropped, by metric then key, descending unless ascending
+        valid = self.table.column(metric).is_valid().to_numpy(zero_copy_only=False)
+        ids = ids[valid[ids]]
+        values = self.get_column(metric)
+        if metric in self.codes:
+            # Codes follow first appearance, ranks them by the decoded strings
+            names = np.array(list(self.codes[metric]), dtype=object)
+            ranks = np.empty(len(names), dtype=int)
+            ranks[np.argsort(names, kind="stable")] = np.arange(len(names))
+            values = ranks[values.clip(0)]
+
+        # Descending reverses ties too, matching common_filters
+        ids = ids[np.argsort(values[ids], kind="stable")]
+        return ids if ascending else ids[::-1]
+
+    def query(
+        self,
+        filters: filters_type,
+        metric: Optional[str],
+        ascending: Optional[bool],
+        limit: Optional[int],
+        offset: Optional[int],
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
+        # Same semantics as common_filters. The archive never changes, so a
+        # cursor resumes from its position rather than its key.
+        ids = self.filter(filters)
+        if metric is not None:
+            ids = self.sort(ids, metric, ascending)
+        start = offset or 0
+        if cursor is not None:
+            start += decode_cursor(cursor, metric, ascending)[1]
+        end = len(ids) if limit is None else start + limit
+        ids = ids[start:end]
+
+        # Column-wise decode by name, so exports written before a model change
+        # still fill the right fields
+        names = set(self.table.schema.names)
+        if fields is not None:
+            names &= set(get_columns(self.orm_type, fields, metric))
+        empty = [None] * len(ids)
+        columns = [
+            self.get_values(name, ids) if name in names else empty
+            for name in self.model.field_names
+        ]
+        return [self.model(*row) for row in zip(*columns)]
+
+
+# (year, table) -> (export version, table)
+archives: Dict[Tuple[int, str], Tuple[str, ArchiveTable]] = {}
+archives_lock = threading.Lock()
+
+
+def get_archive(year: Optional[int], table: str) -> Optional[ArchiveTable]:
+    # Closed seasons only, the live season is always read from the DB
+    if not USE_ARCHIVE or year is None or year >= CURR_YEAR:
+        return None
+
+    name = get_export_name(year, table)
+    version = get_version(name)
+    if version is None:
+        return None
+
+    entry = archives.get((year, table))
+    if entry is None or entry[0] != version:
+        with archives_lock:
+            entry = archives.get((year, table))
+            if entry is None or entry[0] != version:
+                local = get_path(name)
+                if local is None:
+                    return None
+                entry = (local[0], ArchiveTable(local[1], table))
+                archives[(year, table)] = entry
+                if len(entry[1].missing) > 0:
+                    print(name, "predates", entry[1].missing, "read from the DB")
+
+    # Filters and sorts may use the missing columns, the DB has them
+    if len(entry[1].missing) > 0:
+        return None
+    return entry[1]
@@ -0,0 +1,70 @@
+import base64
+import json
+from typing import Any, List, Optional, Sequence, Tuple, Type
+
+from src.db.models.main import ModelORM
+
+# Cursors and column projections of list reads, shared by the DB reads in
+# src.db.read and the archive, which src.db.read imports
+
+
+def encode_cursor(
+    metric: Optional[str], ascending: Optional[bool], key: List[Any], position: int
+) -> str:
+    # Opaque to clients: the last row's (metric, primary key) for keyset reads,
+    # and its absolute position for the archive, which never changes
+    data = [metric, bool(ascending), [getattr(x, "value", x) for x in key], position]
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+
+def decode_cursor(
+    cursor: str, metric: Optional[str], ascending: Optional[bool]
+) -> Tuple[List[Any], int]:
+    try:
+        cursor_metric, cursor_ascending, key, position = json.loads(
+            base64.urlsafe_b64decode(cursor.encode())
+        )
+    except Exception:
+        raise Exception("Invalid cursor")
+
+    if cursor_metric != metric or cursor_ascending != bool(ascending):
+        raise Exception("Cursor does not match metric and ascending")
+    return key, position
+
+
+def get_next_cursor(
+    model_orm: Type[ModelORM],
+    items: List[Any],
+    metric: Optional[str],
+    ascending: Optional[bool],
+    limit: int,
+    offset: Optional[int],
+    cursor: Optional[str],
+) -> Optional[str]:
+    # None once a page comes back short
+    if len(items) < limit:
+        return None
+
+    position = 0 if cursor is None else decode_cursor(cursor, metric, ascending)[1]
+    position += (offset or 0) + len(items)
+    last = items[-1]
+    key = [getattr(last, c.name) for c in model_orm.__table__.primary_key]
+    if metric is not None:
+        key = [getattr(last, metric)] + key
+    return encode_cursor(metric, ascending, key, position)
+
+
+def get_columns(
+    model_orm: Type[ModelORM], fields: Sequence[str], metric: Optional[str]
+) -> List[str]:
+    # Requested columns plus the primary key and metric, which ordering and
+    # cursors read back, in table order
+    columns = [c.name for c in model_orm.__table__.columns]
+    for field in fields:
+        if field not in columns:
+            raise Exception("Invalid field: " + field)
+
+    names = set(fields) | {c.name for c in model_orm.__table__.primary_key}
+    if metric is not None:
+        names.add(metric)
+    return [c for c in columns if c in names]
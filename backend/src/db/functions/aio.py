@@ -0,0 +1,14 @@
+# Match queries for async site endpoints, run on the DB thread pool
+from src.db.functions import (
+    get_noteworthy_matches as _get_noteworthy_matches,
+    get_upcoming_matches as _get_upcoming_matches,
+)
+from src.db.main import to_async
+
+get_noteworthy_matches = to_async(_get_noteworthy_matches)
+get_upcoming_matches = to_async(_get_upcoming_matches)
+
+__all__ = [
+    "get_noteworthy_matches",
+    "get_upcoming_matches",
+]
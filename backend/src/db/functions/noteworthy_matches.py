@@ -1,13 +1,87 @@
-from typing import Dict, List, Optional
+import gzip
+import json
+import threading
+from typing import Dict, List, Optional, Tuple
 
 from sqlalchemy import asc, desc, func
 from sqlalchemy.orm import Session as SessionType
 from sqlalchemy_cockroachdb import run_transaction  # type: ignore
 
+from src.constants import USE_ARCHIVE
 from src.db.main import Session
 from src.db.models.event import EventORM
 from src.db.models.match import Match, MatchORM
 from src.types.enums import MatchStatus
+from src.utils.storage import get_version, read_bytes
+
+# (country, state, district, elim, week) filters, None if unset. District is
+# "regionals" for events outside a district.
+bucket_type = Tuple[
+    Optional[str], Optional[str], Optional[str], Optional[bool], Optional[int]
+]
+leaderboards_type = Dict[bucket_type, Dict[str, List[Match]]]
+
+
+def get_categories(year: int) -> List[str]:
+    out = ["high_score", "combined_score", "losing_score"]
+    if year >= 2016:
+        out += ["high_auto_score", "high_teleop_score", "high_endgame_score"]
+    return out
+
+
+# Bumped when the file layout changes, other versions are read from the DB
+LEADERBOARDS_VERSION = 1
+
+
+def get_leaderboards_name(year: int) -> str:
+    return str(year) + "/noteworthy.json.gz"
+
+
+def decode_leaderboards(data: bytes) -> leaderboards_type:
+    # See encode_leaderboards, buckets list matches by position
+    raw = json.loads(gzip.decompress(data))
+    if raw["version"] != LEADERBOARDS_VERSION:
+        raise Exception("Unknown leaderboards version: " + str(raw["version"]))
+    matches = [Match.from_json(x) for x in raw["matches"]]
+    return {
+        tuple(bucket): {k: [matches[i] for i in v] for k, v in categories.items()}
+        for bucket, categories in raw["buckets"]
+    }
+
+
+# year -> (version, leaderboards or None if unreadable), reloaded when the data
+# pipeline rewrites them
+leaderboards_cache: Dict[int, Tuple[str, Optional[leaderboards_type]]] = {}
+leaderboards_lock = threading.Lock()
+
+
+def read_leaderboards(year: int) -> Optional[leaderboards_type]:
+    # Unlike the archive, includes the live season, rewritten on every update
+    if not USE_ARCHIVE:
+        return None
+
+    name = get_leaderboards_name(year)
+    version = get_version(name)
+    if version is None:
+        return None
+
+    entry = leaderboards_cache.get(year)
+    if entry is None or entry[0] != version:
+        with leaderboards_lock:
+            entry = leaderboards_cache.get(year)
+            if entry is None or entry[0] != version:
+                data = read_bytes(name)
+                if data is None:
+                    return None
+                # Kept under the checked version, a newer download is reread
+                # once, not on every request until the version check expires
+                try:
+                    entry = (version, decode_leaderboards(data[1]))
+                except Exception as e:
+                    print(name, "unreadable, using the DB:", repr(e))
+                    entry = (version, None)
+                leaderboards_cache[year] = entry
+    return entry[1]
 
 
 def get_noteworthy_matches(
@@ -18,6 +92,12 @@ def get_noteworthy_matches(
     elim: Optional[bool],
     week: Optional[int],
 ) -> Dict[str, List[Match]]:
+    leaderboards = read_leaderboards(year)
+    if leaderboards is not None:
+        # Buckets without a completed match are not stored
+        bucket = leaderboards.get((country, state, district, elim, week), {})
+        return {k: list(bucket.get(k, [])) for k in get_categories(year)}
+
     def callback(session: SessionType):
         matches = session.query(
             MatchORM,
@@ -1,15 +1,137 @@
+import gzip
+import json
+import threading
+from bisect import bisect_left, bisect_right
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import func, text
 from sqlalchemy.orm import Session as SessionType
 from sqlalchemy_cockroachdb import run_transaction  # type: ignore
 
-from src.constants import CURR_YEAR
+from src.constants import CURR_YEAR, USE_ARCHIVE
 from src.db.main import Session
 from src.db.models.event import EventORM
 from src.db.models.match import Match, MatchORM
 from src.types.enums import EventStatus
+from src.utils.storage import get_version, read_bytes
+
+# (match, event name, country, state, district) of each upcoming match
+entry_type = Tuple[Match, str, Optional[str], Optional[str], Optional[str]]
+
+
+# Bumped when the file layout changes, other versions are read from the DB
+UPCOMING_VERSION = 1
+
+
+def get_upcoming_name() -> str:
+    return str(CURR_YEAR) + "/upcoming.json.gz"
+
+
+def decode_upcoming(data: bytes) -> List[entry_type]:
+    # See encode_upcoming, matches by column name
+    raw = json.loads(gzip.decompress(data))
+    if raw["version"] != UPCOMING_VERSION:
+        raise Exception("Unknown upcoming version: " + str(raw["version"]))
+    return [(Match.from_json(x[0]), *x[1:]) for x in raw["entries"]]  # type: ignore
+
+
+def get_sort_key(metric: str) -> Any:
+    # Ascending keys, nulls sort as smallest like in the DB
+    def epa(func: Any) -> Any:
+        def key(entry: entry_type) -> float:
+            red, blue = entry[0].epa_red_score_pred, entry[0].epa_blue_score_pred
+            if red is None or blue is None:
+                return float("inf") if metric != "diff_epa" else float("-inf")
+            return func(red, blue)
+
+        return key
+
+    if metric == "max_epa":
+        return epa(lambda r, b: -max(r, b))
+    if metric == "sum_epa":
+        return epa(lambda r, b: -(r + b))
+    if metric == "diff_epa":
+        return epa(lambda r, b: abs(r - b))
+    if metric == "time":
+        return lambda entry: entry[0].time
+    return None
+
+
+class UpcomingIndex:
+    """
+    Upcoming matches of the current season ordered by predicted time, so a
+    time window is two binary searches. Built by the data pipeline.
+    """
+
+    def __init__(self, entries: List[entry_type]):
+        self.entries = entries
+        self.times = [entry[0].predicted_time for entry in entries]
+
+    def query(
+        self,
+        country: Optional[str],
+        state: Optional[str],
+        district: Optional[str],
+        elim: Optional[bool],
+        start: int,
+        end: int,
+        limit: int,
+        metric: str,
+    ) -> List[Tuple[Match, str]]:
+        # Same filters as the SQL below, exclusive bounds
+        entries = self.entries[
+            bisect_right(self.times, start) : bisect_left(self.times, end)
+        ]
+        entries = [
+            x
+            for x in entries
+            if (country is None or x[2] == country)
+            and (state is None or x[3] == state)
+            and (
+                district is None
+                or (x[4] is None if district == "regionals" else x[4] == district)
+            )
+            and (elim is None or x[0].elim == elim)
+        ]
+
+        key = get_sort_key(metric)
+        if key is not None:
+            entries = sorted(entries, key=key)
+        return [(x[0], x[1]) for x in entries[:limit]]
+
+
+# (version, index or None if unreadable), reloaded when the data pipeline
+# rewrites it
+upcoming_cache: Dict[str, Tuple[str, Optional[UpcomingIndex]]] = {}
+upcoming_lock = threading.Lock()
+
+
+def read_upcoming_index() -> Optional[UpcomingIndex]:
+    if not USE_ARCHIVE:
+        return None
+
+    name = get_upcoming_name()
+    version = get_version(name)
+    if version is None:
+        return None
+
+    entry = upcoming_cache.get(name)
+    if entry is None or entry[0] != version:
+        with upcoming_lock:
+            entry = upcoming_cache.get(name)
+            if entry is None or entry[0] != version:
+                data = read_bytes(name)
+                if data is None:
+                    return None
+                # Kept under the checked version, as in read_leaderboards
+                try:
+                    entry = (version, UpcomingIndex(decode_upcoming(data[1])))
+                except Exception as e:
+                    print(name, "unreadable, using the DB:", repr(e))
+                    entry = (version, None)
+                upcoming_cache[name] = entry
+    return entry[1]
 
 
 def get_upcoming_matches(
@@ -26,6 +148,13 @@ def get_upcoming_matches(
     if minutes == -1:
         minutes = 60 * 24 * 7  # 1 week
 
+    index = read_upcoming_index()
+    if index is not None:
+        end_timestamp = curr_timestamp + 60 * minutes
+        return index.query(
+            country, state, district, elim, curr_timestamp, end_timestamp, limit, metric
+        )
+
     def callback(session: SessionType):
         matches = session.query(
             MatchORM,
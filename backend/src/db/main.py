@@ -1,12 +1,42 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+from typing import Awaitable, Callable, ParamSpec, TypeVar
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import DeclarativeBase, MappedAsDataclass, sessionmaker
 
-from src.constants import CONN_STR
+from src.constants import CONN_STR, DB_MAX_OVERFLOW, DB_POOL_SIZE, DB_POOL_TIMEOUT
+
+Param = ParamSpec("Param")
+TOutput = TypeVar("TOutput")
 
-engine = create_engine(CONN_STR)
+engine = create_engine(
+    CONN_STR,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_pre_ping=True,
+)
 
 Session = sessionmaker(bind=engine)
 
+# Bounded by the connection pool, so queued reads wait here instead of holding
+# a thread while blocked on a connection
+executor = ThreadPoolExecutor(
+    max_workers=DB_POOL_SIZE + DB_MAX_OVERFLOW, thread_name_prefix="db"
+)
+
+
+def to_async(func: Callable[Param, TOutput]) -> Callable[Param, Awaitable[TOutput]]:
+    # Runs a blocking DB function off the event loop, same signature
+    @wraps(func)
+    async def wrapper(*args: Param.args, **kwargs: Param.kwargs) -> TOutput:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+
+    return wrapper
+
 
 # Only for type hints, doesn't enable slots
 # Mirror to avoid intermediate commits to DB
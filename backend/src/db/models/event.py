@@ -82,24 +82,15 @@ _Event = generate_attr_class("Event", EventORM)
 
 
 class Event(_Event, Model):
+    # Only refresh DB if these change (during 1 min partial update)
+    refresh_fields = ["key", "status", "num_teams", "current_match", "qual_matches"]
+
     def pk(self: "Event") -> str:
         return self.key
 
     def __hash__(self: "Event") -> int:
         return hash(self.pk())
 
-    def __str__(self: "Event") -> str:
-        # Only refresh DB if these change (during 1 min partial update)
-        return "_".join(
-            [
-                self.key,
-                self.status,
-                str(self.num_teams),
-                str(self.current_match),
-                str(self.qual_matches),
-            ]
-        )
-
     def to_dict(self: "Event") -> Dict[str, Any]:
         clean: Dict[str, Any] = {
             "key": self.key,
@@ -1,7 +1,8 @@
-from typing import Any, Dict, Type, TypeVar
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Type, TypeVar
 
 import attr
-from sqlalchemy import inspect
+from sqlalchemy import Enum, inspect
 
 
 class ModelORM:
@@ -11,6 +12,14 @@ class ModelORM:
 class Model:
     T1 = TypeVar("T1")
 
+    # Set by generate_attr_class, column names in declaration order
+    field_names: List[str] = []
+    enums: Dict[str, Any] = {}  # enum class of each enum column
+    _get_values: Callable[[Any], Tuple[Any, ...]]
+
+    # Only refresh DB if these change, any field if empty
+    refresh_fields: Sequence[str] = []
+
     @classmethod
     def from_dict(cls: Type[T1], dict: Dict[str, Any]) -> T1:
         dict = {k: dict.get(k, None) for k in cls.__slots__}  # type: ignore
@@ -19,6 +28,50 @@ class Model:
     def to_dict(self) -> Dict[str, Any]:
         return attr.asdict(self)
 
+    def to_json(self) -> Dict[str, Any]:
+        # Column values by name, enums by value, for files shared between the
+        # data and API services, which can run different model versions
+        return {
+            name: getattr(value, "value", value)
+            for name, value in zip(self.field_names, self.get_values())
+        }
+
+    @classmethod
+    def from_json(cls: Type[T1], data: Dict[str, Any]) -> T1:
+        # Fields a file predates take their defaults, removed fields are ignored
+        out: Dict[str, Any] = {}
+        for name in cls.field_names:  # type: ignore
+            if name in data:
+                value, enum = data[name], cls.enums.get(name)  # type: ignore
+                out[name] = value if enum is None or value is None else enum(value)
+        return cls(**out)
+
+    def to_fields_dict(self, fields: Sequence[str]) -> Dict[str, Any]:
+        # Flat column values, enums by value, for projected API responses
+        out: Dict[str, Any] = {}
+        for field in fields:
+            if field not in self.field_names:
+                raise Exception("Invalid field: " + field)
+            value = getattr(self, field)
+            out[field] = getattr(value, "value", value)
+        return out
+
+    def get_values(self) -> Tuple[Any, ...]:
+        # Cheap snapshot, all column values are immutable
+        return self._get_values(self)
+
+    def get_changed_fields(self, values: Tuple[Any, ...]) -> List[str]:
+        return [
+            name
+            for name, new, old in zip(self.field_names, self.get_values(), values)
+            if new != old and (new == new or old == old)  # NaN == NaN
+        ]
+
+    def needs_refresh(self, changed_fields: Sequence[str]) -> bool:
+        if len(self.refresh_fields) == 0:
+            return len(changed_fields) > 0
+        return any(field in self.refresh_fields for field in changed_fields)
+
     def sort(self) -> Any:
         raise NotImplementedError()
 
@@ -48,9 +101,13 @@ def generate_attr_class(name: str, sqlalchemy_model: Type[T2]) -> Type[T2]:
         for c in columns
     }
 
-    return attr.make_class(  # type: ignore
+    cls = attr.make_class(
         name, attrs=fields, bases=(Model,), auto_attribs=True, slots=True
     )
+    cls.field_names = list(fields)
+    cls.enums = {c.name: c.type.enum_class for c in columns if isinstance(c.type, Enum)}
+    cls._get_values = attrgetter(*fields)
+    return cls  # type: ignore
 
 
 TModelORM = TypeVar("TModelORM", bound=ModelORM)
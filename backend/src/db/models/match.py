@@ -1,7 +1,7 @@
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
-from sqlalchemy import Boolean, Enum, Float, Integer, String
+from sqlalchemy import Boolean, Enum, Float, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql.schema import ForeignKeyConstraint, PrimaryKeyConstraint
 
@@ -16,6 +16,8 @@ class MatchORM(Base, ModelORM):
     """DECLARATION"""
 
     __tablename__ = "matches"
+    # Season matches in play order, keyed like the cursor ORDER BY
+    __table_args__ = (Index("ix_matches_year_time_key", "year", "time", "key"),)
     key: MS = mapped_column(String(20))
     year: MI = mapped_column(Integer, index=True)
     event: MS = mapped_column(String(12), index=True)
@@ -141,6 +143,19 @@ _Match = generate_attr_class("Match", MatchORM)
 
 
 class Match(_Match, Model):
+    # Only refresh DB if these change (during 1 min partial update)
+    refresh_fields = [
+        "key",
+        "status",
+        "red_score",
+        "blue_score",
+        "red_teleop",
+        "blue_teleop",
+        "epa_red_score_pred",
+        "epa_blue_score_pred",
+        "predicted_time",
+    ]
+
     def sort(self: "Match") -> int:
         return self.time or 0
 
@@ -150,22 +165,6 @@ class Match(_Match, Model):
     def __hash__(self: "Match") -> int:
         return hash(self.pk())
 
-    def __str__(self: "Match") -> str:
-        # Only refresh DB if these change (during 1 min partial update)
-        return "_".join(
-            [
-                self.key,
-                self.status,
-                str(self.red_score),
-                str(self.blue_score),
-                str(self.red_teleop),
-                str(self.blue_teleop),
-                str(self.epa_red_score_pred),
-                str(self.epa_blue_score_pred),
-                str(self.predicted_time),
-            ]
-        )
-
     """HELPER FUNCTIONS"""
 
     def get_red(self: "Match") -> List[str]:
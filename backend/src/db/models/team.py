@@ -51,16 +51,15 @@ _Team = generate_attr_class("Team", TeamORM)
 
 
 class Team(_Team, Model):
+    # Only refresh DB if these change (during 1 min partial update)
+    refresh_fields = ["team", "count"]
+
     def pk(self: "Team") -> str:
         return self.team
 
     def __hash__(self: "Team") -> int:
         return hash(self.pk())
 
-    def __str__(self: "Team") -> str:
-        # Only refresh DB if these change (during 1 min partial update)
-        return "_".join([self.team, str(self.count)])
-
     def to_dict(self: "Team") -> Dict[str, Any]:
         return {
             "team": self.team,
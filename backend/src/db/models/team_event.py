@@ -1,6 +1,6 @@
 from typing import Any, Dict, Tuple
 
-from sqlalchemy import Boolean, Enum, Float, Integer, String
+from sqlalchemy import Boolean, Enum, Float, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql.schema import ForeignKeyConstraint, PrimaryKeyConstraint
 
@@ -16,6 +16,10 @@ class TeamEventORM(Base, ModelORM):
     """DECLARATIONS"""
 
     __tablename__ = "team_events"
+    # Event and season rankings by EPA, keyed like the cursor ORDER BY
+    __table_args__ = (
+        Index("ix_team_events_year_epa_team_event", "year", "epa", "team", "event"),
+    )
     id: MOI = mapped_column(Integer, nullable=True)  # placeholder for backend API
     team: MS = mapped_column(String(6))
     year: MI = mapped_column(Integer, index=True)
@@ -133,6 +137,9 @@ _TeamEvent = generate_attr_class("TeamEvent", TeamEventORM)
 
 
 class TeamEvent(_TeamEvent, Model):
+    # Only refresh DB if these change (during 1 min partial update)
+    refresh_fields = ["team", "event", "status", "count", "rank"]
+
     def sort(self: "TeamEvent") -> Tuple[str, int]:
         return (self.team, self.time)
 
@@ -142,12 +149,6 @@ class TeamEvent(_TeamEvent, Model):
     def __hash__(self: "TeamEvent") -> int:
         return hash(self.pk())
 
-    def __str__(self: "TeamEvent") -> str:
-        # Only refresh DB if these change (during 1 min partial update)
-        return "_".join(
-            [self.team, self.event, str(self.status), str(self.count), str(self.rank)]
-        )
-
     def to_dict(self: "TeamEvent") -> Dict[str, Any]:
         lower, upper = get_skew_normal_95_conf_interval(
             0, 1, self.epa_skew, self.epa_n, 2
@@ -1,6 +1,6 @@
 from typing import Any, Dict
 
-from sqlalchemy import Boolean, Enum, Float, Integer, String
+from sqlalchemy import Boolean, Enum, Float, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql.schema import ForeignKeyConstraint, PrimaryKeyConstraint
 
@@ -15,6 +15,10 @@ class TeamMatchORM(Base, ModelORM):
     """DECLARATION"""
 
     __tablename__ = "team_matches"
+    # Season team matches in play order, keyed like the cursor ORDER BY
+    __table_args__ = (
+        Index("ix_team_matches_year_time_team_match", "year", "time", "team", "match"),
+    )
     id: MOI = mapped_column(Integer, nullable=True)  # placeholder for backend API
     team: MS = mapped_column(String(6))
     year: MI = mapped_column(Integer, index=True)
@@ -75,6 +79,9 @@ _TeamMatch = generate_attr_class("TeamMatch", TeamMatchORM)
 
 
 class TeamMatch(_TeamMatch, Model):
+    # Only refresh DB if these change (during 1 min partial update)
+    refresh_fields = ["team", "match", "status", "epa", "post_epa"]
+
     def sort(self: "TeamMatch") -> int:
         return self.time
 
@@ -84,12 +91,6 @@ class TeamMatch(_TeamMatch, Model):
     def __hash__(self: "TeamMatch") -> int:
         return hash(self.pk())
 
-    def __str__(self: "TeamMatch") -> str:
-        # Only refresh DB if these change (during 1 min partial update)
-        return "_".join(
-            [self.team, self.match, str(self.status), str(self.epa), str(self.post_epa)]
-        )
-
     def to_dict(self: "TeamMatch") -> Dict[str, Any]:
         clean: Dict[str, Any] = {
             "team": self.team,
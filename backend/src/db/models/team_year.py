@@ -1,6 +1,6 @@
 from typing import Any, Dict, Tuple
 
-from sqlalchemy import Boolean, Float, Integer, String
+from sqlalchemy import Boolean, Float, Index, Integer, String
 from sqlalchemy.orm import mapped_column
 from sqlalchemy.sql.schema import ForeignKeyConstraint, PrimaryKeyConstraint
 
@@ -16,6 +16,8 @@ class TeamYearORM(Base, ModelORM):
     """DECLARATION"""
 
     __tablename__ = "team_years"
+    # Season leaderboards by EPA, keyed like the cursor ORDER BY
+    __table_args__ = (Index("ix_team_years_year_epa_team", "year", "epa", "team"),)
     id: MOI = mapped_column(Integer, nullable=True)  # placeholder for backend API
     year: MI = mapped_column(Integer, index=True)
     team: MS = mapped_column(String(6))
@@ -136,6 +138,9 @@ _TeamYear = generate_attr_class("TeamYear", TeamYearORM)
 
 
 class TeamYear(_TeamYear, Model):
+    # Only refresh DB if these change (during 1 min partial update)
+    refresh_fields = ["team", "year", "count"]
+
     def sort(self: "TeamYear") -> Tuple[str, int]:
         return (self.team, self.year)
 
@@ -145,10 +150,6 @@ class TeamYear(_TeamYear, Model):
     def __hash__(self: "TeamYear") -> int:
         return hash(self.pk())
 
-    def __str__(self: "TeamYear") -> str:
-        # Only refresh DB if these change (during 1 min partial update)
-        return "_".join([self.team, str(self.year), str(self.count)])
-
     def to_dict(self: "TeamYear") -> Dict[str, Any]:
         lower, upper = get_skew_normal_95_conf_interval(
             0, 1, self.epa_skew, self.epa_n, 2
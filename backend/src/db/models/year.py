@@ -211,16 +211,15 @@ _Year = generate_attr_class("Year", YearORM)
 
 
 class Year(_Year, Model):
+    # Only refresh DB if these change (during 1 min partial update)
+    refresh_fields = ["year", "count"]
+
     def pk(self: "Year") -> str:
         return str(self.year)
 
     def __hash__(self: "Year") -> int:
         return hash(self.pk())
 
-    def __str__(self: "Year") -> str:
-        # Only refresh DB if these change (during 1 min partial update)
-        return "_".join([str(self.year), str(self.count)])
-
     def get_foul_rate(self: "Year") -> float:
         return (self.foul_mean or 0) / (self.no_foul_mean or 1)
 
@@ -1,3 +1,4 @@
+from src.db.read.bundle import get_event_bundle, get_team_year_bundle
 from src.db.read.etag import get_etags, get_num_etags
 from src.db.read.event import get_event, get_events, get_num_events
 from src.db.read.match import get_match, get_matches, get_num_matches
@@ -12,6 +13,8 @@ from src.db.read.team_year import get_num_team_years, get_team_year, get_team_ye
 from src.db.read.year import get_num_years, get_year, get_years
 
 __all__ = [
+    "get_event_bundle",
+    "get_team_year_bundle",
     "get_etags",
     "get_num_etags",
     "get_event",
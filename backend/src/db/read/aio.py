@@ -0,0 +1,56 @@
+# Awaitable versions of the read functions for async endpoints, same signatures
+from src.db.main import to_async
+from src.db.read import (
+    get_event as _get_event,
+    get_event_bundle as _get_event_bundle,
+    get_events as _get_events,
+    get_match as _get_match,
+    get_matches as _get_matches,
+    get_team as _get_team,
+    get_teams as _get_teams,
+    get_team_event as _get_team_event,
+    get_team_events as _get_team_events,
+    get_team_match as _get_team_match,
+    get_team_matches as _get_team_matches,
+    get_team_year as _get_team_year,
+    get_team_year_bundle as _get_team_year_bundle,
+    get_team_years as _get_team_years,
+    get_year as _get_year,
+    get_years as _get_years,
+)
+
+get_event = to_async(_get_event)
+get_event_bundle = to_async(_get_event_bundle)
+get_events = to_async(_get_events)
+get_match = to_async(_get_match)
+get_matches = to_async(_get_matches)
+get_team = to_async(_get_team)
+get_teams = to_async(_get_teams)
+get_team_event = to_async(_get_team_event)
+get_team_events = to_async(_get_team_events)
+get_team_match = to_async(_get_team_match)
+get_team_matches = to_async(_get_team_matches)
+get_team_year = to_async(_get_team_year)
+get_team_year_bundle = to_async(_get_team_year_bundle)
+get_team_years = to_async(_get_team_years)
+get_year = to_async(_get_year)
+get_years = to_async(_get_years)
+
+__all__ = [
+    "get_event",
+    "get_event_bundle",
+    "get_events",
+    "get_match",
+    "get_matches",
+    "get_team",
+    "get_teams",
+    "get_team_event",
+    "get_team_events",
+    "get_team_match",
+    "get_team_matches",
+    "get_team_year",
+    "get_team_year_bundle",
+    "get_team_years",
+    "get_year",
+    "get_years",
+]
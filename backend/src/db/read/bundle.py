@@ -0,0 +1,185 @@
+from typing import Any, Dict, List, Optional
+
+import attr
+from sqlalchemy import or_
+from sqlalchemy.orm.session import Session as SessionType
+from sqlalchemy_cockroachdb import run_transaction  # type: ignore
+
+from src.db.archive import get_archive
+from src.db.main import Session
+from src.db.models.event import Event, EventORM
+from src.db.models.match import Match, MatchORM
+from src.db.models.team_event import TeamEvent, TeamEventORM
+from src.db.models.team_match import TeamMatch, TeamMatchORM
+from src.db.models.team_year import TeamYear, TeamYearORM
+from src.db.models.year import Year, YearORM
+from src.db.read.match import TEAM_COLUMNS
+
+# Everything an event or team year page renders, read in one transaction (or
+# from the archive for closed seasons) instead of one per entity
+
+
+@attr.s(auto_attribs=True, slots=True)
+class EventBundle:
+    event: Event
+    year: Year
+    team_events: List[TeamEvent]
+    matches: List[Match]
+    team_matches: List[TeamMatch]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "event": self.event.to_dict(),
+            "year": self.year.to_dict(),
+            "team_events": [x.to_dict() for x in self.team_events],
+            "matches": [x.to_dict() for x in self.matches],
+            "team_matches": [x.to_dict() for x in self.team_matches],
+        }
+
+
+@attr.s(auto_attribs=True, slots=True)
+class TeamYearBundle:
+    team_year: TeamYear
+    year: Year
+    team_events: List[TeamEvent]
+    matches: List[Match]
+    team_matches: List[TeamMatch]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "team_year": self.team_year.to_dict(),
+            "year": self.year.to_dict(),
+            "team_events": [x.to_dict() for x in self.team_events],
+            "matches": [x.to_dict() for x in self.matches],
+            "team_matches": [x.to_dict() for x in self.team_matches],
+        }
+
+
+def get_key_year(key: str) -> Optional[int]:
+    # Event and match keys start with the year, e.g. 2019ncwak
+    return int(key[:4]) if key[:4].isdigit() else None
+
+
+def query_archives(
+    year: Optional[int], queries: Dict[str, List[Any]]
+) -> Optional[Dict[str, List[Any]]]:
+    # Filters by table, None unless every table is archived
+    archives = {table: get_archive(year, table) for table in queries}
+    out: Dict[str, List[Any]] = {}
+    for table, filters in queries.items():
+        archive = archives[table]
+        if archive is None:
+            return None
+        out[table] = archive.query(filters, None, None, None, None)
+    return out
+
+
+def get_event_bundle(event_id: str) -> Optional[EventBundle]:
+    # Every row of an event shares its offseason flag, so the event key alone
+    # selects the same rows as the per-entity reads
+    archived = query_archives(
+        get_key_year(event_id),
+        {
+            "events": [("key", event_id)],
+            "years": [],
+            "team_events": [("event", event_id)],
+            "matches": [("event", event_id)],
+            "team_matches": [("event", event_id)],
+        },
+    )
+    if archived is not None:
+        if len(archived["events"]) == 0 or len(archived["years"]) == 0:
+            return None
+        return EventBundle(
+            event=archived["events"][0],
+            year=archived["years"][0],
+            team_events=archived["team_events"],
+            matches=archived["matches"],
+            team_matches=archived["team_matches"],
+        )
+
+    def callback(session: SessionType) -> Optional[EventBundle]:
+        data = (
+            session.query(EventORM, YearORM)
+            .join(YearORM, YearORM.year == EventORM.year)
+            .filter(EventORM.key == event_id)
+            .first()
+        )
+        if data is None:
+            return None
+        event, year_obj = data
+
+        team_events = session.query(TeamEventORM).filter(TeamEventORM.event == event_id)
+        matches = session.query(MatchORM).filter(MatchORM.event == event_id)
+        team_matches = session.query(TeamMatchORM).filter(
+            TeamMatchORM.event == event_id
+        )
+        return EventBundle(
+            event=Event.from_dict(event.__dict__),
+            year=Year.from_dict(year_obj.__dict__),
+            team_events=[TeamEvent.from_dict(x.__dict__) for x in team_events],
+            matches=[Match.from_dict(x.__dict__) for x in matches],
+            team_matches=[TeamMatch.from_dict(x.__dict__) for x in team_matches],
+        )
+
+    return run_transaction(Session, callback)  # type: ignore
+
+
+def get_team_year_bundle(team: str, year: int) -> Optional[TeamYearBundle]:
+    # Season play only, matching the per-entity reads' offseason=False default
+    archived = query_archives(
+        year,
+        {
+            "team_years": [("team", team)],
+            "years": [],
+            "team_events": [("team", team), ("offseason", False)],
+            "matches": [(TEAM_COLUMNS, team), ("offseason", False)],
+            "team_matches": [("team", team), ("offseason", False)],
+        },
+    )
+    if archived is not None:
+        if len(archived["team_years"]) == 0 or len(archived["years"]) == 0:
+            return None
+        return TeamYearBundle(
+            team_year=archived["team_years"][0],
+            year=archived["years"][0],
+            team_events=archived["team_events"],
+            matches=archived["matches"],
+            team_matches=archived["team_matches"],
+        )
+
+    def callback(session: SessionType) -> Optional[TeamYearBundle]:
+        data = (
+            session.query(TeamYearORM, YearORM)
+            .join(YearORM, YearORM.year == TeamYearORM.year)
+            .filter(TeamYearORM.team == team, TeamYearORM.year == year)
+            .first()
+        )
+        if data is None:
+            return None
+        team_year, year_obj = data
+
+        team_events = session.query(TeamEventORM).filter(
+            TeamEventORM.team == team,
+            TeamEventORM.year == year,
+            TeamEventORM.offseason == False,  # noqa: E712
+        )
+        matches = session.query(MatchORM).filter(
+            or_(*[MatchORM.__dict__[c] == team for c in TEAM_COLUMNS]),
+            MatchORM.year == year,
+            MatchORM.offseason == False,  # noqa: E712
+        )
+        team_matches = session.query(TeamMatchORM).filter(
+            TeamMatchORM.team == team,
+            TeamMatchORM.year == year,
+            TeamMatchORM.offseason == False,  # noqa: E712
+        )
+        return TeamYearBundle(
+            team_year=TeamYear.from_dict(team_year.__dict__),
+            year=Year.from_dict(year_obj.__dict__),
+            team_events=[TeamEvent.from_dict(x.__dict__) for x in team_events],
+            matches=[Match.from_dict(x.__dict__) for x in matches],
+            team_matches=[TeamMatch.from_dict(x.__dict__) for x in team_matches],
+        )
+
+    return run_transaction(Session, callback)  # type: ignore
@@ -1,5 +1,8 @@
-from typing import Any, List, Optional, Type, TypeVar
+from typing import Any, List, Optional, Sequence, Type, TypeVar
 
+from sqlalchemy import tuple_
+
+from src.db.cursor import decode_cursor, get_columns
 from src.db.models.main import Model, ModelORM
 
 T = TypeVar("T")
@@ -12,21 +15,48 @@ def common_filters(
     ascending: Optional[bool],
     limit: Optional[int],
     offset: Optional[int],
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
 ) -> Any:
     def decorator(func: Any) -> Any:
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             data = func(*args, **kwargs)
 
+            # Primary key breaks ties, so pages and cursors are deterministic.
+            # Every column sorts in one direction, so a (year, metric, key)
+            # index serves both directions and a cursor is one row comparison.
+            order = [
+                model_orm.__dict__[c.name] for c in model_orm.__table__.primary_key
+            ]
+            descending = False
             if metric is not None:
-                data = data.filter(model_orm.__dict__[metric] != None)  # noqa: E711
-                if ascending is not None and ascending:
-                    data = data.order_by(model_orm.__dict__[metric].asc())
-                else:
-                    data = data.order_by(model_orm.__dict__[metric].desc())
+                column = model_orm.__dict__[metric]
+                data = data.filter(column != None)  # noqa: E711
+                order = [column] + order
+                descending = not ascending
+            if descending:
+                data = data.order_by(*[x.desc() for x in order])
+            else:
+                data = data.order_by(*order)
+
+            if cursor is not None:
+                # Rows after the cursor's key in the order above
+                key, _ = decode_cursor(cursor, metric, ascending)
+                row, last = tuple_(*order), tuple_(*key)
+                data = data.filter(row < last if descending else row > last)
+
             if limit is not None:
                 data = data.limit(limit)
             if offset is not None:
                 data = data.offset(offset)
+
+            if fields is not None:
+                # Selects only these columns, the rest of each model is None
+                names = get_columns(model_orm, fields, metric)
+                columns = [model_orm.__dict__[name] for name in names]
+                rows = data.with_entities(*columns).all()
+                return [model.from_dict(row._asdict()) for row in rows]
+
             out_data: List[model_orm] = data.all()
 
             return [model.from_dict(x.__dict__) for x in out_data]
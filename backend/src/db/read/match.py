@@ -1,12 +1,15 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from sqlalchemy.orm.session import Session as SessionType
 from sqlalchemy_cockroachdb import run_transaction  # type: ignore
 
+from src.db.archive import get_archive
 from src.db.main import Session
 from src.db.models.match import Match, MatchORM
 from src.db.read.main import common_filters
 
+TEAM_COLUMNS = ("red_1", "red_2", "red_3", "blue_1", "blue_2", "blue_3")
+
 
 def get_match(match: str) -> Optional[Match]:
     def callback(session: SessionType):
@@ -31,8 +34,21 @@ def get_matches(
     ascending: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
 ) -> List[Match]:
-    @common_filters(MatchORM, Match, metric, ascending, limit, offset)
+    archive = get_archive(year, "matches")
+    if archive is not None:
+        filters = [
+            (TEAM_COLUMNS, team),
+            ("event", event),
+            ("week", week),
+            ("elim", elim),
+            ("offseason", offseason),
+        ]
+        return archive.query(filters, metric, ascending, limit, offset, cursor, fields)
+
+    @common_filters(MatchORM, Match, metric, ascending, limit, offset, cursor, fields)
     def callback(session: SessionType):
         data = session.query(MatchORM)
         if team is not None:
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from sqlalchemy.orm.session import Session as SessionType
 from sqlalchemy_cockroachdb import run_transaction  # type: ignore
@@ -26,8 +26,10 @@ def get_teams(
     ascending: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
 ) -> List[Team]:
-    @common_filters(TeamORM, Team, metric, ascending, limit, offset)
+    @common_filters(TeamORM, Team, metric, ascending, limit, offset, cursor, fields)
     def callback(session: SessionType):
         data = session.query(TeamORM)
         if country is not None:
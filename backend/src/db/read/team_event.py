@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from sqlalchemy.orm.session import Session as SessionType
 from sqlalchemy_cockroachdb import run_transaction  # type: ignore
 
+from src.db.archive import get_archive
 from src.db.main import Session
 from src.db.models.team_event import TeamEvent, TeamEventORM
 from src.db.read.main import common_filters
@@ -35,8 +36,26 @@ def get_team_events(
     ascending: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
 ) -> List[TeamEvent]:
-    @common_filters(TeamEventORM, TeamEvent, metric, ascending, limit, offset)
+    archive = get_archive(year, "team_events")
+    if archive is not None:
+        filters = [
+            ("team", team),
+            ("event", event),
+            ("country", country),
+            ("state", state),
+            ("district", district),
+            ("type", type),
+            ("week", week),
+            ("offseason", offseason),
+        ]
+        return archive.query(filters, metric, ascending, limit, offset, cursor, fields)
+
+    @common_filters(
+        TeamEventORM, TeamEvent, metric, ascending, limit, offset, cursor, fields
+    )
     def callback(session: SessionType):
         data = session.query(TeamEventORM)
         if team is not None:
@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from sqlalchemy.orm.session import Session as SessionType
 from sqlalchemy_cockroachdb import run_transaction  # type: ignore
 
+from src.db.archive import get_archive
 from src.db.main import Session
 from src.db.models.team_year import TeamYear, TeamYearORM
 from src.db.read.main import common_filters
@@ -33,8 +34,24 @@ def get_team_years(
     ascending: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
 ) -> List[TeamYear]:
-    @common_filters(TeamYearORM, TeamYear, metric, ascending, limit, offset)
+    archive = get_archive(year, "team_years")
+    if archive is not None:
+        filters = [
+            ("team", team),
+            ("team", teams),
+            ("country", country),
+            ("state", state),
+            ("district", district),
+            ("offseason", offseason),
+        ]
+        return archive.query(filters, metric, ascending, limit, offset, cursor, fields)
+
+    @common_filters(
+        TeamYearORM, TeamYear, metric, ascending, limit, offset, cursor, fields
+    )
     def callback(session: SessionType):
         data = session.query(TeamYearORM)
         if team is not None:
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from sqlalchemy.orm.session import Session as SessionType
 from sqlalchemy_cockroachdb import run_transaction  # type: ignore
@@ -23,8 +23,10 @@ def get_years(
     ascending: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
 ) -> List[Year]:
-    @common_filters(YearORM, Year, metric, ascending, limit, offset)
+    @common_filters(YearORM, Year, metric, ascending, limit, offset, cursor, fields)
     def callback(session: SessionType):
         return session.query(YearORM)
 
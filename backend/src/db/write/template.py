@@ -1,77 +1,148 @@
-from typing import Any, Callable, Dict, List, Type
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
 
-import attr
-from sqlalchemy.dialects import postgresql
+from psycopg2.extras import execute_values
 from sqlalchemy.orm.session import Session as SessionType
 from sqlalchemy_cockroachdb import run_transaction  # type: ignore
 
-from src.db.main import Session
-from src.db.models.etag import ETagORM
-from src.db.models.event import EventORM
+from src.db.main import Session, engine
 from src.db.models.main import TModel, TModelORM
-from src.db.models.match import MatchORM
-from src.db.models.team import TeamORM
-from src.db.models.team_event import TeamEventORM
-from src.db.models.team_match import TeamMatchORM
-from src.db.models.team_year import TeamYearORM
-from src.db.models.year import YearORM
 
 CUTOFF = 1000
 
+# Changed columns per item, None for a full row (None overall for all full rows)
+columns_type = Optional[List[Optional[List[str]]]]
+
+row_type = Tuple[Any, ...]
+
+
+def get_rows(
+    orm_type: Type[TModelORM], names: List[str], items: List[Any]
+) -> Iterator[List[row_type]]:
+    # Parameter tuples read straight from the attrs slots, with SQLAlchemy's bind
+    # processors (enums to values, numpy scalars to floats and bools) applied
+    getter = attrgetter(*names)
+    columns = orm_type.__table__.columns
+    processors = [
+        (i, processor)
+        for i, name in enumerate(names)
+        if (processor := columns[name].type.bind_processor(engine.dialect))
+    ]
+
+    for i in range(0, len(items), CUTOFF):
+        rows = [getter(item) for item in items[i : i + CUTOFF]]
+        if len(names) == 1:
+            rows = [(row,) for row in rows]
+        if len(processors) > 0:
+            rows = [list(row) for row in rows]
+            for row in rows:
+                for j, processor in processors:
+                    row[j] = processor(row[j])
+        yield rows  # type: ignore
+
+
+def write_batches(
+    sql: str, template: Optional[str], batches: Iterator[List[row_type]]
+) -> None:
+    # Each batch commits on its own, so a transaction retry only replays that
+    # batch. The next batch is built on a thread while the current one is sent.
+    def callback(rows: List[row_type], session: SessionType) -> None:
+        with session.connection().connection.cursor() as cursor:
+            execute_values(cursor, sql, rows, template=template, page_size=len(rows))
+
+    with ThreadPoolExecutor(1) as pool:
+        future = pool.submit(next, batches, None)
+        while True:
+            rows = future.result()
+            if rows is None:
+                break
+            future = pool.submit(next, batches, None)
+            run_transaction(Session, partial(callback, rows))
+
 
 def update_template(
     orm_type: Type[TModelORM], obj_type: Type[TModel]
-) -> Callable[[List[TModel], bool], None]:
-    def upsert(items: List[obj_type], insert_only: bool = False) -> None:
-        def _insert(session: SessionType, data: List[Dict[str, Any]]):
-            for i in range(0, len(data), CUTOFF):
-                session.bulk_insert_mappings(orm_type, data[i : i + CUTOFF])  # type: ignore
-
-        def _update(
-            session: SessionType, primary_key: List[str], data: List[Dict[str, Any]]
-        ):
-            for i in range(0, len(data), CUTOFF):
-                insert = postgresql.insert(orm_type.__table__).values(
-                    data[i : i + CUTOFF]
-                )
-                update_cols = {
-                    c.name: c for c in insert.excluded if c.name not in primary_key
-                }
-                update = insert.on_conflict_do_update(
-                    index_elements=primary_key, set_=update_cols
-                )
-                session.execute(update.execution_options(synchronize_session=False))
-
-        def callback(session: SessionType):
-            new_items = [attr.asdict(x) for x in items]
-
-            if orm_type == ETagORM:
-                primary_key = ["path"]
-            elif orm_type == TeamORM:
-                primary_key = ["team"]
-            elif orm_type == YearORM:
-                primary_key = ["year"]
-            elif orm_type == TeamYearORM:
-                primary_key = ["team", "year"]
-            elif orm_type == EventORM:
-                primary_key = ["key"]
-            elif orm_type == TeamEventORM:
-                primary_key = ["team", "event"]
-            elif orm_type == MatchORM:
-                primary_key = ["key"]
-            elif orm_type == TeamMatchORM:
-                primary_key = ["team", "match"]
-            else:
-                raise Exception("Unknown orm_type: " + str(orm_type))
-
-            if insert_only:
-                return _insert(session, new_items)
-            return _update(session, primary_key, new_items)
+) -> Callable[[List[TModel], bool, columns_type], None]:
+    table = orm_type.__table__
+    quote = engine.dialect.identifier_preparer.quote
+    table_name = quote(table.name)
+    primary_key = [c.name for c in table.primary_key]
 
+    def _insert(items: List[obj_type]) -> None:
+        names = obj_type.field_names
+        sql = (
+            f"INSERT INTO {table_name} ({', '.join(quote(n) for n in names)}) "
+            "VALUES %s"
+        )
+        write_batches(sql, None, get_rows(orm_type, names, items))
+
+    def _update(items: List[obj_type]) -> None:
+        names = obj_type.field_names
+        update_cols = [n for n in names if n not in primary_key]
+        sql = (
+            f"INSERT INTO {table_name} ({', '.join(quote(n) for n in names)}) "
+            f"VALUES %s ON CONFLICT ({', '.join(quote(n) for n in primary_key)}) "
+            "DO UPDATE SET "
+            + ", ".join(f"{quote(n)} = excluded.{quote(n)}" for n in update_cols)
+        )
+        write_batches(sql, None, get_rows(orm_type, names, items))
+
+    def _update_columns(columns: List[str], items: List[obj_type]) -> None:
+        # Existing rows only, UPDATE joined on the primary key against a VALUES
+        # list, typed with casts since the list has no target columns
+        names = primary_key + columns
+        template = (
+            "("
+            + ", ".join(
+                "%s::" + table.columns[n].type.compile(dialect=engine.dialect)
+                for n in names
+            )
+            + ")"
+        )
+        sql = (
+            f"UPDATE {table_name} SET "
+            + ", ".join(f"{quote(n)} = v.{quote(n)}" for n in columns)
+            + f" FROM (VALUES %s) AS v ({', '.join(quote(n) for n in names)}) "
+            + "WHERE "
+            + " AND ".join(
+                f"{table_name}.{quote(n)} = v.{quote(n)}" for n in primary_key
+            )
+        )
+        write_batches(sql, template, get_rows(orm_type, names, items))
+
+    def upsert(
+        items: List[obj_type],
+        insert_only: bool = False,
+        columns: columns_type = None,
+    ) -> None:
         # short circuit if no items
         if len(items) == 0:
             return
 
-        run_transaction(Session, callback)
+        if insert_only:
+            return _insert(items)
+
+        if columns is None:
+            return _update(items)
+
+        full_items: List[obj_type] = []
+        partial_items: Dict[Tuple[str, ...], List[obj_type]] = {}
+        for item, item_columns in zip(items, columns):
+            if item_columns is None:
+                full_items.append(item)
+                continue
+
+            key = tuple(sorted(c for c in item_columns if c not in primary_key))
+            if len(key) > 0:
+                partial_items.setdefault(key, []).append(item)
+
+        if len(full_items) > 0:
+            _update(full_items)
+
+        # One statement shape per set of changed columns
+        for key, group_items in partial_items.items():
+            _update_columns(list(key), group_items)
 
     return upsert
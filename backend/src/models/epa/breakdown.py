@@ -1,4 +1,4 @@
-from typing import Any, Tuple
+from typing import Any, List, NamedTuple, Optional, Tuple
 
 from src.db.models import Year
 from src.models.epa.math import t_prob_gt_0, unit_sigmoid, zero_sigmoid
@@ -76,71 +76,48 @@ def post_process_breakdown(
     return breakdown
 
 
-def get_pred_rps(
-    year: int, week: int, breakdown_mean: Any, breakdown_sd: Any
-) -> Tuple[float, float]:
-    DISCOUNT = 0.85  # Teams try harder when near the threshold
-    keys = all_keys[year]
-    rp_1, rp_2 = 0, 0
-    if year == 2016:
-        boulders_mean = breakdown_mean[keys.index("boulders")]
-        boulders_sd = breakdown_sd[keys.index("boulders")]
+class RPRule(NamedTuple):
+    key: str  # breakdown component
+    threshold: Optional[float]  # RP if the component exceeds it, else a probability
 
-        rp_1 = breakdown_mean[keys.index("rp_1")]
-        rp_2 = t_prob_gt_0(boulders_mean - 8 * DISCOUNT, boulders_sd)
-        if week >= 8:
-            rp_2 = t_prob_gt_0(boulders_mean - 10 * DISCOUNT, boulders_sd)
 
+def get_rp_rules(year: int, week: int) -> Tuple[Optional[RPRule], Optional[RPRule]]:
+    DISCOUNT = 0.85  # Teams try harder when near the threshold
+    if year == 2016:
+        boulders = 10 if week >= 8 else 8
+        return RPRule("rp_1", None), RPRule("boulders", boulders * DISCOUNT)
     elif year == 2017:
-        kpa_mean = breakdown_mean[keys.index("kpa")]
-        kpa_sd = breakdown_sd[keys.index("kpa")]
-
-        gears_mean = breakdown_mean[keys.index("gears")]
-        gears_sd = breakdown_sd[keys.index("gears")]
-
-        rp_1 = t_prob_gt_0(kpa_mean - 40 * DISCOUNT, kpa_sd)
-        rp_2 = t_prob_gt_0(gears_mean - 13 * DISCOUNT, gears_sd)
-
+        return RPRule("kpa", 40 * DISCOUNT), RPRule("gears", 13 * DISCOUNT)
     elif year == 2018:
-        rp_1 = breakdown_mean[keys.index("rp_1")]
-        rp_2 = breakdown_mean[keys.index("rp_2")]
-
+        return RPRule("rp_1", None), RPRule("rp_2", None)
     elif year == 2019:
-        rocket_mean = breakdown_mean[keys.index("rocket_pieces")]
-        rocket_sd = breakdown_sd[keys.index("rocket_pieces")]
-
-        rp_1 = breakdown_mean[keys.index("rp_1")]
-        rp_2 = t_prob_gt_0(rocket_mean - 12 * DISCOUNT, rocket_sd)
-
+        return RPRule("rp_1", None), RPRule("rocket_pieces", 12 * DISCOUNT)
     elif year == 2020:
-        rp_1 = breakdown_mean[keys.index("rp_1")]
-        rp_2 = breakdown_mean[keys.index("rp_2")]
-
+        return RPRule("rp_1", None), RPRule("rp_2", None)
     elif year == 2022:
-        cargo_mean = breakdown_mean[keys.index("cargo")]
-        cargo_sd = breakdown_sd[keys.index("cargo")]
-
-        rp_1 = t_prob_gt_0(cargo_mean - 20 * DISCOUNT, cargo_sd)
-        rp_2 = breakdown_mean[keys.index("rp_2")]
-
+        return RPRule("cargo", 20 * DISCOUNT), RPRule("rp_2", None)
     elif year == 2023:
-        links_mean = breakdown_mean[keys.index("links")]
-        links_sd = breakdown_sd[keys.index("links")]
-
-        rp_1 = t_prob_gt_0(links_mean - 4 * DISCOUNT, links_sd)
-        if week >= 8:
-            rp_1 = t_prob_gt_0(links_mean - 5 * DISCOUNT, links_sd)
-
-        rp_2 = breakdown_mean[keys.index("rp_2")]
-
+        links = 5 if week >= 8 else 4
+        return RPRule("links", links * DISCOUNT), RPRule("rp_2", None)
     elif year == 2024:
-        total_notes_mean = breakdown_mean[keys.index("total_notes")]
-        total_notes_sd = breakdown_sd[keys.index("total_notes")]
+        return RPRule("total_notes", 18 * DISCOUNT), RPRule("rp_2", None)
+    return None, None
 
-        rp_1 = t_prob_gt_0(total_notes_mean - 18 * DISCOUNT, total_notes_sd)
-        rp_2 = breakdown_mean[keys.index("rp_2")]
 
-    return rp_1, rp_2
+def get_pred_rps(
+    year: int, week: int, breakdown_mean: Any, breakdown_sd: Any
+) -> Tuple[float, float]:
+    keys = all_keys[year]
+    rps: List[float] = []
+    for rule in get_rp_rules(year, week):
+        if rule is None:
+            rps.append(0)
+        elif rule.threshold is None:
+            rps.append(breakdown_mean[keys.index(rule.key)])
+        else:
+            i = keys.index(rule.key)
+            rps.append(t_prob_gt_0(breakdown_mean[i] - rule.threshold, breakdown_sd[i]))
+    return rps[0], rps[1]
 
 
 def get_score_from_breakdown(
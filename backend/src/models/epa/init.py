@@ -31,19 +31,24 @@ def norm_epa_to_next_season_epa(
 
 
 def get_init_epa(
-    year: Year, team_year_1: Optional[TeamYear], team_year_2: Optional[TeamYear]
+    year: Year,
+    team_year_1: Optional[TeamYear],
+    team_year_2: Optional[TeamYear],
+    init_penalty: float = INIT_PENALTY,
+    year_one_weight: float = YEAR_ONE_WEIGHT,
+    mean_reversion: float = MEAN_REVERSION,
 ) -> SkewNormal:
     num_teams, year_mean, year_sd = get_constants(year)
 
-    INIT_EPA = NORM_MEAN - INIT_PENALTY * NORM_SD
+    INIT_EPA = NORM_MEAN - init_penalty * NORM_SD
     norm_epa_1 = norm_epa_2 = INIT_EPA
     if team_year_1 is not None and team_year_1.norm_epa is not None:
         norm_epa_1 = team_year_1.norm_epa
     if team_year_2 is not None and team_year_2.norm_epa is not None:
         norm_epa_2 = team_year_2.norm_epa
 
-    prev_norm_epa = YEAR_ONE_WEIGHT * norm_epa_1 + (1 - YEAR_ONE_WEIGHT) * norm_epa_2
-    curr_norm_epa = (1 - MEAN_REVERSION) * prev_norm_epa + MEAN_REVERSION * INIT_EPA
+    prev_norm_epa = year_one_weight * norm_epa_1 + (1 - year_one_weight) * norm_epa_2
+    curr_norm_epa = (1 - mean_reversion) * prev_norm_epa + mean_reversion * INIT_EPA
 
     curr_epa_z_score = (curr_norm_epa - NORM_MEAN) / NORM_SD
 
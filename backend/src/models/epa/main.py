@@ -10,7 +10,12 @@ from src.models.epa.breakdown import (
     post_process_attrib,
     post_process_breakdown,
 )
-from src.models.epa.constants import ELIM_WEIGHT
+from src.models.epa.constants import (
+    ELIM_WEIGHT,
+    INIT_PENALTY,
+    MEAN_REVERSION,
+    YEAR_ONE_WEIGHT,
+)
 from src.models.epa.init import get_init_epa
 from src.models.epa.math import SkewNormal, t_prob_gt_0
 from src.models.template import Model
@@ -22,6 +27,12 @@ from src.utils.utils import r
 class EPA(Model):
     k: float
 
+    # Read through self, so a backtest can tune them per model instance
+    elim_weight: float = ELIM_WEIGHT
+    init_penalty: float = INIT_PENALTY
+    year_one_weight: float = YEAR_ONE_WEIGHT
+    mean_reversion: float = MEAN_REVERSION
+
     """
     @staticmethod
     def k_func(year: int) -> float:
@@ -41,6 +52,21 @@ class EPA(Model):
             return 1 / 2 * prev
         return 2 / 3 * prev
 
+    def get_init_rating(
+        self,
+        year: Year,
+        team_year_1: Optional[TeamYear],
+        team_year_2: Optional[TeamYear],
+    ) -> SkewNormal:
+        return get_init_epa(
+            year,
+            team_year_1,
+            team_year_2,
+            self.init_penalty,
+            self.year_one_weight,
+            self.mean_reversion,
+        )
+
     def start_season(
         self,
         year: Year,
@@ -50,7 +76,7 @@ class EPA(Model):
         super().start_season(year, all_team_years, team_years)
         # self.k = EPA.k_func(self.year_num)
 
-        init_rating = get_init_epa(year, None, None)
+        init_rating = self.get_init_rating(year, None, None)
         self.epas: Dict[str, SkewNormal] = defaultdict(lambda: init_rating)
         self.counts: Dict[str, int] = defaultdict(int)
 
@@ -66,7 +92,7 @@ class EPA(Model):
             past_team_year_1 = past_team_years[0] if len(past_team_years) > 0 else None
             past_team_year_2 = past_team_years[1] if len(past_team_years) > 1 else None
 
-            rating = get_init_epa(year, past_team_year_1, past_team_year_2)
+            rating = self.get_init_rating(year, past_team_year_1, past_team_year_2)
 
             self.epas[num] = rating
             team_year.epa_start = r(rating.mean[0], 2)
@@ -182,7 +208,7 @@ class EPA(Model):
             my_err = bd - pred_bd
             opp_err = opp_bd - opp_pred_bd
             for t in teams:
-                margin = EPA.margin_func(self.year_num, self.counts[t])
+                margin = self.margin_func(self.year_num, self.counts[t])
                 err = (my_err - margin * opp_err) / (1 + margin)
                 attrib = self.epas[t].mean + err / self.num_teams
                 attrib = post_process_attrib(
@@ -195,8 +221,8 @@ class EPA(Model):
     def update_team(
         self, team: str, attrib: Attribution, match: Match, team_match: TeamMatch
     ) -> None:
-        weight = ELIM_WEIGHT if match.elim else 1
-        percent = EPA.percent_func(self.year_num, self.counts[team])
+        weight = self.elim_weight if match.elim else 1
+        percent = self.percent_func(self.year_num, self.counts[team])
         self.epas[team].add_obs(attrib.epa, percent, weight)
         if not match.elim:
             self.counts[team] += 1
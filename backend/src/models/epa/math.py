@@ -3,7 +3,8 @@ from functools import lru_cache
 from typing import Any, Optional, Tuple
 
 import numpy as np
-import scipy.stats  # type: ignore
+
+from src.models.epa.kernels import get_skew_normal_params, skew_normal_interval, t_cdf
 
 """
 # NOTE: Unused in favor of t_prob_gt_0()
@@ -15,17 +16,11 @@ def normal_prob_gt_0(mean: float, sd: float) -> float:
 # 1 / (1 - p) where p = 0.8, the decay rate of the EWMA. By the Bayesian
 # conjugate prior of the normal distribution, the posterior predictive of
 # the mean is a t-distribution with equal degrees of freedom
+# Accepts NumPy arrays to score batches of matches at once
 
 
-@lru_cache(maxsize=None)
-def get_t_distrib(int_n: int = 5000) -> Any:
-    n = int_n / 1000
-    return scipy.stats.t(n)
-
-
-def t_prob_gt_0(mean: float, sd: float, n: Any = 5) -> float:
-    t_distrib = get_t_distrib(int(n * 1000))
-    return t_distrib.cdf(mean / sd)  # type: ignore
+def t_prob_gt_0(mean: Any, sd: Any, n: Any = 5) -> Any:
+    return t_cdf(mean / sd, n)
 
 
 MAX_SKEW = 0.95
@@ -34,23 +29,7 @@ MAX_SKEW = 0.95
 @lru_cache(maxsize=None)
 def _get_skew_normal_95_conf_interval(skew_int: int) -> Tuple[Any, Any]:
     skew = skew_int / 1e3  # for better caching
-
-    # https://en.wikipedia.org/wiki/Skew_normal_distribution
-    abs_skew = abs(skew)
-    sign_skew = 1 if skew >= 0 else -1
-
-    c = np.pi / 2
-    numerator = abs_skew ** (2 / 3)
-    denominator = numerator + ((4 - np.pi) / 2) ** (2 / 3)
-    delta = sign_skew * np.sqrt(c * numerator / denominator)
-    a = delta / np.sqrt(1 - delta**2)
-
-    # assumes mean 0, var 1 (rescale after)
-    omega = 1 / np.sqrt(1 - 2 * delta**2 / np.pi)
-    xi = -omega * delta * np.sqrt(2 / np.pi)
-
-    skewnorm_distrib = scipy.stats.skewnorm(a, loc=xi, scale=omega)
-    return skewnorm_distrib.interval(0.95)  # type: ignore
+    return skew_normal_interval(skew, 0.95)
 
 
 def get_skew_normal_95_conf_interval(
@@ -119,21 +98,10 @@ class SkewNormal:
         self.n = new_n * weight + (1 - weight) * n
 
     def get_distrib(self) -> Any:
-        # https://en.wikipedia.org/wiki/Skew_normal_distribution
-        skew = self.skew
-        abs_skew = abs(skew)
-        sign_skew = 1 if skew >= 0 else -1
-
-        c = np.pi / 2
-        numerator = abs_skew ** (2 / 3)
-        denominator = numerator + ((4 - np.pi) / 2) ** (2 / 3)
-        delta = sign_skew * np.sqrt(c * numerator / denominator)
-        a = delta / np.sqrt(1 - delta**2)
+        import scipy.stats  # type: ignore
 
         # assumes mean 0, var 1 (rescale after)
-        omega = 1 / np.sqrt(1 - 2 * delta**2 / np.pi)
-        xi = -omega * delta * np.sqrt(2 / np.pi)
-
+        a, xi, omega = get_skew_normal_params(self.skew)
         distrib = scipy.stats.skewnorm(a, loc=xi, scale=omega)
 
         return distrib
@@ -0,0 +1,235 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import attr
+import numpy as np
+
+from src.db.models import Match, TeamEvent
+from src.models.epa.breakdown import get_rp_rules
+from src.models.epa.kernels import get_skew_normal_params
+from src.models.epa.math import unit_sigmoid
+from src.tba.breakdown import all_keys
+from src.types.enums import MatchStatus, MatchWinner
+
+QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+NUM_CAPTAINS = 8
+BATCH_SIZE = 2000  # simulations per batch, bounds memory to ~100 MB
+
+
+@attr.s(auto_attribs=True, slots=True)
+class SimResult:
+    teams: List[str]
+    num_sims: int
+    rank_probs: Any  # (teams x ranks), P(team finishes at rank)
+    mean_rank: Any
+    captain_prob: Any  # P(rank <= NUM_CAPTAINS)
+    mean_rps: Any
+    rp_quantiles: Any  # (teams x QUANTILES) of total RPs
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "num_sims": self.num_sims,
+            "quantiles": QUANTILES,
+            "teams": [
+                {
+                    "team": team,
+                    "mean_rank": round(float(self.mean_rank[i]), 2),
+                    "captain_prob": round(float(self.captain_prob[i]), 4),
+                    "mean_rps": round(float(self.mean_rps[i]), 2),
+                    "rp_quantiles": [float(x) for x in self.rp_quantiles[i]],
+                    "rank_probs": [round(float(x), 4) for x in self.rank_probs[i]],
+                }
+                for i, team in enumerate(self.teams)
+            ],
+        }
+
+
+def get_component_attr(index: int) -> str:
+    # TeamEvent field for a breakdown index, see VectorizedEPA.post_record_id
+    names = ["epa", "auto_epa", "teleop_epa", "endgame_epa"]
+    names += ["rp_1_epa", "rp_2_epa", "tiebreaker_epa"]
+    return names[index] if index < len(names) else f"comp_{index - 6}_epa"
+
+
+def simulate_event(
+    year: int,
+    week: int,
+    team_events: List[TeamEvent],
+    matches: List[Match],
+    num_sims: int = 10000,
+    seed: Optional[int] = None,
+) -> SimResult:
+    """
+    Monte Carlo rollouts of an event's remaining qualification matches.
+
+    Completed matches keep their actual RPs and tiebreaker points. Remaining
+    matches draw each team's performance from its skew normal EPA distribution
+    (one standardized draw per alliance per match, shared by its teams and all
+    components, as the model treats alliances as fully correlated), then award
+    win and bonus RPs with the same rules as get_pred_rps. Teams are ranked by
+    RP average, then tiebreaker average, then randomly.
+    """
+
+    rng = np.random.default_rng(seed)
+    keys = all_keys[year]
+    teams = [te.team for te in team_events]
+    team_ids = {t: i for i, t in enumerate(teams)}
+    num_teams = len(teams)
+
+    # Score, bonus RP sources, tiebreaker (by year, None if not modeled)
+    rules = [r for r in get_rp_rules(year, week) if r is not None]
+    components = [0] + [keys.index(r.key) for r in rules]
+    if year >= 2016:
+        components.append(keys.index("tiebreaker_points"))
+    attrs = [get_component_attr(c) for c in components]
+    mean = np.array([[getattr(te, a) or 0 for a in attrs] for te in team_events])
+    sd = np.array([[getattr(te, a + "_sd") or 0 for a in attrs] for te in team_events])
+
+    # Skew normal with mean 0, var 1 (see get_skew_normal_params) drawn as
+    # xi + omega * (delta * |Z0| + sqrt(1 - delta^2) * Z1)
+    skew_params = [get_skew_normal_params(te.epa_skew or 0) for te in team_events]
+    shape = np.array([a for a, _, _ in skew_params])
+    delta = shape / np.sqrt(1 + shape**2)
+    xi = np.array([x for _, x, _ in skew_params])
+    omega = np.array([o for _, _, o in skew_params])
+
+    base_rps = np.zeros(num_teams)
+    base_tiebreakers = np.zeros(num_teams)
+    counts = np.zeros(num_teams)
+    schedule: List[List[int]] = []  # red then blue ids, remaining matches
+    num_red = 0
+    for match in sorted(matches, key=lambda m: m.time):
+        if match.elim:
+            continue
+        alliances = [match.get_red(), match.get_blue()]
+        if any(t not in team_ids for alliance in alliances for t in alliance):
+            continue
+
+        if match.status == MatchStatus.COMPLETED:
+            excluded = set(match.get_red_surrogates() + match.get_blue_surrogates())
+            for alliance, teams_ in zip(["red", "blue"], alliances):
+                win = match.winner == alliance
+                tie = match.winner == MatchWinner.TIE
+                rps = 2 * win + tie
+                rps += (getattr(match, f"{alliance}_rp_1") or 0) + (
+                    getattr(match, f"{alliance}_rp_2") or 0
+                )
+                # Total score breaks ties before 2016
+                tiebreaker_key = "tiebreaker" if year >= 2016 else "score"
+                tiebreaker = getattr(match, f"{alliance}_{tiebreaker_key}") or 0
+                for t in teams_:
+                    if t in excluded:
+                        continue
+                    base_rps[team_ids[t]] += rps
+                    base_tiebreakers[team_ids[t]] += tiebreaker
+                    counts[team_ids[t]] += 1
+            continue
+
+        num_red = len(alliances[0])
+        if len(alliances[1]) != num_red:
+            continue
+        schedule.append([team_ids[t] for t in alliances[0] + alliances[1]])
+        for t in alliances[0] + alliances[1]:
+            counts[team_ids[t]] += 1
+
+    counts = np.maximum(counts, 1)
+    num_matches = len(schedule)
+    slots = np.array(schedule, dtype=int).reshape(num_matches, 2 * num_red)
+
+    # Team draw = mean + sd * z, with z shared by the alliance (fully correlated,
+    # as in predict_ids), so the skew normal terms fold into alliance means and
+    # noise scales for |Z0| and Z1
+    slot_sds = sd[slots]
+    alliance_shape = (num_matches, 2, num_red, len(components))
+    means = (mean[slots] + xi[slots][..., None] * slot_sds).reshape(alliance_shape)
+    scales_0 = (omega * delta)[slots][..., None] * slot_sds
+    scales_1 = (omega * np.sqrt(1 - delta**2))[slots][..., None] * slot_sds
+    sds = np.stack(
+        [
+            scales_0.reshape(alliance_shape).sum(axis=2),
+            scales_1.reshape(alliance_shape).sum(axis=2),
+        ],
+        axis=-1,
+    )
+    # (matches, 2, components, 1) and (matches, 2, components, 2)
+    means = means.sum(axis=2)[..., None]
+
+    # Alliance incidence, teams x (matches * 2), to sum alliance RPs per team
+    incidence = np.zeros((num_teams, num_matches, 2))
+    for m, ids in enumerate(schedule):
+        np.add.at(incidence[:, m, 0], ids[:num_red], 1)
+        np.add.at(incidence[:, m, 1], ids[num_red:], 1)
+    incidence = incidence.reshape(num_teams, num_matches * 2)
+
+    # Arrays below are (teams x sims), sims last keeps the matmuls BLAS sized
+    team_range = np.arange(num_teams)[:, None]
+    rank_counts = np.zeros((num_teams, num_teams))
+    all_rps: List[Any] = []
+    for start in range(0, num_sims, BATCH_SIZE):
+        size = min(BATCH_SIZE, num_sims - start)
+        rps, tiebreakers = simulate_batch(rng, size, means, sds, rules, year)
+        rps = base_rps[:, None] + incidence @ rps
+        tiebreakers = base_tiebreakers[:, None] + incidence @ tiebreakers
+
+        # Sorts by RP average, tiebreaker average, random (last key is primary)
+        avg_rps = rps / counts[:, None]
+        avg_tiebreakers = tiebreakers / counts[:, None]
+        order = np.lexsort(
+            (rng.random((num_teams, size)), -avg_tiebreakers, -avg_rps), axis=0
+        )
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, team_range, axis=0)
+        flat = team_range * num_teams + ranks
+        rank_counts += np.bincount(
+            flat.ravel(), minlength=num_teams * num_teams
+        ).reshape(num_teams, num_teams)
+        all_rps.append(rps)
+
+    rps = np.concatenate(all_rps, axis=1) if all_rps else base_rps[:, None]
+    rank_probs = rank_counts / max(1, num_sims)
+    return SimResult(
+        teams=teams,
+        num_sims=num_sims,
+        rank_probs=rank_probs,
+        mean_rank=rank_probs @ np.arange(1, num_teams + 1),
+        captain_prob=rank_probs[:, :NUM_CAPTAINS].sum(axis=1),
+        mean_rps=rps.mean(axis=1),
+        rp_quantiles=np.quantile(rps, QUANTILES, axis=1).T,
+    )
+
+
+def simulate_batch(
+    rng: Any,
+    size: int,
+    means: Any,
+    sds: Any,
+    rules: List[Any],
+    year: int,
+) -> Tuple[Any, Any]:
+    # Returns (matches * 2 x size) alliance RPs and tiebreaker points
+    num_matches = means.shape[0]
+
+    # (matches, 2, components, size), alliance means plus noise from |Z0|, Z1
+    z = rng.standard_normal((num_matches, 2, 2, size))
+    np.abs(z[:, :, 0], out=z[:, :, 0])
+    alliances = means + np.matmul(sds, z)
+
+    red_score, blue_score = alliances[:, 0, 0], alliances[:, 1, 0]
+    win = np.stack([red_score > blue_score, blue_score > red_score], axis=1)
+    tie = (red_score == blue_score)[:, None]
+    rps = 2 * win + tie
+
+    for j, rule in enumerate(rules, start=1):
+        value = alliances[:, :, j]
+        if rule.threshold is None:
+            # Summed RP EPAs map to a probability, as in post_process_breakdown
+            rps = rps + (rng.random(value.shape) < unit_sigmoid(value))
+        else:
+            rps = rps + (value > rule.threshold)
+
+    # Total score breaks ties before 2016
+    tiebreakers = alliances[:, :, -1 if year >= 2016 else 0]
+
+    return (
+        rps.reshape(num_matches * 2, size).astype(float),
+        tiebreakers.reshape(num_matches * 2, size),
+    )
@@ -3,41 +3,48 @@
 from bisect import bisect_left
 from typing import Callable, List
 
-from scipy.stats import expon, exponnorm
+import numpy as np
 
 from src.models.epa.constants import NORM_MEAN, NORM_SD
+from src.models.epa.kernels import exponnorm_cdf, exponnorm_ppf
 
 
 def epa_to_unitless_epa(epa: float, mean: float, sd: float) -> float:
     return NORM_MEAN + NORM_SD * (epa - mean / 3) / sd
 
 
-# For converting EPA to Norm EPA
-distrib = exponnorm(1.6, -0.3, 0.2)
+# For converting EPA to Norm EPA, exponnorm(K, loc, scale)
+DISTRIB_PARAMS = (1.6, -0.3, 0.2)
 
 
 def get_epa_to_norm_epa_func(year_epas: List[float]) -> Callable[[float], float]:
     desc_sorted_epas = sorted(year_epas, reverse=True)
     total_N, cutoff_N = len(desc_sorted_epas), int(len(desc_sorted_epas) / 10)
-    exponnorm_disrib = expon_distrib = None
+    exponnorm_params = expon_params = None
     if total_N > 0:
-        exponnorm_disrib = exponnorm(*exponnorm.fit(desc_sorted_epas))
+        # Only the MLE fit needs scipy, once per season (not on the API path)
+        from scipy.stats import exponnorm
+
+        exponnorm_params = exponnorm.fit(desc_sorted_epas)
     if cutoff_N > 0:
-        expon_distrib = expon(*expon.fit(desc_sorted_epas[:cutoff_N]))
+        # Closed form MLE for expon: loc = min, scale = mean - min
+        top_epas = desc_sorted_epas[:cutoff_N]
+        expon_params = (min(top_epas), np.mean(top_epas) - min(top_epas))
 
     sorted_epas = desc_sorted_epas[::-1]
 
     def _get_norm_epa(epa: float) -> float:
         i = total_N - bisect_left(sorted_epas, epa)
-        exponnorm_value: float = exponnorm_disrib.cdf(epa)
+        exponnorm_value: float = exponnorm_cdf(epa, *exponnorm_params)
         percentile = exponnorm_value
         if i < cutoff_N:
-            expon_value: float = expon_distrib.cdf(epa)
+            loc, scale = expon_params
+            expon_value: float = 1 - np.exp(-max(0, epa - loc) / scale)
             expon_value = 1 - cutoff_N / total_N * (1 - expon_value)
             # Linearly interpolate between the two distributions from 10% to 5%
             expon_frac = min(1, 2 * (cutoff_N - i) / cutoff_N)
             percentile = expon_frac * expon_value + (1 - expon_frac) * exponnorm_value
-        out: float = distrib.ppf(percentile)
+        out: float = exponnorm_ppf(percentile, *DISTRIB_PARAMS)
         return NORM_MEAN + NORM_SD * out
 
     # get quantiles of year_epas, and linearly interpolate between norm_epas
@@ -0,0 +1,454 @@
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from src.db.models import Match, TeamEvent, TeamMatch, TeamYear, Year
+from src.models.epa.breakdown import (
+    get_pred_rps,
+    get_score_from_breakdown,
+    post_process_attrib,
+    post_process_breakdown,
+)
+from src.models.epa.main import EPA
+from src.models.epa.math import MAX_SKEW, t_prob_gt_0
+from src.models.template import Model
+from src.models.types import AlliancePred, Attribution, MatchPred
+from src.tba.constants import PLACEHOLDER_TEAMS
+from src.types.enums import MatchStatus
+from src.utils.utils import get_team_event_key, get_team_year_key, r
+
+# (ids, mean, var, skew, n, counts, previous events) before a match
+HistoryEntry = Tuple[Any, Any, Any, Any, Any, Any, List[Optional[str]]]
+
+EMPTY_ENTRY: HistoryEntry = (np.empty(0, dtype=int), None, None, None, None, None, [])
+
+
+class VectorizedEPA(EPA):
+    """
+    Array-backed EPA for whole-season replays. Ratings live in contiguous
+    (teams x components) arrays indexed by integer team id, and each match
+    updates all of its teams in one vectorized step. Matches EPA output.
+    """
+
+    team_ids: Dict[str, int]
+    mean: Any
+    var: Any
+    skew: Any
+    n: Any
+    team_counts: Any
+
+    def start_season(
+        self,
+        year: Year,
+        all_team_years: Dict[int, Dict[str, TeamYear]],
+        team_years: Dict[str, TeamYear],
+    ) -> None:
+        Model.start_season(self, year, all_team_years, team_years)
+
+        init_rating = self.get_init_rating(year, None, None)
+        num_components = len(init_rating.mean)
+
+        self.team_ids = {}
+        self.team_names: List[str] = []
+        self.mean = np.empty((0, num_components))
+        self.var = np.empty((0, num_components))
+        self.skew = np.empty(0)
+        self.n = np.empty(0)
+        self.team_counts = np.empty(0, dtype=int)
+
+        self.pending_team_events: Dict[int, TeamEvent] = {}
+        self.pending_team_years: Dict[int, TeamYear] = {}
+
+        # Undo log with one entry per processed match, see rewind()
+        self.history: List[HistoryEntry] = []
+        self.last_team_events: Dict[int, str] = {}
+
+        self.add_teams(all_team_years, list(team_years.values()))
+
+    def add_teams(
+        self,
+        all_team_years: Dict[int, Dict[str, TeamYear]],
+        team_years: List[TeamYear],
+    ) -> None:
+        start = len(self.team_names)
+        new_rows = np.empty((len(team_years), self.mean.shape[1]))
+
+        self.mean = np.concatenate([self.mean, new_rows])
+        self.var = np.concatenate([self.var, new_rows])
+        self.skew = np.concatenate([self.skew, np.zeros(len(team_years))])
+        self.n = np.concatenate([self.n, np.ones(len(team_years))])
+        self.team_counts = np.concatenate(
+            [self.team_counts, np.zeros(len(team_years), dtype=int)]
+        )
+
+        for i, team_year in enumerate(team_years, start=start):
+            num = team_year.team
+
+            past_team_years: List[TeamYear] = []
+            for past_year in range(self.year_num - 1, self.year_num - 5, -1):
+                past_team_year = all_team_years.get(past_year, {}).get(num, None)
+                if past_team_year is not None:
+                    past_team_years.append(past_team_year)
+
+            past_team_year_1 = past_team_years[0] if len(past_team_years) > 0 else None
+            past_team_year_2 = past_team_years[1] if len(past_team_years) > 1 else None
+
+            rating = self.get_init_rating(
+                self.year_obj, past_team_year_1, past_team_year_2
+            )
+
+            self.team_ids[num] = i
+            self.team_names.append(num)
+            self.mean[i] = rating.mean
+            self.var[i] = rating.var
+
+            team_year.epa_start = r(rating.mean[0], 2)
+            # Records TeamYear EPA stats if no matches played yet
+            self.post_record_team(num, None, None, team_year)
+
+    def get_ids(self, teams: List[str]) -> Any:
+        return np.array([self.team_ids[t] for t in teams], dtype=int)
+
+    def predict_match(self, match: Match) -> Tuple[float, AlliancePred, AlliancePred]:
+        red_ids = self.get_ids(match.get_red()[: self.num_teams])
+        blue_ids = self.get_ids(match.get_blue()[: self.num_teams])
+        return self.predict_ids(match, red_ids, blue_ids)
+
+    def predict_ids(
+        self, match: Match, red_ids: Any, blue_ids: Any
+    ) -> Tuple[float, AlliancePred, AlliancePred]:
+        year, week, key, elim = self.year_num, match.week, match.key, match.elim
+
+        red_sds, blue_sds = np.sqrt(self.var[red_ids]), np.sqrt(self.var[blue_ids])
+        red_mean = self.mean[red_ids].sum(axis=0)
+        blue_mean = self.mean[blue_ids].sum(axis=0)
+
+        preds: List[Tuple[Any, float, float]] = []
+        for sds, pred_mean, opp_pred_mean in [
+            (red_sds, red_mean, blue_mean),
+            (blue_sds, blue_mean, red_mean),
+        ]:
+            pred_sd = sds.sum(axis=0)
+            pred_mean = post_process_breakdown(
+                year, key, pred_mean.copy(), opp_pred_mean
+            )
+            rp_1, rp_2 = get_pred_rps(year, week, pred_mean, pred_sd)
+            preds.append((pred_mean, rp_1, rp_2))
+
+        (red_bd, red_rp_1, red_rp_2), (blue_bd, blue_rp_1, blue_rp_2) = preds
+        red_score = get_score_from_breakdown(
+            key, year, red_bd, blue_bd, red_rp_1, red_rp_2, elim
+        )
+        blue_score = get_score_from_breakdown(
+            key, year, blue_bd, red_bd, blue_rp_1, blue_rp_2, elim
+        )
+
+        # Assumes 100% correlation on each alliance
+        red_sd = np.sum(red_sds[:, 0])
+        blue_sd = np.sum(blue_sds[:, 0])
+        corr = 0.5 if year == 2018 else 0
+        total_sd = np.sqrt(red_sd**2 + blue_sd**2 + 2 * corr * red_sd * blue_sd)
+
+        if year == 2018:
+            # Your variance affects your score and your opponent's score
+            total_sd *= 2
+
+        avg_n = np.mean(self.n[np.concatenate([red_ids, blue_ids])])
+
+        win_prob = t_prob_gt_0(red_score - blue_score, total_sd, avg_n)
+
+        foul_rate = self.year_obj.get_foul_rate()
+        alliance_preds: List[AlliancePred] = []
+        for score, bd, rp_1, rp_2 in [
+            (red_score, red_bd, red_rp_1, red_rp_2),
+            (blue_score, blue_bd, blue_rp_1, blue_rp_2),
+        ]:
+            # Backwards compatibility
+            auto, teleop, endgame = (bd[1], bd[2], bd[3]) if year >= 2016 else (0, 0, 0)
+            alliance_preds.append(
+                AlliancePred(
+                    score * (1 + foul_rate), bd, rp_1, rp_2, auto, teleop, endgame
+                )
+            )
+
+        return win_prob, alliance_preds[0], alliance_preds[1]
+
+    def attribute_ids(
+        self, match: Match, red_ids: Any, blue_ids: Any, red_pred: Any, blue_pred: Any
+    ) -> Any:
+        # Returns a (teams x components) array aligned with [red_ids, blue_ids]
+        red_bd, blue_bd = match.get_breakdowns()
+        red_err = red_bd - red_pred.breakdown
+        blue_err = blue_bd - blue_pred.breakdown
+
+        attribs: List[Any] = []
+        for ids, my_err, opp_err in [
+            (red_ids, red_err, blue_err),
+            (blue_ids, blue_err, red_err),
+        ]:
+            counts: List[int] = self.team_counts[ids].tolist()
+            margin = np.array([self.margin_func(self.year_num, c) for c in counts])
+            margin = margin[:, None]
+            err = (my_err - margin * opp_err) / (1 + margin)
+            attribs.append(self.mean[ids] + err / self.num_teams)
+
+        attrib = np.concatenate(attribs)
+        if self.year_num == 2018 or (self.year_num >= 2016 and match.elim):
+            ids = np.concatenate([red_ids, blue_ids])
+            for row, i in zip(attrib, ids):
+                post_process_attrib(self.year_obj, self.mean[i], row, match.elim)
+
+        return attrib
+
+    def attribute_match(
+        self, match: Match, red_pred: AlliancePred, blue_pred: AlliancePred
+    ) -> Dict[str, Attribution]:
+        red_teams = match.get_red()[: self.num_teams]
+        blue_teams = match.get_blue()[: self.num_teams]
+        red_ids, blue_ids = self.get_ids(red_teams), self.get_ids(blue_teams)
+        attrib = self.attribute_ids(match, red_ids, blue_ids, red_pred, blue_pred)
+        return {t: Attribution(a) for t, a in zip(red_teams + blue_teams, attrib)}
+
+    def update_ids(self, ids: Any, x: Any, elim: bool) -> None:
+        # Vectorized SkewNormal.add_obs, one row per team
+        weight = self.elim_weight if elim else 1
+        counts: List[int] = self.team_counts[ids].tolist()
+        percent = np.array([self.percent_func(self.year_num, c) for c in counts])
+        alpha = percent[:, None]
+
+        mean, var, skew, n = self.mean[ids], self.var[ids], self.skew[ids], self.n[ids]
+
+        new_mean = (1 - alpha) * mean + alpha * x
+        new_var = (1 - alpha) * var + alpha * ((x - mean) * (x - new_mean))
+
+        x_0, mean_0, new_mean_0 = x[:, 0], mean[:, 0], new_mean[:, 0]
+        obs_skew = (
+            (x_0 - mean_0)
+            * (x_0 - new_mean_0)
+            * (x_0 - new_mean_0)
+            / (new_var[:, 0] ** (3 / 2))
+        )
+        new_skew = np.clip(
+            (1 - percent) * skew + percent * obs_skew, -MAX_SKEW, MAX_SKEW
+        )
+        new_n = n * (1 - percent) + 1
+
+        self.mean[ids] = weight * new_mean + (1 - weight) * mean
+        self.var[ids] = new_var * weight + (1 - weight) * var
+        self.skew[ids] = new_skew * weight + (1 - weight) * skew
+        self.n[ids] = new_n * weight + (1 - weight) * n
+        if not elim:
+            self.team_counts[ids] += 1
+
+    def update_team(
+        self, team: str, attrib: Attribution, match: Match, team_match: TeamMatch
+    ) -> None:
+        self.update_ids(self.get_ids([team]), attrib.epa[None, :], match.elim)
+
+    def pre_record_team(self, team: str, tm: TeamMatch, te: TeamEvent, ty: TeamYear):
+        self.pre_record_id(self.team_ids[team], tm)
+
+    def pre_record_id(self, i: int, tm: TeamMatch) -> None:
+        mean = self.mean[i]
+        rounded_mean: Any = np.round(mean, 2)
+        tm.epa = rounded_mean[0]
+
+        if self.year_num >= 2016:
+            tm.auto_epa = rounded_mean[1]
+            tm.teleop_epa = rounded_mean[2]
+            tm.endgame_epa = rounded_mean[3]
+            tm.rp_1_epa = round(mean[4], 4)
+            tm.rp_2_epa = round(mean[5], 4)
+            tm.tiebreaker_epa = rounded_mean[6]
+            for i in range(1, 19):
+                setattr(tm, f"comp_{i}_epa", rounded_mean[i + 6])
+
+    def post_record_team(
+        self,
+        team: str,
+        tm: Optional[TeamMatch],
+        te: Optional[TeamEvent],
+        ty: Optional[TeamYear],
+    ):
+        self.post_record_id(self.team_ids[team], tm, te, ty)
+
+    def post_record_id(
+        self,
+        i: int,
+        tm: Optional[TeamMatch],
+        te: Optional[TeamEvent],
+        ty: Optional[TeamYear],
+    ) -> None:
+        mean, var = self.mean[i], self.var[i]
+        rounded_mean: Any = np.round(mean, 2)
+        rounded_sd: Any = np.round(np.sqrt(var), 2)
+
+        if tm is not None:
+            tm.post_epa = rounded_mean[0]
+
+        for obj in [te, ty]:
+            if obj is None:
+                continue
+
+            obj.epa = rounded_mean[0]
+            obj.epa_sd = rounded_sd[0]
+            obj.epa_skew = r(self.skew[i], 4)
+            obj.epa_n = r(self.n[i], 4)
+
+            if self.year_num >= 2016:
+                obj.auto_epa = rounded_mean[1]
+                obj.auto_epa_sd = rounded_sd[1]
+                obj.teleop_epa = rounded_mean[2]
+                obj.teleop_epa_sd = rounded_sd[2]
+                obj.endgame_epa = rounded_mean[3]
+                obj.endgame_epa_sd = rounded_sd[3]
+                obj.rp_1_epa = round(mean[4], 4)
+                obj.rp_1_epa_sd = round(np.sqrt(var[4]), 4)
+                obj.rp_2_epa = round(mean[5], 4)
+                obj.rp_2_epa_sd = round(np.sqrt(var[5]), 4)
+                obj.tiebreaker_epa = rounded_mean[6]
+                obj.tiebreaker_epa_sd = rounded_sd[6]
+                for j in range(1, 19):
+                    setattr(obj, f"comp_{j}_epa", rounded_mean[j + 6])
+                    setattr(obj, f"comp_{j}_epa_sd", rounded_sd[j + 6])
+
+    def process_match(
+        self,
+        match: Match,
+        team_matches: Dict[str, TeamMatch],
+        team_events: Dict[str, TeamEvent],
+        team_years: Dict[str, TeamYear],
+    ):
+        red_teams, blue_teams = match.get_teams()
+        teams = red_teams + blue_teams
+        self.process_slots(
+            match,
+            self.get_ids(teams),
+            len(red_teams),
+            [team_matches[t] for t in teams],
+            [team_events[t] for t in teams],
+            [team_years[t] for t in teams],
+        )
+
+    def process_slots(
+        self,
+        match: Match,
+        slot_ids: Any,
+        num_red: int,
+        team_matches: List[TeamMatch],
+        team_events: List[TeamEvent],
+        team_years: List[TeamYear],
+    ) -> None:
+        # One slot per team in the match (red, then blue), see SeasonIndex
+        red_ids = slot_ids[:num_red][: self.num_teams]
+        blue_ids = slot_ids[num_red:][: self.num_teams]
+
+        win_prob, red_pred, blue_pred = self.predict_ids(match, red_ids, blue_ids)
+        match_pred = MatchPred(win_prob, red_pred, blue_pred)
+
+        for i, team_match in zip(slot_ids.tolist(), team_matches):
+            self.pre_record_id(i, team_match)
+
+        self.record_match(match, match_pred)
+        if match.status == MatchStatus.UPCOMING:
+            self.history.append(EMPTY_ENTRY)
+            return
+
+        attrib = self.attribute_ids(match, red_ids, blue_ids, red_pred, blue_pred)
+
+        # Keeps the last attribution per team, as in the Dict[str, Attribution] path
+        rows: Dict[int, int] = {
+            i: k for k, i in enumerate(np.concatenate([red_ids, blue_ids]).tolist())
+        }
+        ids = np.array(list(rows), dtype=int)
+        attrib = attrib[list(rows.values())]
+        slots: Dict[int, int] = {i: k for k, i in enumerate(slot_ids.tolist())}
+
+        # Don't update if 1) placeholder match, 2) elim dq, 3) offseason
+        teams = set(match.get_red() + match.get_blue())
+        placeholder_match = len(set(PLACEHOLDER_TEAMS).intersection(teams)) > 0
+        elim_dq = match.elim and (
+            len(match.get_red_dqs()) >= self.num_teams
+            or len(match.get_blue_dqs()) >= self.num_teams
+        )
+        skip_update = placeholder_match or elim_dq or match.offseason
+
+        # TeamEvent/TeamYear only keep the latest rating, so they are recorded
+        # lazily: when the team moves to a new event, or at the end of the season
+        for i in rows:
+            prev_te = self.pending_team_events.get(i, None)
+            if prev_te is not None and prev_te is not team_events[slots[i]]:
+                self.post_record_id(i, None, prev_te, None)
+
+        self.history.append(
+            (
+                ids,
+                self.mean[ids],
+                self.var[ids],
+                self.skew[ids],
+                self.n[ids],
+                self.team_counts[ids],
+                [self.last_team_events.get(i, None) for i in rows],
+            )
+        )
+
+        if not skip_update:
+            self.update_ids(ids, attrib, match.elim)
+
+        for i in rows:
+            slot = slots[i]
+            team_matches[slot].post_epa = round(self.mean[i, 0], 2)
+            self.pending_team_events[i] = team_events[slot]
+            self.pending_team_years[i] = team_years[slot]
+            self.last_team_events[i] = match.event
+
+    def end_season(self) -> None:
+        for i, te in self.pending_team_events.items():
+            self.post_record_id(i, None, te, self.pending_team_years[i])
+
+        self.pending_team_events = {}
+        self.pending_team_years = {}
+
+    def rewind(
+        self,
+        num_matches: int,
+        team_events: Dict[str, TeamEvent],
+        team_years: Dict[str, TeamYear],
+    ) -> None:
+        # Restores the state after the first num_matches processed matches,
+        # rebinding lazily recorded TeamEvents/TeamYears to the given objects
+        rewound: Set[int] = set()
+        while len(self.history) > num_matches:
+            ids, mean, var, skew, n, counts, prev_events = self.history.pop()
+            if len(ids) == 0:
+                continue
+
+            self.mean[ids] = mean
+            self.var[ids] = var
+            self.skew[ids] = skew
+            self.n[ids] = n
+            self.team_counts[ids] = counts
+            for i, prev_event in zip(ids.tolist(), prev_events):
+                rewound.add(i)
+                if prev_event is None:
+                    self.last_team_events.pop(i, None)
+                else:
+                    self.last_team_events[i] = prev_event
+
+        self.pending_team_events = {}
+        self.pending_team_years = {}
+        for i in rewound:
+            team_year = team_years[get_team_year_key(self.team_names[i], self.year_num)]
+            event = self.last_team_events.get(i, None)
+            team_event = (
+                None
+                if event is None
+                else team_events.get(get_team_event_key(self.team_names[i], event))
+            )
+            if team_event is None:
+                # No matches left for the team, back to its start of season EPA
+                self.post_record_id(i, None, None, team_year)
+                continue
+
+            self.pending_team_events[i] = team_event
+            self.pending_team_years[i] = team_year
@@ -54,6 +54,9 @@ class Model:
     def record_match(self, match: Match, match_pred: MatchPred) -> None:
         pass
 
+    def end_season(self) -> None:
+        pass
+
     def process_match(
         self,
         match: Match,
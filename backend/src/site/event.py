@@ -1,18 +1,37 @@
-from typing import Any, List, Optional
+import asyncio
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
 
 from src.api import (  # get_event,; get_matches,; get_team_events,; get_team_matches,; get_year,
+    get_event_cached,
     get_events_cached,
+    get_matches_cached,
+    get_team_events_cached,
     get_year_cached,
 )
 
 # from src.site.hypo_event import read_hypothetical_event as _read_hypothetical_event
-from src.db.models import Event, Year  # , APIMatch, APITeamEvent, APITeamMatch, APIYear
-from src.site.helper import compress
+from src.db.models import (  # , APIMatch, APITeamEvent, APITeamMatch, APIYear
+    Event,
+    Match,
+    TeamEvent,
+    Year,
+)
+from src.db.read.aio import get_event_bundle
+from src.db.read.bundle import EventBundle
+from src.models.epa.simulate import simulate_event
+from src.site.helper import compress, compress_cached
 from src.types.enums import EventStatus
-from src.utils.decorators import async_fail_gracefully_plural
+from src.utils.alru_cache import alru_cache
+from src.utils.decorators import (
+    async_fail_gracefully_plural,
+    async_fail_gracefully_singular,
+)
+
+MAX_SIMULATIONS = 100000
 
 router = APIRouter()
 
@@ -21,8 +40,11 @@ router = APIRouter()
 @async_fail_gracefully_plural
 async def read_all_events(response: StreamingResponse, no_cache: bool = False) -> Any:
     events: List[Event] = await get_events_cached(no_cache=no_cache, site=True)
-    data = [{"key": event.key, "name": event.name} for event in events]
-    return compress(data)
+
+    def build() -> Any:
+        return [{"key": event.key, "name": event.name} for event in events]
+
+    return compress_cached(("events", ()), (events,), build, no_cache)
 
 
 @router.get("/events/{year}")
@@ -35,10 +57,75 @@ async def read_events(
         raise Exception("Year not found")
 
     events: List[Event] = await get_events_cached(year=year, no_cache=no_cache)
-    data = {
-        "year": year_obj.to_dict(),
-        "events": [x.to_dict() for x in events if x.status != EventStatus.INVALID],
-    }
+
+    def build() -> Any:
+        return {
+            "year": year_obj.to_dict(),
+            "events": [x.to_dict() for x in events if x.status != EventStatus.INVALID],
+        }
+
+    return compress_cached(("events", (year,)), (year_obj, events), build, no_cache)
+
+
+@alru_cache(ttl=timedelta(minutes=1))
+async def get_event_bundle_cached(
+    event_id: str, no_cache: bool = False
+) -> Tuple[bool, Optional[EventBundle]]:
+    bundle: Optional[EventBundle] = await get_event_bundle(event_id)
+    return (bundle is not None, bundle)
+
+
+@router.get("/event/{event_id}")
+@async_fail_gracefully_singular
+async def read_event(
+    response: StreamingResponse, event_id: str, no_cache: bool = False
+) -> Any:
+    bundle: Optional[EventBundle] = await get_event_bundle_cached(
+        event_id=event_id, no_cache=no_cache
+    )
+    if bundle is None:
+        raise Exception("Event not found")
+
+    return compress_cached(("event", (event_id,)), (bundle,), bundle.to_dict, no_cache)
+
+
+@alru_cache(ttl=timedelta(minutes=1))
+async def get_event_simulation_cached(
+    event_id: str, simulations: int, no_cache: bool = False
+) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    event: Optional[Event] = await get_event_cached(event=event_id, no_cache=no_cache)
+    if event is None:
+        return (False, None)
+
+    team_events: List[TeamEvent] = await get_team_events_cached(
+        event=event_id, offseason=None, site=True, no_cache=no_cache
+    )
+    matches: List[Match] = await get_matches_cached(
+        event=event_id, elim=False, offseason=None, site=True, no_cache=no_cache
+    )
+
+    # CPU bound, keeps the event loop free while NumPy runs
+    result = await asyncio.to_thread(
+        simulate_event, event.year, event.week, team_events, matches, simulations
+    )
+    return (True, result.to_dict())
+
+
+@router.get("/event/{event_id}/simulation")
+@async_fail_gracefully_singular
+async def read_event_simulation(
+    response: StreamingResponse,
+    event_id: str,
+    simulations: int = 10000,
+    no_cache: bool = False,
+) -> Any:
+    simulations = max(1, min(simulations, MAX_SIMULATIONS))
+    data: Optional[Dict[str, Any]] = await get_event_simulation_cached(
+        event_id=event_id, simulations=simulations, no_cache=no_cache
+    )
+    if data is None:
+        raise Exception("Event not found")
+
     return compress(data)
 
 
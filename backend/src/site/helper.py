@@ -1,13 +1,56 @@
-import io
 import json
 import zlib
-from typing import Any
+from collections import OrderedDict
+from typing import Any, Callable, Tuple
 
 from fastapi.responses import StreamingResponse
 
+MAX_RESPONSES = 256
+
+TResponseKey = Tuple[str, Tuple[Any, ...]]
+
+# (endpoint, params) -> (source objects, compressed body), oldest first. Per
+# API instance, a body stays valid while the cached objects it was built from
+# are unchanged, so it expires with them.
+responses: "OrderedDict[TResponseKey, Tuple[Tuple[Any, ...], bytes]]" = OrderedDict()
+
+
+def to_response(body: bytes) -> StreamingResponse:
+    return StreamingResponse(iter([body]), media_type="application/octet-stream")
+
+
+def compress_bytes(x: Any) -> bytes:
+    return zlib.compress(json.dumps(x).encode())
+
 
 def compress(x: Any) -> StreamingResponse:
-    return StreamingResponse(
-        io.BytesIO(zlib.compress(json.dumps(x).encode())),
-        media_type="application/octet-stream",
-    )
+    return to_response(compress_bytes(x))
+
+
+def compress_cached(
+    key: TResponseKey,
+    sources: Tuple[Any, ...],
+    build: Callable[[], Any],
+    no_cache: bool = False,
+) -> StreamingResponse:
+    # sources are the (alru cached) objects behind the response, compared by
+    # identity, so a hit skips to_dict, json.dumps and zlib entirely. no_cache
+    # bodies are neither served from nor stored in the cache.
+    if no_cache:
+        return compress(build())
+
+    entry = responses.get(key, None)
+    if (
+        entry is not None
+        and len(entry[0]) == len(sources)
+        and all(a is b for a, b in zip(entry[0], sources))
+    ):
+        responses.move_to_end(key)
+        return to_response(entry[1])
+
+    body = compress_bytes(build())
+    responses[key] = (sources, body)
+    responses.move_to_end(key)
+    while len(responses) > MAX_RESPONSES:
+        responses.popitem(last=False)
+    return to_response(body)
@@ -1,10 +1,16 @@
-from typing import Any, Optional
+import asyncio
+import json
+from datetime import timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from fastapi.responses import StreamingResponse
 
-from src.db.functions import get_noteworthy_matches, get_upcoming_matches
+from src.constants import STREAM_UPCOMING
+from src.db.functions.aio import get_noteworthy_matches, get_upcoming_matches
+from src.db.models.match import Match
 from src.site.helper import compress
+from src.utils.alru_cache import alru_cache
 from src.utils.decorators import (
     async_fail_gracefully_plural,
     async_fail_gracefully_singular,
@@ -83,7 +89,7 @@ async def read_upcoming_matches(
     metric: str = "predicted_time",
     no_cache: bool = False,
 ) -> Any:
-    upcoming_matches = get_upcoming_matches(
+    upcoming_matches = await get_upcoming_matches(
         country=country,
         state=state,
         district=district,
@@ -93,11 +99,122 @@ async def read_upcoming_matches(
         metric=metric,
     )
 
-    data = [{"match": m, "event_name": e} for m, e in upcoming_matches]
+    data = [{"match": m.to_dict(), "event_name": e} for m, e in upcoming_matches]
 
     return compress(data)
 
 
+# Seconds between checks of a stream's query, served from the upcoming index
+STREAM_INTERVAL = 10
+
+
+@alru_cache(ttl=timedelta(seconds=STREAM_INTERVAL))
+async def get_stream_matches(
+    country: Optional[str],
+    state: Optional[str],
+    district: Optional[str],
+    elim: Optional[bool],
+    minutes: int,
+    limit: int,
+    metric: str,
+    no_cache: bool = False,
+) -> Tuple[bool, List[Tuple[Match, str]]]:
+    # Streams with the same query share one read per interval
+    return (
+        True,
+        await get_upcoming_matches(
+            country=country,
+            state=state,
+            district=district,
+            elim=elim,
+            minutes=minutes,
+            limit=limit,
+            metric=metric,
+        ),
+    )
+
+
+def format_event(name: str, data: Any) -> str:
+    return "event: " + name + "\ndata: " + json.dumps(data) + "\n\n"
+
+
+async def iter_upcoming_matches(
+    request: Request, query: Dict[str, Any]
+) -> AsyncIterator[str]:
+    # A snapshot, then a diff whenever the matches or their order change. Also
+    # sets the delay before EventSource reconnects, which is the poll interval
+    # where the response ends after the snapshot.
+    yield "retry: " + str(STREAM_INTERVAL * 1000) + "\n\n"
+    prev: Optional[Dict[str, Tuple[Match, str]]] = None
+    prev_order: List[str] = []
+    while not await request.is_disconnected():
+        upcoming_matches = await get_stream_matches(**query)
+        curr = {m.key: (m, e) for m, e in upcoming_matches}
+        order = list(curr)
+
+        if prev is None:
+            data = [{"match": m.to_dict(), "event_name": e} for m, e in curr.values()]
+            yield format_event("snapshot", data)
+            if not STREAM_UPCOMING:
+                return
+        else:
+            changed = [
+                k
+                for k in order
+                if k not in prev
+                or prev[k][1] != curr[k][1]
+                or len(curr[k][0].get_changed_fields(prev[k][0].get_values())) > 0
+            ]
+            removed = [k for k in prev if k not in curr]
+            if len(changed) > 0 or len(removed) > 0 or order != prev_order:
+                diff = {
+                    "updated": [
+                        {"match": curr[k][0].to_dict(), "event_name": curr[k][1]}
+                        for k in changed
+                    ],
+                    "removed": removed,
+                    "order": order,
+                }
+                yield format_event("diff", diff)
+            else:
+                yield ": keep-alive\n\n"  # also detects closed connections
+
+        prev, prev_order = curr, order
+        await asyncio.sleep(STREAM_INTERVAL)
+
+
+@router.get("/upcoming_matches/stream")
+@async_fail_gracefully_singular
+async def stream_upcoming_matches(
+    response: StreamingResponse,
+    request: Request,
+    country: Optional[str] = None,
+    state: Optional[str] = None,
+    district: Optional[str] = None,
+    elim: Optional[str] = None,
+    minutes: int = -1,
+    limit: int = 100,
+    metric: str = "predicted_time",
+) -> Any:
+    # Server-Sent Events: "snapshot" with the same data as /upcoming_matches,
+    # then "diff" with new or changed matches, removed keys and the new order.
+    # Only the snapshot where streaming is off (see STREAM_UPCOMING).
+    query = {
+        "country": country,
+        "state": state,
+        "district": district,
+        "elim": {None: None, "qual": False, "elim": True}[elim],
+        "minutes": minutes,
+        "limit": limit,
+        "metric": metric,
+    }
+    return StreamingResponse(
+        iter_upcoming_matches(request, query),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/noteworthy_matches/{year}")
 @async_fail_gracefully_singular
 async def read_noteworthy_matches(
@@ -110,7 +227,7 @@ async def read_noteworthy_matches(
     week: Optional[int] = None,
     no_cache: bool = False,
 ) -> Any:
-    noteworthy_matches = get_noteworthy_matches(
+    noteworthy_matches = await get_noteworthy_matches(
         year=year,
         country=country,
         state=state,
@@ -9,7 +9,7 @@ from src.api import (  # get_matches,; get_team,; get_team_events,; get_team_mat
 from src.db.models import (  # APIMatch,; APITeamEvent,; APITeamMatch,; APITeamYear,; APIYear,
     Team,
 )
-from src.site.helper import compress
+from src.site.helper import compress_cached
 from src.utils.decorators import async_fail_gracefully_plural
 
 router = APIRouter()
@@ -19,12 +19,15 @@ router = APIRouter()
 @async_fail_gracefully_plural
 async def read_all_teams(response: StreamingResponse, no_cache: bool = False) -> Any:
     teams: List[Team] = await get_teams_cached(site=True, no_cache=no_cache)
-    data = [
-        {"team": x.team, "name": x.name, "active": x.active}
-        for x in teams
-        if not x.offseason
-    ]
-    return compress(data)
+
+    def build() -> Any:
+        return [
+            {"team": x.team, "name": x.name, "active": x.active}
+            for x in teams
+            if not x.offseason
+        ]
+
+    return compress_cached(("teams", ()), (teams,), build, no_cache)
 
 
 """
@@ -1,4 +1,5 @@
-from typing import Any, List, Optional
+from datetime import timedelta
+from typing import Any, List, Optional, Tuple
 
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
@@ -6,7 +7,10 @@ from fastapi.responses import StreamingResponse
 from src.api import get_team_matches_cached, get_team_years_cached, get_year_cached
 from src.constants import CURR_YEAR
 from src.db.models import TeamMatch, TeamYear, Year
-from src.site.helper import compress
+from src.db.read.aio import get_team_year_bundle
+from src.db.read.bundle import TeamYearBundle
+from src.site.helper import compress_cached
+from src.utils.alru_cache import alru_cache
 from src.utils.decorators import (
     async_fail_gracefully_plural,
     async_fail_gracefully_singular,
@@ -36,14 +40,21 @@ async def read_team_years(
         site=True,
         no_cache=no_cache,
     )
-    team_years = [x for x in team_years if x.count > 0 or year >= CURR_YEAR]
 
-    out = {
-        "team_years": [x.to_dict() for x in team_years],
-        "year": year_obj.to_dict(),
-    }
+    def build() -> Any:
+        return {
+            "team_years": [
+                x.to_dict() for x in team_years if x.count > 0 or year >= CURR_YEAR
+            ],
+            "year": year_obj.to_dict(),
+        }
 
-    return compress(out)
+    return compress_cached(
+        ("team_years", (year, limit, metric)),
+        (year_obj, team_years),
+        build,
+        no_cache,
+    )
 
 
 @router.get("/team_year/{year}/{team}/matches")
@@ -55,8 +66,33 @@ async def read_team_matches(
         team=team, year=year, no_cache=no_cache
     )
 
-    team_matches = sorted(team_matches, key=lambda x: x.time)
+    def build() -> Any:
+        return [x.to_dict() for x in sorted(team_matches, key=lambda x: x.time)]
+
+    return compress_cached(
+        ("team_matches", (year, team)), (team_matches,), build, no_cache
+    )
+
+
+@alru_cache(ttl=timedelta(minutes=1))
+async def get_team_year_bundle_cached(
+    team: str, year: int, no_cache: bool = False
+) -> Tuple[bool, Optional[TeamYearBundle]]:
+    bundle: Optional[TeamYearBundle] = await get_team_year_bundle(team, year)
+    return (bundle is not None, bundle)
+
 
-    out = [x.to_dict() for x in team_matches]
+@router.get("/team_year/{year}/{team}")
+@async_fail_gracefully_singular
+async def read_team_year(
+    response: StreamingResponse, year: int, team: str, no_cache: bool = False
+) -> Any:
+    bundle: Optional[TeamYearBundle] = await get_team_year_bundle_cached(
+        team=team, year=year, no_cache=no_cache
+    )
+    if bundle is None:
+        raise Exception("Team year not found")
 
-    return compress(out)
+    return compress_cached(
+        ("team_year", (year, team)), (bundle,), bundle.to_dict, no_cache
+    )
@@ -2,7 +2,7 @@ from datetime import timedelta
 from typing import List, Optional, Tuple
 
 from src.db.models import Event
-from src.db.read import get_event as _get_event, get_events as _get_events
+from src.db.read.aio import get_event as _get_event, get_events as _get_events
 from src.site.v2.models import APIEvent
 from src.utils.alru_cache import alru_cache
 
@@ -52,7 +52,7 @@ def unpack_event(event: Event) -> APIEvent:
 async def get_event(
     event: str, no_cache: bool = False
 ) -> Tuple[bool, Optional[APIEvent]]:
-    event_obj = _get_event(event_id=event)
+    event_obj = await _get_event(event_id=event)
 
     # If invalid, do not cache
     if event_obj is None:
@@ -68,7 +68,7 @@ async def get_events(
     offseason: Optional[bool] = False,
     no_cache: bool = False,
 ) -> Tuple[bool, List[APIEvent]]:
-    event_objs: List[Event] = _get_events(year=year, offseason=offseason)
+    event_objs: List[Event] = await _get_events(year=year, offseason=offseason)
 
     events = [unpack_event(event) for event in event_objs]
     return (True, events)
@@ -2,14 +2,12 @@ from datetime import timedelta
 from typing import Dict, List, Optional, Tuple
 
 from src.api.v2.utils import format_team, inv_format_team
-from src.db.functions.noteworthy_matches import (
+from src.db.functions.aio import (
     get_noteworthy_matches as _get_noteworthy_matches,
-)
-from src.db.functions.upcoming_matches import (
     get_upcoming_matches as _get_upcoming_matches,
 )
 from src.db.models import Match
-from src.db.read import get_match as _get_match, get_matches as _get_matches
+from src.db.read.aio import get_match as _get_match, get_matches as _get_matches
 from src.site.v2.models import APIMatch
 from src.utils.alru_cache import alru_cache
 from src.utils.utils import get_match_name
@@ -77,7 +75,7 @@ def unpack_match(match: Match) -> APIMatch:
 async def get_match(
     match: str, no_cache: bool = False
 ) -> Tuple[bool, Optional[APIMatch]]:
-    match_obj = _get_match(match=match)
+    match_obj = await _get_match(match=match)
 
     # If invalid, do not cache
     if match_obj is None:
@@ -95,7 +93,7 @@ async def get_matches(
     offseason: Optional[bool] = False,
     no_cache: bool = False,
 ) -> Tuple[bool, List[APIMatch]]:
-    match_objs: List[Match] = _get_matches(
+    match_objs: List[Match] = await _get_matches(
         team=None if team is None else inv_format_team(team),
         year=year,
         event=event,
@@ -116,7 +114,7 @@ async def get_upcoming_matches(
     metric: str,
     no_cache: bool = False,
 ) -> Tuple[bool, List[Tuple[APIMatch, str]]]:
-    match_objs: List[Tuple[Match, str]] = _get_upcoming_matches(
+    match_objs: List[Tuple[Match, str]] = await _get_upcoming_matches(
         country=country,
         state=state,
         district=district,
@@ -141,7 +139,7 @@ async def get_noteworthy_matches(
     week: Optional[int],
     no_cache: bool = False,
 ) -> Tuple[bool, Dict[str, List[APIMatch]]]:
-    match_objs = _get_noteworthy_matches(
+    match_objs = await _get_noteworthy_matches(
         year=year,
         country=country,
         state=state,
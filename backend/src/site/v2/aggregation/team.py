@@ -3,7 +3,7 @@ from typing import List, Optional, Tuple
 
 from src.api.v2.utils import format_team, inv_format_team
 from src.db.models import Team
-from src.db.read import get_team as _get_team, get_teams as _get_teams
+from src.db.read.aio import get_team as _get_team, get_teams as _get_teams
 from src.site.v2.models import APITeam
 from src.utils.alru_cache import alru_cache
 
@@ -23,7 +23,7 @@ def unpack_team(team: Team) -> APITeam:
 
 @alru_cache(ttl=timedelta(minutes=1))
 async def get_team(team: int, no_cache: bool = False) -> Tuple[bool, Optional[APITeam]]:
-    team_obj = _get_team(team=inv_format_team(team))
+    team_obj = await _get_team(team=inv_format_team(team))
 
     # If invalid, do not cache
     if team_obj is None:
@@ -35,6 +35,6 @@ async def get_team(team: int, no_cache: bool = False) -> Tuple[bool, Optional[AP
 
 @alru_cache(ttl=timedelta(minutes=5))
 async def get_teams(no_cache: bool = False) -> Tuple[bool, List[APITeam]]:
-    team_objs: List[Team] = _get_teams()
+    team_objs: List[Team] = await _get_teams()
     teams = [unpack_team(x) for x in team_objs]
     return (True, sorted(teams, key=lambda x: x.num or 0))
@@ -3,7 +3,7 @@ from typing import List, Optional, Tuple
 
 from src.api.v2.utils import format_team, inv_format_team
 from src.db.models import TeamEvent
-from src.db.read import get_team_events as _get_team_events
+from src.db.read.aio import get_team_events as _get_team_events
 from src.site.v2.models import APIEvent, APITeamEvent, APITeamYear
 from src.utils.alru_cache import alru_cache
 
@@ -88,7 +88,7 @@ async def get_team_events(
     offseason: Optional[bool] = False,
     no_cache: bool = False,
 ) -> Tuple[bool, List[APITeamEvent]]:
-    team_event_objs: List[TeamEvent] = _get_team_events(
+    team_event_objs: List[TeamEvent] = await _get_team_events(
         year=year,
         team=None if team is None else inv_format_team(team),
         event=event,
@@ -3,7 +3,7 @@ from typing import List, Optional, Tuple
 
 from src.api.v2.utils import format_team, inv_format_team
 from src.db.models import TeamMatch
-from src.db.read import get_team_matches as _get_team_matches
+from src.db.read.aio import get_team_matches as _get_team_matches
 from src.site.v2.models import APITeamMatch
 from src.utils.alru_cache import alru_cache
 from src.utils.utils import get_match_number
@@ -38,7 +38,7 @@ async def get_team_matches(
     offseason: Optional[bool] = False,
     no_cache: bool = False,
 ) -> Tuple[bool, List[APITeamMatch]]:
-    team_match_objs: List[TeamMatch] = _get_team_matches(
+    team_match_objs: List[TeamMatch] = await _get_team_matches(
         team=None if team is None else inv_format_team(team),
         year=year,
         event=event,
@@ -4,7 +4,7 @@ from typing import List, Optional, Tuple
 from src.api.v2.utils import format_team, inv_format_team
 from src.constants import CURR_WEEK
 from src.db.models import TeamYear
-from src.db.read import (
+from src.db.read.aio import (
     get_team_year as _get_team_year,
     get_team_years as _get_team_years,
 )
@@ -52,7 +52,7 @@ def unpack_team_year(team_year: TeamYear) -> APITeamYear:
 async def get_team_year(
     team: int, year: int, no_cache: bool = False
 ) -> Tuple[bool, Optional[APITeamYear]]:
-    team_year_obj = _get_team_year(team=inv_format_team(team), year=year)
+    team_year_obj = await _get_team_year(team=inv_format_team(team), year=year)
 
     # If invalid, do not cache
     if team_year_obj is None:
@@ -74,7 +74,7 @@ async def get_team_years(
     if metric is not None and metric.endswith("_end"):
         metric = metric[:-4]
 
-    team_year_objs: List[TeamYear] = _get_team_years(
+    team_year_objs: List[TeamYear] = await _get_team_years(
         team=None if team is None else inv_format_team(team),
         teams=None if teams is None else [inv_format_team(team) for team in teams],
         year=year,
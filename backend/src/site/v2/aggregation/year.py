@@ -2,7 +2,7 @@ from datetime import timedelta
 from typing import Optional, Tuple
 
 from src.db.models import Year
-from src.db.read import get_year as _get_year
+from src.db.read.aio import get_year as _get_year
 from src.site.v2.models import APIYear, PercentileStats
 from src.utils.alru_cache import alru_cache
 
@@ -89,7 +89,7 @@ def unpack_year(year: Year) -> APIYear:
 
 @alru_cache(ttl=timedelta(minutes=1))
 async def get_year(year: int, no_cache: bool = False) -> Tuple[bool, Optional[APIYear]]:
-    year_obj = _get_year(year=year)
+    year_obj = await _get_year(year=year)
 
     # If invalid, do not cache
     if year_obj is None:
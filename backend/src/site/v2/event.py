@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Response
@@ -11,7 +12,7 @@ from src.site.v2.aggregation import (
     get_year,
 )
 from src.site.v2.hypo_event import read_hypothetical_event as _read_hypothetical_event
-from src.site.v2.models import APIEvent, APIMatch, APITeamEvent, APITeamMatch, APIYear
+from src.site.v2.models import APIEvent, APITeamMatch, APIYear
 from src.site.v2.utils import async_fail_gracefully
 
 router = APIRouter()
@@ -46,27 +47,21 @@ async def read_event(
     if event is None:
         raise Exception("Event not found")
 
-    year: Optional[APIYear] = await get_year(year=event.year, no_cache=no_cache)
+    # Independent once the event is known, cold reads overlap on the DB pool
+    year, team_events, matches, team_matches = await asyncio.gather(
+        get_year(year=event.year, no_cache=no_cache),
+        get_team_events(
+            year=event.year,
+            event=event_id,
+            offseason=event.offseason,
+            no_cache=no_cache,
+        ),
+        get_matches(event=event_id, offseason=event.offseason, no_cache=no_cache),
+        get_team_matches(event=event_id, offseason=event.offseason, no_cache=no_cache),
+    )
     if year is None:
         raise Exception("Year not found")
 
-    team_events: List[APITeamEvent] = await get_team_events(
-        year=year.year,
-        event=event_id,
-        offseason=event.offseason,
-        no_cache=no_cache,
-    )
-    matches: List[APIMatch] = await get_matches(
-        event=event_id,
-        offseason=event.offseason,
-        no_cache=no_cache,
-    )
-    team_matches: List[APITeamMatch] = await get_team_matches(
-        event=event_id,
-        offseason=event.offseason,
-        no_cache=no_cache,
-    )
-
     out = {
         "event": event.to_dict(),
         "matches": [x.to_dict() for x in matches],
@@ -0,0 +1,218 @@
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+from src.tba.constants import CACHE_PATH, CACHE_TTL
+from src.tba.utils import load_cache as load_legacy_cache
+
+# (compressed data, etag, fetch timestamp)
+row_type = Tuple[bytes, Optional[str], int]
+
+# Rows read in bulk by preload(), decompressed lazily on access
+preloaded: Dict[str, row_type] = {}
+
+# One connection per thread, requests are fetched concurrently
+local = threading.local()
+
+# Set once the cache fails (ex: the data service's read-only filesystem),
+# requests then go to TBA uncached
+disabled = False
+
+
+def disable(e: Exception) -> None:
+    global disabled
+    if not disabled:
+        print("TBA cache disabled:", e)
+    disabled = True
+
+
+def get_conn() -> Optional[sqlite3.Connection]:
+    conn: Optional[sqlite3.Connection] = getattr(local, "conn", None)
+    if conn is None and not disabled:
+        try:
+            os.makedirs(os.path.dirname(CACHE_PATH) or ".", exist_ok=True)
+            conn = sqlite3.connect(CACHE_PATH, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(url TEXT PRIMARY KEY, etag TEXT, fetched INTEGER NOT NULL, "
+                "data BLOB NOT NULL)"
+            )
+        except (OSError, sqlite3.Error) as e:
+            disable(e)
+            return None
+        local.conn = conn
+    return conn
+
+
+def require_conn() -> sqlite3.Connection:
+    # CLI commands need the cache
+    conn = get_conn()
+    if conn is None:
+        raise Exception("TBA cache unavailable: " + CACHE_PATH)
+    return conn
+
+
+def encode(data: Any) -> bytes:
+    return zlib.compress(json.dumps(data, separators=(",", ":")).encode())
+
+
+def decode(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob))
+
+
+def is_fresh(fetched: int, ttl: Optional[int] = CACHE_TTL) -> bool:
+    return ttl is None or time.time() - fetched < ttl
+
+
+def load(url: str) -> Optional[Tuple[Any, Optional[str], int]]:
+    row = preloaded.get(url, None)
+    conn = get_conn() if row is None else None
+    if conn is not None:
+        try:
+            row = conn.execute(
+                "SELECT data, etag, fetched FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            disable(e)
+    if row is None:
+        return None
+    return decode(row[0]), row[1], row[2]
+
+
+def dump(
+    url: str, data: Any, etag: Optional[str], fetched: Optional[int] = None
+) -> None:
+    conn = get_conn()
+    if conn is None:
+        return
+    row = (encode(data), etag, fetched or int(time.time()))
+    try:
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (url, data, etag, fetched) "
+                "VALUES (?, ?, ?, ?)",
+                (url, *row),
+            )
+    except sqlite3.Error as e:
+        disable(e)
+        return
+    if url in preloaded:
+        preloaded[url] = row
+
+
+def touch(url: str) -> None:
+    # Revalidated with a 304, restarts the TTL
+    conn = get_conn()
+    if conn is None:
+        return
+    fetched = int(time.time())
+    try:
+        with conn:
+            conn.execute(
+                "UPDATE responses SET fetched = ? WHERE url = ?", (fetched, url)
+            )
+    except sqlite3.Error as e:
+        disable(e)
+        return
+    if url in preloaded:
+        data, etag, _ = preloaded[url]
+        preloaded[url] = (data, etag, fetched)
+
+
+def preload(year: int) -> int:
+    # Reads every cached response for a year (events/2024, event/2024xyz/...)
+    conn = get_conn()
+    if conn is None:
+        return 0
+    try:
+        rows = conn.execute(
+            "SELECT url, data, etag, fetched FROM responses WHERE url GLOB ?",
+            (f"*/{year}*",),
+        ).fetchall()
+    except sqlite3.Error as e:
+        disable(e)
+        return 0
+    for url, data, etag, fetched in rows:
+        preloaded[url] = (data, etag, fetched)
+    return len(preloaded)
+
+
+def clear_preload() -> None:
+    preloaded.clear()
+
+
+"""CLI"""
+
+
+def export_cache(path: str) -> int:
+    # JSON lines of {url, etag, fetched, data}
+    count = 0
+    rows = require_conn().execute("SELECT url, etag, fetched, data FROM responses")
+    with open(path, "w") as f:
+        for url, etag, fetched, data in rows:
+            obj = {"url": url, "etag": etag, "fetched": fetched, "data": decode(data)}
+            f.write(json.dumps(obj) + "\n")
+            count += 1
+    return count
+
+
+def import_cache(path: str) -> int:
+    require_conn()
+    count = 0
+    with open(path, "r") as f:
+        for line in f:
+            obj = json.loads(line)
+            dump(obj["url"], obj["data"], obj["etag"], obj["fetched"])
+            count += 1
+    return count
+
+
+def import_legacy_cache(path: str) -> int:
+    # Pickle per URL layout, <path>/<url>/data.p
+    require_conn()
+    count = 0
+    for root, _, files in os.walk(path):
+        if "data.p" not in files:
+            continue
+        url = os.path.relpath(root, path).replace(os.sep, "/")
+        fetched = int(os.path.getmtime(os.path.join(root, "data.p")))
+        dump(url, load_legacy_cache(root), None, fetched)
+        count += 1
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Manage the TBA response cache")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("export").add_argument("path")
+    subparsers.add_parser("import").add_argument("path")
+    subparsers.add_parser("import-legacy").add_argument(
+        "path", nargs="?", default="cache"
+    )
+    subparsers.add_parser("stats")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        print("Exported", export_cache(args.path), "responses")
+    elif args.command == "import":
+        print("Imported", import_cache(args.path), "responses")
+    elif args.command == "import-legacy":
+        print("Imported", import_legacy_cache(args.path), "responses")
+    elif args.command == "stats":
+        count, size = (
+            require_conn()
+            .execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM responses")
+            .fetchone()
+        )
+        print("Responses:", count, "Compressed size (MB):", round(size / 1e6, 2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,23 @@
+import os
 from typing import Dict, List
 
 # DEV SETUP
 
 AUTH_KEY = "XeUIxlvO4CPc44NlLE3ncevDg7bAhp6CRy6zC9M2aQb2zGfys0M30eKwavFJSEJr"
 
+# Override to point at a local stub server
+READ_PREFIX = os.getenv("TBA_READ_PREFIX", "https://www.thebluealliance.com/api/v3/")
+
+# Max concurrent TBA requests, also the size of the connection pool
+MAX_CONNECTIONS = int(os.getenv("TBA_MAX_CONNECTIONS", "16"))
+MAX_RETRIES = 5
+TIMEOUT = 30
+
+# Single file response cache, entries older than the TTL (seconds) are
+# revalidated with their ETag, no TTL keeps entries forever
+CACHE_PATH = os.getenv("TBA_CACHE_PATH", "cache/tba.sqlite3")
+CACHE_TTL = int(os.getenv("TBA_CACHE_TTL", "0")) or None
+
 
 # GEOGRAPHY
 
@@ -1,47 +1,102 @@
-import os
-from typing import Any, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, List, Optional, Tuple, TypeVar, Union
 
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from src.tba.constants import AUTH_KEY
-from src.tba.utils import dump_cache, load_cache
+from src.tba.constants import (
+    AUTH_KEY,
+    MAX_CONNECTIONS,
+    MAX_RETRIES,
+    READ_PREFIX,
+    TIMEOUT,
+)
+from src.tba.cache import (
+    dump as dump_cache,
+    is_fresh,
+    load as load_cache,
+    touch as touch_cache,
+)
 
-read_prefix = "https://www.thebluealliance.com/api/v3/"
+read_prefix = READ_PREFIX
+
+# Retries connection errors, 429s (honoring Retry-After) and 5xxs with backoff
+retry = Retry(
+    total=MAX_RETRIES,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+adapter = HTTPAdapter(
+    pool_connections=4, pool_maxsize=MAX_CONNECTIONS, pool_block=True, max_retries=retry
+)
 
 session = Session()
 session.headers.update({"X-TBA-Auth-Key": AUTH_KEY, "X-TBA-Auth-Id": ""})
+session.mount("https://", adapter)
+session.mount("http://", adapter)
+
+T = TypeVar("T")
+S = TypeVar("S")
 
 
 def _get_tba(
     url: str, etag: Optional[str] = None
 ) -> Tuple[Union[Any, bool], Optional[str]]:
-    if etag is not None:
-        session.headers.update({"If-None-Match": etag})
-        response = session.get(read_prefix + url)
-        if response.status_code == 304:
-            return True, etag
-        elif response.status_code == 200:
-            return response.json(), response.headers.get("ETag")
-    else:
-        response = session.get(read_prefix + url)
-        if response.status_code == 200:
-            return response.json(), response.headers.get("ETag")
+    # Per request headers, the session is shared across threads
+    headers = {} if etag is None else {"If-None-Match": etag}
+    response = session.get(read_prefix + url, headers=headers, timeout=TIMEOUT)
+    if response.status_code == 304 and etag is not None:
+        return True, etag
+    elif response.status_code == 200:
+        return response.json(), response.headers.get("ETag")
     return False, None
 
 
 def get_tba(
     url: str, etag: Optional[str] = None, cache: bool = True
 ) -> Tuple[Union[Any, bool], Optional[str]]:
-    if cache and os.path.exists("cache/" + url + "/data.p"):
+    cached = load_cache(url) if cache else None
+    if cached is not None and is_fresh(cached[2]):
         # Cache Hit
-        return load_cache("cache/" + url), None
+        return cached[0], None
 
-    data, new_etag = _get_tba(url, etag)
+    if cached is not None and cached[1] is not None and etag is None:
+        # Expired, revalidate with the cached ETag
+        data, new_etag = _get_tba(url, cached[1])
+        if data is True:
+            touch_cache(url)
+            return cached[0], None
+    else:
+        data, new_etag = _get_tba(url, etag)
 
     # Either Etag or Invalid
     if type(data) is bool:
         return data, new_etag
 
-    # Cache Miss
-    dump_cache("cache/" + url, data)
+    # Cache Miss, stored only when reads use the cache
+    if cache:
+        dump_cache(url, data, new_etag)
     return data, new_etag
+
+
+def map_tba(func: Callable[[T], S], items: List[T]) -> List[S]:
+    # Runs TBA calls concurrently (up to MAX_CONNECTIONS), keeps input order
+    if len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=MAX_CONNECTIONS) as executor:
+        return list(executor.map(func, items))
+
+
+def any_tba(funcs: List[Callable[[], bool]]) -> bool:
+    # Returns on the first True, without waiting for the remaining calls
+    executor = ThreadPoolExecutor(max_workers=MAX_CONNECTIONS)
+    try:
+        futures = [executor.submit(func) for func in funcs]
+        return any(future.result() for future in as_completed(futures))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -7,7 +7,7 @@ from src.constants import CURR_WEEK, CURR_YEAR
 from src.tba.breakdown import clean_breakdown, post_clean_breakdown
 from src.tba.clean_data import clean_district, clean_state, get_match_time
 from src.tba.constants import DISTRICT_OVERRIDES, EVENT_BLACKLIST, MATCH_BLACKLIST
-from src.tba.main import get_tba
+from src.tba.main import get_tba, map_tba
 from src.tba.types import EventDict, MatchDict, TeamDict
 from src.types.enums import CompLevel, EventType, MatchStatus, MatchWinner
 from src.utils.utils import get_team_event_key
@@ -19,8 +19,10 @@ def get_timestamp_from_str(date: str):
 
 def get_teams(cache: bool = True) -> List[TeamDict]:
     out: List[TeamDict] = []
-    for i in range(20):
-        data, _ = get_tba("teams/" + str(i), etag=None, cache=cache)
+    pages = map_tba(
+        lambda i: get_tba("teams/" + str(i), etag=None, cache=cache), list(range(20))
+    )
+    for data, _ in pages:
         if type(data) is bool:
             continue
         for data_team in data:
@@ -1,4 +1,8 @@
-from datetime import datetime, timedelta
+import asyncio
+import sys
+import time
+from collections import OrderedDict
+from datetime import timedelta
 from functools import wraps
 from typing import (
     Any,
@@ -6,8 +10,10 @@ from typing import (
     Callable,
     Dict,
     FrozenSet,
-    List,
+    NamedTuple,
+    Optional,
     ParamSpec,
+    Set,
     Tuple,
     TypeVar,
 )
@@ -18,46 +24,112 @@ TOutput = TypeVar("TOutput")
 TKey = Tuple[Tuple[Any, ...], FrozenSet[Tuple[str, Any]]]
 
 
-def alru_cache(max_size: int = 128, ttl: timedelta = timedelta(minutes=1)):
+class CacheInfo(NamedTuple):
+    hits: int
+    stale_hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+    size: int
+    bytes: int
+
+
+def approx_size(value: Any, depth: int = 3) -> int:
+    # Rough deep size, follows containers and attrs/dataclass slots a few levels
+    size = sys.getsizeof(value)
+    if depth == 0 or isinstance(value, (str, bytes, int, float, bool)):
+        return size
+    if isinstance(value, dict):
+        items = list(value.keys()) + list(value.values())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = list(value)
+    elif hasattr(value, "__slots__"):
+        items = [getattr(value, s, None) for s in value.__slots__]
+    elif hasattr(value, "__dict__"):
+        items = list(vars(value).values())
+    else:
+        return size
+    if len(items) > 64:
+        # Extrapolate from a sample for large lists of similar objects
+        sample = items[:: len(items) // 64]
+        per_item = sum(approx_size(x, depth - 1) for x in sample) / len(sample)
+        return size + int(per_item * len(items))
+    return size + sum(approx_size(x, depth - 1) for x in items)
+
+
+def alru_cache(
+    max_size: int = 128,
+    ttl: timedelta = timedelta(minutes=1),
+    stale_ttl: Optional[timedelta] = None,
+    max_bytes: Optional[int] = None,
+):
+    """
+    Async LRU cache for functions returning (cacheable, value).
+
+    Concurrent misses on the same key share one call. If stale_ttl is set,
+    entries up to ttl + stale_ttl old are returned immediately while a single
+    background call refreshes them. Entries are evicted least recently used
+    first once there are more than max_size, or their approximate total size
+    exceeds max_bytes. Pass no_cache=True to skip the cache read.
+    """
+
+    ttl_seconds = ttl.total_seconds()
+    stale_seconds = ttl_seconds + (stale_ttl.total_seconds() if stale_ttl else 0)
+
     def decorator(
         func: Callable[Param, Awaitable[Tuple[bool, TOutput]]]
     ) -> Callable[Param, Awaitable[TOutput]]:
-        cache: Dict[TKey, Tuple[datetime, TOutput]] = {}
-        keys: List[TKey] = []
+        # key -> (timestamp, value, approximate bytes), oldest first
+        cache: "OrderedDict[TKey, Tuple[float, TOutput, int]]" = OrderedDict()
+        in_flight: Dict[TKey, "asyncio.Future[TOutput]"] = {}
+        refreshing: Set["asyncio.Future[TOutput]"] = set()
+        stats = {"hits": 0, "stale_hits": 0, "misses": 0, "coalesced": 0}
+        evictions = [0]
+        total_bytes = [0]
+
+        def pop(key: TKey) -> None:
+            _, _, size = cache.pop(key)
+            total_bytes[0] -= size
+
+        def store(key: TKey, flag: bool, value: TOutput) -> TOutput:
+            # if flag = False, do not update cache and return value
+            if not flag:
+                return value
 
-        def in_cache(key: TKey) -> bool:
-            # key not in cache
-            if key not in cache:
-                return False
+            if key in cache:
+                pop(key)
+            size = approx_size(value) if max_bytes is not None else 0
+            cache[key] = (time.monotonic(), value, size)
+            total_bytes[0] += size
 
-            # key in cache but expired
-            if datetime.now() - cache[key][0] > ttl:
-                return False
+            # remove least recently used keys if cache is full
+            while len(cache) > max_size or (
+                max_bytes is not None and total_bytes[0] > max_bytes and len(cache) > 1
+            ):
+                pop(next(iter(cache)))
+                evictions[0] += 1
 
-            # key in cache and not expired
-            return True
+            return value
 
-        def update_cache_and_return(key: TKey, flag: bool, value: TOutput) -> TOutput:
-            # if flag = False, do not update cache and return value
-            if not flag:
-                return value
+        async def call(key: TKey, *args: Any, **kwargs: Any) -> TOutput:
+            (flag, value) = await func(*args, **kwargs)
+            return store(key, flag, value)
 
-            # if flag = True, update cache
-            now = datetime.now()
-            cache[key] = (now, value)
-            keys.append(key)
+        def start(key: TKey, *args: Any, **kwargs: Any) -> "asyncio.Future[TOutput]":
+            # Single flight, later callers for the key await the same task
+            task = asyncio.ensure_future(call(key, *args, **kwargs))
+            in_flight[key] = task
 
-            # remove oldest key if cache is full
-            if len(keys) > max_size:
-                try:
-                    # Should not raise KeyError, but just in case
-                    del cache[keys.pop(0)]
-                except KeyError:
-                    # Already deleted by another thread
-                    pass
+            def done(task: "asyncio.Future[TOutput]") -> None:
+                if in_flight.get(key, None) is task:
+                    del in_flight[key]
+                # Awaiting callers still see the exception, a background
+                # refresh with no callers should not log it as unretrieved
+                if not task.cancelled():
+                    task.exception()
 
-            # return value from cache
-            return value  # equal to cache[key][1]
+            task.add_done_callback(done)
+            return task
 
         @wraps(func)
         async def wrapper(*args: Param.args, **kwargs: Param.kwargs) -> TOutput:
@@ -65,15 +137,53 @@ def alru_cache(max_size: int = 128, ttl: timedelta = timedelta(minutes=1)):
                 [(k, v) for k, v in kwargs.items() if k not in ["no_cache"]]
             )
             if "no_cache" in kwargs and kwargs["no_cache"]:
-                (flag, value) = await func(*args, **kwargs)
-                return update_cache_and_return(key, flag, value)
-
-            if in_cache(key):
-                return cache[key][1]
+                return await call(key, *args, **kwargs)
+
+            entry = cache.get(key, None)
+            if entry is not None:
+                age = time.monotonic() - entry[0]
+                if age <= ttl_seconds:
+                    stats["hits"] += 1
+                    cache.move_to_end(key)
+                    return entry[1]
+
+                if age <= stale_seconds:
+                    # Serve stale, refresh in the background
+                    stats["stale_hits"] += 1
+                    cache.move_to_end(key)
+                    if key not in in_flight:
+                        task = start(key, *args, **kwargs)
+                        refreshing.add(task)  # keep a reference until done
+                        task.add_done_callback(refreshing.discard)
+                    return entry[1]
+
+            future = in_flight.get(key, None)
+            if future is not None:
+                stats["coalesced"] += 1
+            else:
+                stats["misses"] += 1
+                future = start(key, *args, **kwargs)
+
+            # Shielded so a cancelled request does not cancel the shared call
+            return await asyncio.shield(future)
+
+        def cache_info() -> CacheInfo:
+            return CacheInfo(
+                stats["hits"],
+                stats["stale_hits"],
+                stats["misses"],
+                stats["coalesced"],
+                evictions[0],
+                len(cache),
+                total_bytes[0],
+            )
 
-            (flag, value) = await func(*args, **kwargs)
-            return update_cache_and_return(key, flag, value)
+        def cache_clear() -> None:
+            cache.clear()
+            total_bytes[0] = 0
 
+        wrapper.cache_info = cache_info  # type: ignore
+        wrapper.cache_clear = cache_clear  # type: ignore
         return wrapper
 
     return decorator
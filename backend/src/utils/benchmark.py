@@ -0,0 +1,461 @@
+import argparse
+import hashlib
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from src.constants import PROD
+from src.data.avg import process_year as process_year_avg
+from src.data.epa.agg import process_year as process_year_agg
+from src.data.epa.calc import process_year as process_year_calc
+from src.data.epa.main import post_process as post_process_epa
+from src.data.epa.metrics import process_year as process_year_metrics
+from src.data.index import SeasonIndex
+from src.data.tba import (
+    load_teams as load_teams_tba,
+    post_process as post_process_tba,
+    process_year as process_year_tba,
+)
+from src.data.utils import create_objs, write_objs as write_objs_db
+from src.data.wins import (
+    post_process as post_process_wins,
+    process_year as process_year_wins,
+)
+from src.db.models import Team
+from src.db.write.main import update_teams as update_teams_db
+from src.tba import cache as tba_cache, main as tba_main
+from src.tba.cache import (
+    clear_preload as clear_preload_cache_tba,
+    preload as preload_cache_tba,
+)
+
+# Times each data pipeline stage on a frozen fixture year, replayed through the
+# TBA response cache with no network, and records the traced peak memory of
+# each stage. The fixture is a `tba-cache export` file (recorded payloads) or a
+# seeded synthetic season. Results are JSON, compared against a previous run:
+#
+#   python -m src.utils.benchmark --out base.json
+#   python -m src.utils.benchmark --compare base.json --threshold 0.1
+#
+# --write adds write_objs and the DB post processing steps. It clears and
+# rewrites the fixture year, so only run it against a local CockroachDB.
+
+# No connection adapter handles this scheme, so a response missing from the
+# fixture raises instead of reaching TBA
+OFFLINE_PREFIX = "offline://"
+
+# Differences below this are noise, whatever the ratio
+MIN_SECONDS = 0.005
+MIN_MB = 1
+
+STATES = ["California", "Michigan", "Texas", "Ontario", "New York", "Florida"]
+
+T = TypeVar("T")
+
+
+"""FIXTURES"""
+
+
+def get_score(rng: random.Random, strengths: List[float]) -> int:
+    return max(0, round(sum(strengths) + rng.gauss(0, 15)))
+
+
+def make_match(
+    rng: random.Random,
+    key: str,
+    comp_level: str,
+    set_number: int,
+    match_number: int,
+    match_time: int,
+    red: List[int],
+    blue: List[int],
+    strengths: Dict[int, float],
+) -> Dict[str, Any]:
+    red_score = get_score(rng, [strengths[t] for t in red])
+    blue_score = get_score(rng, [strengths[t] for t in blue])
+    winner = "red" if red_score > blue_score else "blue"
+    return {
+        "key": key,
+        "comp_level": comp_level,
+        "set_number": set_number,
+        "match_number": match_number,
+        "time": match_time,
+        "predicted_time": match_time,
+        "winning_alliance": "" if red_score == blue_score else winner,
+        "score_breakdown": None,
+        "videos": [],
+        "alliances": {
+            alliance: {
+                "team_keys": ["frc" + str(t) for t in teams],
+                "dq_team_keys": [],
+                "surrogate_team_keys": [],
+                "score": score,
+            }
+            for alliance, teams, score in [
+                ("red", red, red_score),
+                ("blue", blue, blue_score),
+            ]
+        },
+    }
+
+
+def make_fixture(
+    year: int,
+    num_events: int,
+    num_teams: int,
+    teams_per_event: int,
+    num_quals: int,
+    seed: int,
+) -> Dict[str, Any]:
+    # Synthetic season in TBA's response shapes, URL to payload: regionals
+    # over six weeks and two champs divisions, each with qualification matches
+    # and a two match final. Scores follow hidden team strengths, so the EPA
+    # stages have a signal to fit. No score breakdowns, use a year before 2016.
+    rng = random.Random(seed)
+    teams = list(range(1, num_teams + 1))
+    strengths = {t: rng.gauss(15, 6) for t in teams}
+
+    out: Dict[str, Any] = {"teams/" + str(i): [] for i in range(20)}
+    out["teams/0"] = [
+        {
+            "key": "frc" + str(t),
+            "nickname": "Team " + str(t),
+            "rookie_year": year - rng.randint(0, 20),
+            "country": "USA",
+            "state_prov": rng.choice(STATES),
+        }
+        for t in teams
+    ]
+    out["districts/" + str(year)] = []
+
+    events: List[Dict[str, Any]] = []
+    for i in range(num_events):
+        key = str(year) + "ev" + str(i)
+        champs = i >= num_events - 2
+        week = 6 if champs else i * 6 // max(1, num_events - 2)
+        start = date(year, 3, 1) + timedelta(days=7 * week)
+        events.append(
+            {
+                "key": key,
+                "name": "Event " + str(i),
+                "event_type": 3 if champs else 0,
+                "district": None,
+                "week": week,
+                "country": "USA",
+                "state_prov": rng.choice(STATES),
+                "start_date": start.isoformat(),
+                "end_date": (start + timedelta(days=2)).isoformat(),
+                "webcasts": [],
+            }
+        )
+
+        event_teams = rng.sample(teams, teams_per_event)
+        event_time = int(time.mktime(start.timetuple()))
+        matches: List[Dict[str, Any]] = []
+        for j in range(num_quals):
+            chosen = rng.sample(event_teams, 6)
+            matches.append(
+                make_match(
+                    rng,
+                    key + "_qm" + str(j + 1),
+                    "qm",
+                    1,
+                    j + 1,
+                    event_time + 420 * j,
+                    chosen[:3],
+                    chosen[3:],
+                    strengths,
+                )
+            )
+
+        ranked = sorted(event_teams, key=lambda t: -strengths[t] - rng.gauss(0, 5))
+        alliances = [ranked[3 * k : 3 * k + 3] for k in range(8)]
+        for j in range(2):
+            matches.append(
+                make_match(
+                    rng,
+                    key + "_f1m" + str(j + 1),
+                    "f",
+                    1,
+                    j + 1,
+                    event_time + 86400 + 600 * j,
+                    alliances[0],
+                    alliances[1],
+                    strengths,
+                )
+            )
+
+        out["event/" + key + "/matches"] = matches
+        out["event/" + key + "/teams/simple"] = [
+            {"key": "frc" + str(t)} for t in event_teams
+        ]
+        out["event/" + key + "/rankings"] = {
+            "rankings": [
+                {"team_key": "frc" + str(t), "rank": k + 1}
+                for k, t in enumerate(ranked)
+            ]
+        }
+        out["event/" + key + "/alliances"] = [
+            {"name": "Alliance " + str(k + 1), "picks": ["frc" + str(t) for t in picks]}
+            for k, picks in enumerate(alliances)
+        ]
+
+    out["events/" + str(year)] = events
+    return out
+
+
+def write_fixture(fixture: Dict[str, Any], path: str) -> None:
+    # Same JSON lines as `tba-cache export`, in URL order
+    with open(path, "w") as f:
+        for url in sorted(fixture):
+            obj = {"url": url, "etag": None, "fetched": 0, "data": fixture[url]}
+            f.write(json.dumps(obj) + "\n")
+
+
+def load_fixture(path: str) -> int:
+    # Into a fresh response cache, fetched now so entries are fresh under any TTL
+    tba_cache.CACHE_PATH = os.path.join(tempfile.mkdtemp(), "tba.sqlite3")
+    tba_main.read_prefix = OFFLINE_PREFIX
+    count = 0
+    with open(path, "r") as f:
+        for line in f:
+            obj = json.loads(line)
+            tba_cache.dump(obj["url"], obj["data"], obj["etag"])
+            count += 1
+    return count
+
+
+def get_fixture_year(path: str) -> int:
+    with open(path, "r") as f:
+        for line in f:
+            url = json.loads(line)["url"]
+            if url.startswith("events/"):
+                return int(url.split("/")[1])
+    raise Exception("Fixture has no events/<year> response")
+
+
+def get_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+"""STAGES"""
+
+
+class Recorder:
+    """
+    Wall time of each stage in one pipeline run, and the peak memory allocated
+    above the stage's starting point when tracemalloc is tracing.
+    """
+
+    def __init__(self):
+        self.times: Dict[str, float] = {}
+        self.peaks: Dict[str, float] = {}
+
+    def run(self, name: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            start_size = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        out = func(*args, **kwargs)
+        self.times[name] = time.perf_counter() - start
+        if tracing:
+            peak = tracemalloc.get_traced_memory()[1] - start_size
+            self.peaks[name] = peak / 2**20
+        return out
+
+
+def get_tba_objs(year_num: int, teams: List[Team]) -> Tuple[List[Team], Any]:
+    # As prepare_year, with one read for the year's cached responses
+    preload_cache_tba(year_num)
+    try:
+        return process_year_tba(year_num, teams, create_objs(year_num), False, True)
+    finally:
+        clear_preload_cache_tba()
+
+
+def run_pipeline(year_num: int, teams: List[Team], write: bool) -> Recorder:
+    # One full reset of the year, in data/main.py order
+    recorder = Recorder()
+    new_teams, objs = recorder.run("tba", get_tba_objs, year_num, list(teams))
+
+    year_obj = recorder.run("avg", process_year_avg, objs[0], list(objs[4].values()))
+    objs = (year_obj, *objs[1:])
+    index = recorder.run("index", SeasonIndex, objs)
+    objs = recorder.run("wins", process_year_wins, objs, index)
+
+    objs = recorder.run("epa_calc", process_year_calc, objs, {}, index=index)
+    objs = recorder.run("epa_agg", process_year_agg, objs)
+    objs = recorder.run("epa_metrics", process_year_metrics, objs)
+
+    if write:
+        recorder.run("write", write_objs_db, year_num, objs, None, True)
+
+    all_teams = teams + new_teams
+    all_team_years = {year_num: {ty.team: ty for ty in objs[1].values()}}
+    recorder.run("post_wins", post_process_wins, all_teams, all_team_years)
+    recorder.run("post_epa", post_process_epa, all_teams, all_team_years)
+
+    if write:
+        recorder.run("post_update_teams", update_teams_db, all_teams)
+        recorder.run("post_tba", post_process_tba)
+
+    return recorder
+
+
+"""RESULTS"""
+
+
+def get_git() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain"], capture_output=True, text=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+    return {"commit": commit, "dirty": status.strip() != ""}
+
+
+def run(fixture_path: str, repeat: int, write: bool, memory: bool) -> Dict[str, Any]:
+    year_num = get_fixture_year(fixture_path)
+    num_responses = load_fixture(fixture_path)
+    teams = load_teams_tba(cache=True)
+
+    # Timed runs untraced (tracemalloc slows allocation heavy stages), then
+    # one traced run for the memory peaks
+    runs = [run_pipeline(year_num, teams, write) for _ in range(repeat)]
+    peaks: Dict[str, float] = {}
+    if memory:
+        tracemalloc.start()
+        try:
+            peaks = run_pipeline(year_num, teams, write).peaks
+        finally:
+            tracemalloc.stop()
+
+    stages: Dict[str, Dict[str, Optional[float]]] = {}
+    for name in runs[0].times:
+        times = [x.times[name] for x in runs]
+        stages[name] = {
+            "min_s": round(min(times), 4),
+            "median_s": round(statistics.median(times), 4),
+            "peak_mb": round(peaks[name], 1) if name in peaks else None,
+        }
+
+    return {
+        **get_git(),
+        "timestamp": int(time.time()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "fixture": {
+            "year": year_num,
+            "responses": num_responses,
+            "sha256": get_hash(fixture_path),
+        },
+        "repeat": repeat,
+        "write": write,
+        "stages": stages,
+        "total_s": round(sum(x["min_s"] or 0 for x in stages.values()), 4),
+        # KB on Linux
+        "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024),
+    }
+
+
+def compare(
+    base: Dict[str, Any], results: Dict[str, Any], threshold: float
+) -> List[str]:
+    # Prints min time and peak memory per stage, returns the regressed stages
+    if base["fixture"]["sha256"] != results["fixture"]["sha256"]:
+        print("Warning: different fixtures, results are not comparable")
+
+    regressions: List[str] = []
+    print("stage".ljust(20), "base".rjust(10), "new".rjust(10), "change".rjust(8))
+    for name, stage in results["stages"].items():
+        base_stage = base["stages"].get(name)
+        if base_stage is None:
+            continue
+        for field, floor in [("min_s", MIN_SECONDS), ("peak_mb", MIN_MB)]:
+            prev, curr = base_stage.get(field), stage.get(field)
+            if prev is None or curr is None:
+                continue
+            change = (curr - prev) / prev if prev > 0 else 0
+            regressed = change > threshold and curr - prev > floor
+            print(
+                (name + " " + field).ljust(20),
+                str(prev).rjust(10),
+                str(curr).rjust(10),
+                f"{change:+.1%}".rjust(8),
+                "REGRESSION" if regressed else "",
+            )
+            if regressed:
+                regressions.append(name + " " + field)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the data pipeline")
+    parser.add_argument("--fixture", help="`tba-cache export` file of one year")
+    parser.add_argument("--year", type=int, default=2014, help="Synthetic fixture")
+    parser.add_argument("--events", type=int, default=90)
+    parser.add_argument("--teams", type=int, default=2700)
+    parser.add_argument("--teams-per-event", type=int, default=40)
+    parser.add_argument("--quals", type=int, default=80)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save-fixture", help="Writes the synthetic fixture")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--write", action="store_true", help="Local DB stages")
+    parser.add_argument("--out", help="JSON results file")
+    parser.add_argument("--compare", help="Previous JSON results file")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    if args.write and PROD:
+        raise Exception("--write rewrites the fixture year, local DB only")
+
+    fixture_path = args.fixture
+    if fixture_path is None:
+        fixture_path = args.save_fixture or os.path.join(
+            tempfile.mkdtemp(), "fixture.jsonl"
+        )
+        fixture = make_fixture(
+            args.year,
+            args.events,
+            args.teams,
+            args.teams_per_event,
+            args.quals,
+            args.seed,
+        )
+        write_fixture(fixture, fixture_path)
+
+    results = run(fixture_path, args.repeat, args.write, not args.no_memory)
+    if args.out is not None:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.compare is not None:
+        with open(args.compare, "r") as f:
+            base = json.load(f)
+        regressions = compare(base, results, args.threshold)
+        if len(regressions) > 0:
+            print("Regressions:", ", ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import hashlib
+from typing import Any, Callable
+
+from fastapi import Request, Response, status
+
+# Public JSON reads, the site and export routes set their own caching headers
+ETAG_PREFIXES = ("/v2/", "/v3/")
+ETAG_EXCLUDE = ("/v3/site", "/v3/data", "/v3/export")
+
+
+async def etag_middleware(request: Request, call_next: Callable[[Any], Any]) -> Any:
+    # Clients revalidate cached responses with If-None-Match and get an empty
+    # 304 if nothing changed. Saves bandwidth, the body is still computed.
+    response = await call_next(request)
+    path = request.url.path
+    if (
+        request.method != "GET"
+        or response.status_code != status.HTTP_200_OK
+        or not path.startswith(ETAG_PREFIXES)
+        or path.startswith(ETAG_EXCLUDE)
+        or response.headers.get("content-type") != "application/json"
+    ):
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    etag = 'W/"' + hashlib.md5(body).hexdigest() + '"'
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    headers = dict(response.headers)
+    headers["ETag"] = etag
+    return Response(body, status_code=response.status_code, headers=headers)
@@ -0,0 +1,82 @@
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import requests
+
+# Concurrent GETs against a running backend (e.g. `npm run start` with a local
+# CockroachDB), reports latency percentiles per path. --no-cache appends
+# no_cache=True, which site endpoints honor, to measure the DB read path.
+
+DEFAULT_PATHS = [
+    "/v3/team_years?year=2023&limit=1000",
+    "/v3/matches?year=2023&limit=1000",
+    "/v3/team_events?year=2023&limit=1000",
+    "/v3/site/team_years/2023",
+    "/v3/site/events/2023",
+]
+
+
+def percentile(values: List[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p / 100 * len(values)))]
+
+
+def run(
+    url: str, paths: List[str], concurrency: int, requests_per_path: int, no_cache: bool
+) -> Dict[str, Dict[str, float]]:
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=concurrency)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    def fetch(path: str) -> float:
+        if no_cache:
+            path += ("&" if "?" in path else "?") + "no_cache=True"
+        start = time.perf_counter()
+        session.get(url + path, timeout=60).raise_for_status()
+        return time.perf_counter() - start
+
+    # Interleaved, so slow and fast endpoints compete as in production
+    jobs = [path for _ in range(requests_per_path) for path in paths]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(fetch, jobs))
+    total = time.perf_counter() - start
+
+    out: Dict[str, Dict[str, float]] = {}
+    for path in paths + ["all"]:
+        values = [x for x, p in zip(latencies, jobs) if path in ["all", p]]
+        out[path] = {
+            "count": len(values),
+            "p50_ms": round(1000 * percentile(values, 50), 1),
+            "p95_ms": round(1000 * percentile(values, 95), 1),
+            "p99_ms": round(1000 * percentile(values, 99), 1),
+        }
+    out["all"]["requests_per_s"] = round(len(jobs) / total, 1)
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the backend")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--path", action="append", dest="paths")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--no-cache", action="store_true")
+    args = parser.parse_args()
+
+    results = run(
+        args.url,
+        args.paths or DEFAULT_PATHS,
+        args.concurrency,
+        args.requests,
+        args.no_cache,
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
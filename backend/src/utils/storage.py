@@ -0,0 +1,135 @@
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from google.cloud import storage as gcs  # type: ignore
+
+from src.constants import EXPORT_PATH, STORAGE_BUCKET, STORAGE_CACHE_PATH
+
+# Files shared by the data and API services, by name (ex: "2023/matches.arrow").
+# A GCS bucket when STORAGE_BUCKET is set, else a directory under EXPORT_PATH,
+# which only works when both run on one host (local development). Versions
+# change on every write, readers reload when the version they hold is stale.
+
+# Seconds a bucket object's version is reused before asking GCS again, so hot
+# read paths don't make a request each
+VERSION_TTL = 30
+
+bucket: Optional[Any] = None
+bucket_lock = threading.Lock()
+
+# name -> (checked at, version or None if missing)
+versions: Dict[str, Tuple[float, Optional[str]]] = {}
+
+
+def get_bucket() -> Any:
+    global bucket
+    if bucket is None:
+        with bucket_lock:
+            if bucket is None:
+                bucket = gcs.Client().bucket(STORAGE_BUCKET)
+    return bucket
+
+
+def get_local_path(name: str) -> str:
+    return os.path.join(EXPORT_PATH, name)
+
+
+def get_version(name: str) -> Optional[str]:
+    if STORAGE_BUCKET == "":
+        try:
+            stat = os.stat(get_local_path(name))
+        except OSError:
+            return None
+        return str(stat.st_mtime_ns) + "-" + str(stat.st_size)
+
+    entry = versions.get(name)
+    if entry is None or time.monotonic() - entry[0] > VERSION_TTL:
+        blob = get_bucket().get_blob(name)
+        entry = (time.monotonic(), None if blob is None else str(blob.generation))
+        versions[name] = entry
+    return entry[1]
+
+
+def read_bytes(name: str) -> Optional[Tuple[str, bytes]]:
+    # (version, data), or None if missing
+    if STORAGE_BUCKET == "":
+        try:
+            with open(get_local_path(name), "rb") as f:
+                stat = os.fstat(f.fileno())
+                data = f.read()
+        except OSError:
+            return None
+        return str(stat.st_mtime_ns) + "-" + str(stat.st_size), data
+
+    # Downloads the generation the metadata describes
+    blob = get_bucket().get_blob(name)
+    if blob is None:
+        return None
+    return str(blob.generation), blob.download_as_bytes()
+
+
+def write_bytes(name: str, data: bytes, content_type: str) -> None:
+    if STORAGE_BUCKET == "":
+        # Written aside and renamed so readers never see a partial file
+        path = get_local_path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        return
+
+    get_bucket().blob(name).upload_from_string(data, content_type=content_type)
+    versions.pop(name, None)
+
+
+def get_path(name: str) -> Optional[Tuple[str, str]]:
+    # (version, local file) for memory mapping. Bucket files are downloaded to
+    # STORAGE_CACHE_PATH once per version, older versions are removed.
+    if STORAGE_BUCKET == "":
+        version = get_version(name)
+        return None if version is None else (version, get_local_path(name))
+
+    blob = get_bucket().get_blob(name)
+    if blob is None:
+        return None
+    version = str(blob.generation)
+    path = os.path.join(STORAGE_CACHE_PATH, name + "." + version)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = path + "." + str(threading.get_ident()) + ".tmp"
+        blob.download_to_filename(temp_path)
+        os.replace(temp_path, path)
+
+        # Open memory maps keep a removed file readable
+        prefix = os.path.basename(name) + "."
+        for entry in os.scandir(os.path.dirname(path)):
+            stale = entry.name.startswith(prefix) and entry.path != path
+            if stale and not entry.name.endswith(".tmp"):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+    return version, path
+
+
+def get_url(name: str) -> Optional[str]:
+    # Public URL of a bucket file, None without a bucket
+    if STORAGE_BUCKET == "":
+        return None
+    return "https://storage.googleapis.com/" + STORAGE_BUCKET + "/" + name
+
+
+def list_names() -> List[str]:
+    if STORAGE_BUCKET == "":
+        out: List[str] = []
+        for root, _, files in os.walk(EXPORT_PATH):
+            for file in files:
+                if not file.endswith(".tmp"):
+                    path = os.path.join(root, file)
+                    out.append(os.path.relpath(path, EXPORT_PATH).replace(os.sep, "/"))
+        return sorted(out)
+
+    return sorted(blob.name for blob in get_bucket().list_blobs())
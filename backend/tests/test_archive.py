@@ -0,0 +1,175 @@
+import os
+import tempfile
+import unittest
+
+import pyarrow as pa  # type: ignore
+
+from src.data.export import to_arrow
+from src.db.archive import TABLES, ArchiveTable
+from src.db.models import Event, Match, TeamEvent, TeamMatch, TeamYear, Year
+from src.types.enums import CompLevel, EventStatus, EventType, MatchStatus, MatchWinner
+
+
+def get_items():
+    # Rows as the DB returns them, with nulls in every nullable column type
+    event = dict(year=2019, event="2019test", offseason=False, week=1)
+    match = dict(
+        year=2019,
+        event="2019test",
+        offseason=False,
+        week=1,
+        elim=False,
+        comp_level=CompLevel.QUAL,
+        set_number=1,
+        red_1="254",
+        red_2="1678",
+        red_3="118",
+        blue_1="971",
+        blue_2="1323",
+        blue_3="2056",
+    )
+    return {
+        "years": [Year(year=2019, score_mean=60.5, score_sd=None)],
+        "team_years": [
+            TeamYear(year=2019, team="254", name="Cheesy Poofs", epa=42.0),
+            TeamYear(year=2019, team="1678", name=None, epa=None),
+        ],
+        "events": [
+            Event(
+                key="2019test",
+                year=2019,
+                name="Test",
+                type=EventType.REGIONAL,
+                status=EventStatus.COMPLETED,
+                district=None,
+            )
+        ],
+        "team_events": [
+            TeamEvent(team="254", is_captain=True, rank=1, **event),
+            TeamEvent(team="1678", is_captain=False, rank=None, **event),
+            TeamEvent(team="118", is_captain=None, rank=2, **event),
+        ],
+        "matches": [
+            Match(
+                key="2019test_qm1",
+                match_number=1,
+                status=MatchStatus.COMPLETED,
+                winner=MatchWinner.RED,
+                red_score=80,
+                red_rp_1=True,
+                red_rp_2=False,
+                blue_rp_1=False,
+                blue_rp_2=True,
+                **match,
+            ),
+            Match(
+                key="2019test_qm2",
+                match_number=2,
+                status=MatchStatus.UPCOMING,
+                winner=None,
+                red_score=None,
+                red_rp_1=None,
+                red_rp_2=None,
+                blue_rp_1=None,
+                blue_rp_2=None,
+                **match,
+            ),
+        ],
+        "team_matches": [
+            TeamMatch(
+                team="254",
+                year=2019,
+                event="2019test",
+                match="2019test_qm1",
+                alliance="red",
+                epa=31.5,
+                dq=False,
+            ),
+            TeamMatch(
+                team="254",
+                year=2019,
+                event="2019test",
+                match="2019test_qm2",
+                alliance="red",
+                epa=None,
+                dq=False,
+            ),
+        ],
+    }
+
+
+class TestArchive(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def get_archive(self, table, items, drift=None):
+        orm_type = TABLES[table][0]
+        arrow_table = to_arrow(orm_type, items)
+        if drift is not None:
+            arrow_table = drift(arrow_table)
+        path = os.path.join(self.dir.name, table + ".arrow")
+        with pa.OSFile(path, "wb") as sink:
+            with pa.ipc.new_file(sink, arrow_table.schema) as writer:
+                writer.write_table(arrow_table)
+        return ArchiveTable(path, table)
+
+    def test_round_trip(self):
+        for table, items in get_items().items():
+            archive = self.get_archive(table, items)
+            rows = archive.query([], None, None, None, None)
+            expected = sorted(items, key=lambda x: x.pk())
+            self.assertEqual([x.pk() for x in rows], [x.pk() for x in expected])
+            # Values equal, and typed as the DB returns the column
+            columns = TABLES[table][0].__table__.columns
+            for row, item in zip(rows, expected):
+                for column, a, b in zip(columns, row.get_values(), item.get_values()):
+                    self.assertEqual(a, b, table + "." + column.name)
+                    if a is not None:
+                        self.assertIs(
+                            type(a), column.type.python_type, table + "." + column.name
+                        )
+
+    def test_booleans(self):
+        # 1.0 == True, so compared by identity
+        archive = self.get_archive("team_events", get_items()["team_events"])
+        rows = {x.team: x for x in archive.query([], None, None, None, None)}
+        self.assertIs(rows["254"].is_captain, True)
+        self.assertIs(rows["1678"].is_captain, False)
+        self.assertIs(rows["118"].is_captain, None)
+
+        archive = self.get_archive("matches", get_items()["matches"])
+        rows = {x.key: x for x in archive.query([], None, None, None, None)}
+        self.assertIs(rows["2019test_qm1"].red_rp_1, True)
+        self.assertIs(rows["2019test_qm1"].red_rp_2, False)
+        self.assertIs(rows["2019test_qm2"].blue_rp_2, None)
+
+    def test_schema_drift(self):
+        # Exports written before a model change keep their column layout
+        items = get_items()["team_years"]
+        items[0].country, items[0].state, items[0].district = "USA", "CA", None
+
+        def reorder(table):
+            return table.select(list(reversed(table.schema.names)))
+
+        archive = self.get_archive("team_years", items, reorder)
+        self.assertEqual(archive.missing, [])
+        row = archive.query([("team", "254")], None, None, None, None)[0]
+        self.assertEqual(row.get_values(), items[0].get_values())
+
+        def drop(table):
+            return table.drop(["country"])
+
+        archive = self.get_archive("team_years", items, drop)
+        self.assertEqual(archive.missing, ["country"])
+        row = archive.query([("team", "254")], None, None, None, None)[0]
+        self.assertIsNone(row.country)
+        self.assertEqual((row.state, row.district), ("CA", None))
+        self.assertIs(row.offseason, items[0].offseason)
+        self.assertEqual(row.epa, 42.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
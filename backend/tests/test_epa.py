@@ -0,0 +1,163 @@
+import copy
+import math
+import random
+import unittest
+
+from src.data.avg import process_year as process_year_avg
+from src.data.epa.calc import process_year
+from src.data.wins import process_year as process_year_wins
+from src.db.models import Event, Match, TeamEvent, TeamMatch, TeamYear, Year
+from src.types.enums import CompLevel, EventStatus, EventType, MatchStatus, MatchWinner
+
+# Rounded outputs (ex: epa_win_prob to 1e-4) may flip on float noise
+TOLERANCE = 1e-3
+
+
+def get_objs(year, num_events=4, num_teams=60, num_qual=30, seed=0):
+    # Synthetic season, alliance scores follow hidden team strengths
+    rand = random.Random(seed)
+    teams = [str(i) for i in range(1, num_teams + 1)]
+    strength = {team: rand.random() for team in teams}
+    size = 2 if year <= 2004 else 3
+
+    team_years = {
+        team: TeamYear(year=year, team=team, offseason=False, name=team)
+        for team in teams
+    }
+    events, team_events, matches, team_matches = {}, {}, {}, {}
+    for i in range(num_events):
+        key = str(year) + "ev" + str(i)
+        week = 1 + i
+        time = 1000000 + i * 10000
+        events[key] = Event(
+            key=key,
+            year=year,
+            name=key,
+            time=time,
+            start_date="2024-01-01",
+            end_date="2024-01-03",
+            type=EventType.REGIONAL,
+            status=EventStatus.COMPLETED,
+            week=week,
+            offseason=False,
+        )
+        event_teams = rand.sample(teams, 24)
+        for team in event_teams:
+            team_events[team + "_" + key] = TeamEvent(
+                team=team,
+                year=year,
+                event=key,
+                time=time,
+                offseason=False,
+                team_name=team,
+                event_name=key,
+                type=EventType.REGIONAL,
+                week=week,
+                status=EventStatus.COMPLETED,
+                first_event=False,
+            )
+
+        for j in range(num_qual + 3):
+            elim = j >= num_qual
+            chosen = rand.sample(event_teams, 2 * size)
+            alliances = {"red": chosen[:size], "blue": chosen[size:]}
+            match_key = key + (
+                "_f1m" + str(j - num_qual + 1) if elim else "_qm" + str(j)
+            )
+            data = dict(
+                key=match_key,
+                year=year,
+                event=key,
+                offseason=False,
+                week=week,
+                elim=elim,
+                comp_level=CompLevel.FINAL if elim else CompLevel.QUAL,
+                set_number=1,
+                match_number=j + 1,
+                time=time + j * 10,
+                predicted_time=time + j * 10,
+                status=MatchStatus.COMPLETED,
+                red_dq="",
+                red_surrogate="",
+                blue_dq="",
+                blue_surrogate="",
+            )
+            for alliance, alliance_teams in alliances.items():
+                for k, team in enumerate(alliance_teams):
+                    data[alliance + "_" + str(k + 1)] = team
+                total = sum(strength[team] for team in alliance_teams)
+                no_foul = max(0, int(rand.gauss(30 * total + 10, 8)))
+                data[alliance + "_no_foul"] = no_foul
+                data[alliance + "_score"] = no_foul + rand.randint(0, 5)
+                data[alliance + "_foul"] = data[alliance + "_score"] - no_foul
+                data[alliance + "_auto"] = no_foul // 4
+                data[alliance + "_teleop"] = no_foul // 2
+                data[alliance + "_endgame"] = no_foul - no_foul // 4 - no_foul // 2
+                data[alliance + "_rp_1"] = rand.random() < total / 3
+                data[alliance + "_rp_2"] = rand.random() < total / 3
+                data[alliance + "_tiebreaker"] = rand.randint(0, 20)
+                for k in range(1, 19):
+                    data[alliance + "_comp_" + str(k)] = round(rand.random() * total, 1)
+            red, blue = data["red_score"], data["blue_score"]
+            data["winner"] = (
+                MatchWinner.RED
+                if red > blue
+                else MatchWinner.BLUE
+                if blue > red
+                else MatchWinner.TIE
+            )
+            matches[match_key] = Match(**data)
+
+            for alliance, alliance_teams in alliances.items():
+                for team in alliance_teams:
+                    team_matches[team + "_" + match_key] = TeamMatch(
+                        team=team,
+                        year=year,
+                        event=key,
+                        match=match_key,
+                        alliance=alliance,
+                        time=data["time"],
+                        offseason=False,
+                        week=week,
+                        elim=elim,
+                        dq=False,
+                        surrogate=False,
+                        status=MatchStatus.COMPLETED,
+                    )
+
+    year_obj = process_year_avg(Year(year=year), list(matches.values()))
+    objs = (year_obj, team_years, events, team_events, matches, team_matches, {})
+    return process_year_wins(objs)
+
+
+class TestEPA(unittest.TestCase):
+    def assert_same(self, a, b, name):
+        # Every column, floats within TOLERANCE
+        for field, x, y in zip(a.field_names, a.get_values(), b.get_values()):
+            if isinstance(x, float) and isinstance(y, float):
+                if not math.isclose(x, y, rel_tol=TOLERANCE, abs_tol=TOLERANCE):
+                    self.fail(name + "." + field + ": " + str(x) + " != " + str(y))
+            else:
+                self.assertEqual(x, y, name + "." + field)
+
+    def test_vectorized(self):
+        # VectorizedEPA replaces EPA in the pipeline, outputs must match
+        for year in [2004, 2019, 2023]:
+            objs = get_objs(year, seed=year)
+            vectorized = process_year(copy.deepcopy(objs), {}, vectorized=True)
+            reference = process_year(copy.deepcopy(objs), {}, vectorized=False)
+
+            self.assert_same(vectorized[0], reference[0], str(year))
+            for i in [1, 3, 4, 5]:
+                self.assertEqual(list(vectorized[i]), list(reference[i]))
+                for key, obj in vectorized[i].items():
+                    name = type(obj).__name__ + " " + key
+                    self.assert_same(obj, reference[i][key], name)
+
+            # Not vacuous, EPA was computed
+            team_year = next(iter(vectorized[1].values()))
+            self.assertIsNotNone(team_year.epa)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import math
+import unittest
+
+import numpy as np
+from scipy import special, stats
+
+from src.models.epa import kernels
+
+INF = math.inf
+
+T_X = [-INF, -1e3, -50.0, -5.0, -1.0, -0.1, 0.0, 0.1, 1.0, 5.0, 50.0, 1e3, INF]
+T_DF = [1.0, 1.5, 2.0, 3.0, 5.0, 10.0, 30.0, 50.0]
+
+# Includes 0 (step 0.05) and the MAX_SKEW clip at both ends
+SKEWS = np.linspace(-0.95, 0.95, 39)
+
+EXPONNORM_X = [-INF, -40.0, -5.0, -1.0, 0.0, 0.5, 1.0, 3.0, 10.0, 100.0, INF]
+EXPONNORM_K = [0.05, 0.3, 1.0, 5.0]
+PROBS = [1e-6, 1e-3, 0.05, 0.3, 0.5, 0.7, 0.95, 1 - 1e-3, 1 - 1e-6]
+
+
+class TestKernels(unittest.TestCase):
+    def assertClose(self, actual, expected, atol):
+        np.testing.assert_allclose(actual, expected, rtol=0, atol=atol)
+
+    def test_betainc(self):
+        for a in [0.5, 1.0, 2.5, 10.0]:
+            for b in [0.5, 1.0, 2.5, 10.0]:
+                for x in [0.0, 1e-3, 0.3, 0.5, 0.9, 1.0]:
+                    expected = special.betainc(a, b, x)
+                    self.assertClose(kernels.betainc(a, b, x), expected, 1e-12)
+
+        x = np.array([0.0, 0.2, 0.8, 1.0, math.nan])
+        expected = special.betainc(2.5, 0.5, x)
+        self.assertClose(kernels.betainc(2.5, 0.5, x), expected, 1e-12)
+
+    def test_t_cdf(self):
+        for df in T_DF:
+            expected = stats.t.cdf(T_X, df)
+            actual = [kernels.t_cdf(x, df) for x in T_X]
+            self.assertClose(actual, expected, 1e-11)
+            self.assertClose(kernels.t_cdf(np.array(T_X), df), expected, 1e-11)
+
+        # Elementwise df, as in t_prob_gt_0
+        x, df = np.meshgrid(T_X, T_DF)
+        expected = stats.t.cdf(x, df)
+        self.assertClose(kernels.t_cdf(x, df), expected, 1e-11)
+
+    def test_norm(self):
+        x = np.array([-INF, -40.0, -5.0, -1.0, 0.0, 1.0, 5.0, 40.0, INF])
+        self.assertClose(kernels.norm_cdf(x), stats.norm.cdf(x), 1e-15)
+        self.assertClose(kernels.norm_pdf(x), stats.norm.pdf(x), 1e-15)
+        # Absolute error in log space is relative error in the probability
+        for z in [-1e3, -100.0, -40.0, -30.0, -29.0, -5.0, 0.0, 5.0]:
+            expected = stats.norm.logcdf(z)
+            self.assertClose(kernels.norm_logcdf(z), expected, 1e-11)
+
+    def test_skew_normal_ppf(self):
+        for a in [-5.0, -1.0, 0.0, 1.0, 5.0]:
+            for p in PROBS:
+                expected = stats.skewnorm.ppf(p, a)
+                self.assertClose(kernels.skew_normal_ppf(p, a), expected, 1e-10)
+            self.assertEqual(kernels.skew_normal_ppf(0.0, a), -INF)
+            self.assertEqual(kernels.skew_normal_ppf(1.0, a), INF)
+
+    def test_skew_normal_interval(self):
+        for conf in [0.5, 0.95]:
+            expected = []
+            for skew in SKEWS:
+                a, xi, omega = kernels.get_skew_normal_params(skew)
+                interval = stats.skewnorm(a, loc=xi, scale=omega).interval(conf)
+                self.assertClose(
+                    kernels.skew_normal_interval(skew, conf), interval, 1e-12
+                )
+                expected.append(interval)
+
+            lower, upper = kernels.skew_normal_interval(SKEWS, conf)
+            self.assertClose(lower, [x[0] for x in expected], 1e-12)
+            self.assertClose(upper, [x[1] for x in expected], 1e-12)
+
+        # No skew is the standard normal
+        self.assertEqual(kernels.get_skew_normal_params(0.0), (0.0, 0.0, 1.0))
+        self.assertClose(
+            kernels.skew_normal_interval(0.0), stats.norm.interval(0.95), 1e-12
+        )
+
+    def test_exponnorm(self):
+        for K in EXPONNORM_K:
+            for loc, scale in [(0.0, 1.0), (1.0, 2.0)]:
+                dist = stats.exponnorm(K, loc=loc, scale=scale)
+                expected = dist.cdf(EXPONNORM_X)
+                actual = [kernels.exponnorm_cdf(x, K, loc, scale) for x in EXPONNORM_X]
+                self.assertClose(actual, expected, 1e-14)
+                actual = kernels.exponnorm_cdf(np.array(EXPONNORM_X), K, loc, scale)
+                self.assertClose(actual, expected, 1e-14)
+
+                # scipy gives nan for the pdf at -inf, the density there is 0
+                expected = [0.0] + list(dist.pdf(EXPONNORM_X[1:-1])) + [0.0]
+                actual = [kernels.exponnorm_pdf(x, K, loc, scale) for x in EXPONNORM_X]
+                self.assertClose(actual, expected, 1e-13)
+                actual = kernels.exponnorm_pdf(np.array(EXPONNORM_X), K, loc, scale)
+                self.assertClose(actual, expected, 1e-13)
+
+                expected = dist.ppf(PROBS)
+                actual = [kernels.exponnorm_ppf(p, K, loc, scale) for p in PROBS]
+                self.assertClose(actual, expected, 1e-9 * scale)
+                actual = kernels.exponnorm_ppf(np.array(PROBS), K, loc, scale)
+                self.assertClose(actual, expected, 1e-9 * scale)
+
+                self.assertEqual(kernels.exponnorm_ppf(0.0, K, loc, scale), -INF)
+                self.assertEqual(kernels.exponnorm_ppf(1.0, K, loc, scale), INF)
+
+        self.assertTrue(math.isnan(kernels.exponnorm_cdf(math.nan, 1.0)))
+        self.assertTrue(math.isnan(kernels.exponnorm_pdf(math.nan, 1.0)))
@@ -0,0 +1,71 @@
+import gzip
+import json
+import unittest
+
+from src.data.noteworthy import encode_leaderboards
+from src.db.functions.noteworthy_matches import decode_leaderboards
+from src.db.models import Match
+from src.types.enums import CompLevel, MatchStatus, MatchWinner
+
+
+def get_match(number, red_score):
+    return Match(
+        key="2019test_qm" + str(number),
+        year=2019,
+        event="2019test",
+        comp_level=CompLevel.QUAL,
+        match_number=number,
+        status=MatchStatus.COMPLETED,
+        winner=MatchWinner.RED,
+        red_score=red_score,
+        red_rp_1=True,
+        red_dq="",
+        red_surrogate="",
+        blue_dq="",
+        blue_surrogate="",
+    )
+
+
+class TestNoteworthy(unittest.TestCase):
+    def setUp(self):
+        a, b = get_match(1, 120), get_match(2, 80)
+        self.leaderboards = {
+            (None, None, None, None, None): {"high_score": [a, b]},
+            ("USA", "CA", "regionals", False, 1): {"high_score": [b]},
+        }
+
+    def test_round_trip(self):
+        out = decode_leaderboards(encode_leaderboards(self.leaderboards))
+        self.assertEqual(list(out), list(self.leaderboards))
+        for bucket, categories in self.leaderboards.items():
+            for category, matches in categories.items():
+                decoded = out[bucket][category]
+                self.assertEqual(
+                    [x.get_values() for x in decoded], [x.get_values() for x in matches]
+                )
+        self.assertIs(
+            out[(None, None, None, None, None)]["high_score"][0].status,
+            MatchStatus.COMPLETED,
+        )
+
+    def test_model_drift(self):
+        # Files written by another Match model, decoded by field name
+        raw = json.loads(gzip.decompress(encode_leaderboards(self.leaderboards)))
+        for match in raw["matches"]:
+            del match["red_score"]
+            match["removed_field"] = 1
+        data = gzip.compress(json.dumps(raw).encode())
+        match = decode_leaderboards(data)[(None, None, None, None, None)]["high_score"][
+            0
+        ]
+        self.assertIsNone(match.red_score)
+        self.assertEqual(match.key, "2019test_qm1")
+        self.assertEqual(match.to_dict()["key"], match.key)
+
+        raw["version"] += 1
+        with self.assertRaises(Exception):
+            decode_leaderboards(gzip.compress(json.dumps(raw).encode()))
+
+
+if __name__ == "__main__":
+    unittest.main()
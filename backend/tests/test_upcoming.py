@@ -0,0 +1,71 @@
+import gzip
+import json
+import tempfile
+import unittest
+from unittest import mock
+
+from src.data.upcoming import encode_upcoming
+from src.db.functions import upcoming_matches
+from src.db.functions.upcoming_matches import UpcomingIndex, decode_upcoming
+from src.db.models import Match
+from src.types.enums import CompLevel, MatchStatus
+from src.utils import storage
+
+
+def get_entries():
+    def match(number, time):
+        return Match(
+            key="2024test_qm" + str(number),
+            year=2024,
+            event="2024test",
+            elim=False,
+            comp_level=CompLevel.QUAL,
+            match_number=number,
+            status=MatchStatus.UPCOMING,
+            predicted_time=time,
+            epa_red_score_pred=50.0 + number,
+            epa_blue_score_pred=40.0,
+        )
+
+    return [
+        (match(1, 1000), "Test", "USA", "CA", None),
+        (match(2, 2000), "Test", "USA", "CA", None),
+    ]
+
+
+class TestUpcoming(unittest.TestCase):
+    def test_round_trip(self):
+        entries = get_entries()
+        out = decode_upcoming(encode_upcoming(entries))
+        self.assertEqual([x[1:] for x in out], [x[1:] for x in entries])
+        self.assertEqual(
+            [x[0].get_values() for x in out], [x[0].get_values() for x in entries]
+        )
+
+        index = UpcomingIndex(out)
+        matches = index.query(None, "CA", "regionals", False, 0, 3000, 10, "max_epa")
+        self.assertEqual([x[0].key for x in matches], ["2024test_qm2", "2024test_qm1"])
+
+    def test_model_drift(self):
+        # Files written by another Match model, decoded by field name
+        raw = json.loads(gzip.decompress(encode_upcoming(get_entries())))
+        for entry in raw["entries"]:
+            del entry[0]["epa_blue_score_pred"]
+            entry[0]["removed_field"] = 1
+        out = decode_upcoming(gzip.compress(json.dumps(raw).encode()))
+        self.assertIsNone(out[0][0].epa_blue_score_pred)
+        self.assertEqual(out[0][0].predicted_time, 1000)
+
+    def test_unreadable(self):
+        # Unreadable files fall back to the DB query
+        with tempfile.TemporaryDirectory() as path:
+            with mock.patch.object(storage, "EXPORT_PATH", path):
+                name = upcoming_matches.get_upcoming_name()
+                storage.write_bytes(name, encode_upcoming(get_entries()), "")
+                self.assertIsNotNone(upcoming_matches.read_upcoming_index())
+                storage.write_bytes(name, b"garbage", "")
+                self.assertIsNone(upcoming_matches.read_upcoming_index())
+
+
+if __name__ == "__main__":
+    unittest.main()